@@ -0,0 +1,100 @@
+"""Add escrows
+
+Revision ID: 8d2f1c4b7a93
+Revises: c32b36a87539
+Create Date: 2025-10-18 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d2f1c4b7a93"
+down_revision = "c32b36a87539"
+branch_labels = None
+depends_on = None
+
+
+# Must match services.cvat.ESCROW_STATUS_PRIORITY at the time of the migration
+escrow_status_priority = [
+    "canceled",
+    "annotation",
+    "validation",
+    "completed",
+    "creation",
+    "recorded",
+    "deleted",
+]
+
+
+def create_escrows_table() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
+    op.create_table(
+        "escrows",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v4()"), nullable=False),
+        sa.Column("escrow_address", sa.String(length=42), nullable=False),
+        sa.Column("chain_id", sa.Integer(), nullable=False),
+        sa.Column("job_type", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("total_projects", sa.Integer(), nullable=False),
+        sa.Column("created_projects", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("escrow_address", "chain_id", name="uix_escrows_escrow_chain"),
+    )
+    op.create_index(op.f("ix_escrows_id"), "escrows", ["id"], unique=False)
+    op.create_index(op.f("ix_escrows_escrow_address"), "escrows", ["escrow_address"], unique=False)
+    op.create_index(op.f("ix_escrows_status"), "escrows", ["status"], unique=False)
+    op.create_index(op.f("ix_escrows_created_at"), "escrows", ["created_at"], unique=False)
+    op.create_index(op.f("ix_escrows_updated_at"), "escrows", ["updated_at"], unique=False)
+
+
+def fill_escrows() -> None:
+    status_ranks = " ".join(
+        f"WHEN '{status}' THEN {rank}" for rank, status in enumerate(escrow_status_priority)
+    )
+    rank_statuses = " ".join(
+        f"WHEN {rank} THEN '{status}'" for rank, status in enumerate(escrow_status_priority)
+    )
+    op.execute(
+        f"""
+        INSERT INTO escrows (
+            escrow_address,
+            chain_id,
+            job_type,
+            status,
+            total_projects,
+            created_projects,
+            created_at,
+            updated_at
+        )
+        SELECT
+            escrow_address,
+            chain_id,
+            min(job_type),
+            CASE min(CASE status {status_ranks} END) {rank_statuses} END,
+            count(*),
+            count(*) FILTER (WHERE status != 'creation'),
+            min(created_at),
+            max(updated_at)
+        FROM projects
+        GROUP BY escrow_address, chain_id
+        """
+    )
+
+
+def upgrade() -> None:
+    create_escrows_table()
+    fill_escrows()
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_escrows_updated_at"), table_name="escrows")
+    op.drop_index(op.f("ix_escrows_created_at"), table_name="escrows")
+    op.drop_index(op.f("ix_escrows_status"), table_name="escrows")
+    op.drop_index(op.f("ix_escrows_escrow_address"), table_name="escrows")
+    op.drop_index(op.f("ix_escrows_id"), table_name="escrows")
+    op.drop_table("escrows")
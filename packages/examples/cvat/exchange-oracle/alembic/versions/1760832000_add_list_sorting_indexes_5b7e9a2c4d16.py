@@ -0,0 +1,74 @@
+"""Add list sorting indexes
+
+Revision ID: 5b7e9a2c4d16
+Revises: 8d2f1c4b7a93
+Create Date: 2025-10-19 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b7e9a2c4d16"
+down_revision = "8d2f1c4b7a93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The sorting indexes below start with these columns
+    op.drop_index("ix_escrows_created_at", table_name="escrows")
+    op.drop_index("ix_escrows_updated_at", table_name="escrows")
+
+    op.create_index("ix_escrows_created_at_id", "escrows", ["created_at", "id"], unique=False)
+    op.create_index(
+        "ix_escrows_updated_at_created_at_id",
+        "escrows",
+        ["updated_at", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_escrows_chain_id_created_at_id",
+        "escrows",
+        ["chain_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_escrows_job_type_created_at_id",
+        "escrows",
+        ["job_type", "created_at", "id"],
+        unique=False,
+    )
+
+    op.create_index(
+        "ix_assignments_user_created_at_id",
+        "assignments",
+        ["user_wallet_address", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_assignments_user_expires_at_created_at_id",
+        "assignments",
+        ["user_wallet_address", "expires_at", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_assignments_user_status_created_at_id",
+        "assignments",
+        ["user_wallet_address", "status", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assignments_user_status_created_at_id", table_name="assignments")
+    op.drop_index("ix_assignments_user_expires_at_created_at_id", table_name="assignments")
+    op.drop_index("ix_assignments_user_created_at_id", table_name="assignments")
+
+    op.drop_index("ix_escrows_job_type_created_at_id", table_name="escrows")
+    op.drop_index("ix_escrows_chain_id_created_at_id", table_name="escrows")
+    op.drop_index("ix_escrows_updated_at_created_at_id", table_name="escrows")
+    op.drop_index("ix_escrows_created_at_id", table_name="escrows")
+
+    op.create_index("ix_escrows_updated_at", "escrows", ["updated_at"], unique=False)
+    op.create_index("ix_escrows_created_at", "escrows", ["created_at"], unique=False)
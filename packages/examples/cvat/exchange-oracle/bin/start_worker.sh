@@ -0,0 +1,3 @@
+export ENVIRONMENT=production
+
+python run_worker.py
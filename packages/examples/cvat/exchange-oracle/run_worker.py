@@ -0,0 +1,7 @@
+from src.core.config import Config
+from src.crons import run_cron_worker
+
+if __name__ == "__main__":
+    Config.validate()
+
+    run_cron_worker()
@@ -1,12 +1,14 @@
 import json
+from collections.abc import Iterable
 from functools import partial
 
 from human_protocol_sdk.constants import ChainId, Status
 from human_protocol_sdk.encryption import Encryption, EncryptionUtils
 from human_protocol_sdk.escrow import EscrowData, EscrowUtils
-from human_protocol_sdk.storage import StorageUtils
+from human_protocol_sdk.storage import StorageFileNotFoundError, StorageUtils
 
 from src.core.config import Config
+from src.core.manifest import TaskManifest, parse_manifest
 from src.core.types import OracleWebhookTypes
 from src.services.cache import Cache
 
@@ -68,6 +70,92 @@ def get_escrow_manifest(chain_id: int, escrow_address: str) -> dict:
     )
 
 
+def get_escrow_manifests(
+    escrows: Iterable[tuple[int, str]], *, skip_missing: bool = False
+) -> dict[tuple[int, str], dict]:
+    """
+    Returns the manifests for the (chain_id, escrow_address) pairs.
+
+    If skip_missing is True, the escrows with missing manifest files
+    are not included in the result.
+    """
+
+    def _download_manifest(escrow_address: str, chain_id: int) -> dict | None:
+        try:
+            return download_manifest(chain_id, escrow_address)
+        except StorageFileNotFoundError:
+            if not skip_missing:
+                raise
+
+            return None
+
+    cache = Cache()
+    manifests = cache.get_or_set_manifests(
+        [(escrow_address, chain_id) for chain_id, escrow_address in set(escrows)],
+        set_callback=_download_manifest,
+    )
+    return {
+        (chain_id, escrow_address): manifest
+        for (escrow_address, chain_id), manifest in manifests.items()
+        if manifest is not None
+    }
+
+
+def get_escrow_task_manifest(chain_id: int, escrow_address: str) -> TaskManifest:
+    """
+    Returns the parsed escrow manifest.
+    The parsed manifests are additionally cached in the process memory.
+    """
+    cache = Cache()
+    manifest = cache.get_parsed_manifest(escrow_address, chain_id)
+    if manifest is None:
+        manifest = parse_manifest(get_escrow_manifest(chain_id, escrow_address))
+        cache.set_parsed_manifest(escrow_address, chain_id, manifest)
+
+    return manifest
+
+
+def get_escrow_task_manifests(
+    escrows: Iterable[tuple[int, str]], *, skip_missing: bool = False
+) -> dict[tuple[int, str], TaskManifest]:
+    """
+    Returns the parsed manifests for the (chain_id, escrow_address) pairs,
+    as get_escrow_task_manifest() does.
+
+    If skip_missing is True, the escrows with missing manifest files
+    are not included in the result.
+    """
+    cache = Cache()
+
+    manifests = {}
+    missing_escrows = []
+    for chain_id, escrow_address in set(escrows):
+        manifest = cache.get_parsed_manifest(escrow_address, chain_id)
+        if manifest is None:
+            missing_escrows.append((chain_id, escrow_address))
+        else:
+            manifests[(chain_id, escrow_address)] = manifest
+
+    if missing_escrows:
+        for (chain_id, escrow_address), raw_manifest in get_escrow_manifests(
+            missing_escrows, skip_missing=skip_missing
+        ).items():
+            manifest = parse_manifest(raw_manifest)
+            cache.set_parsed_manifest(escrow_address, chain_id, manifest)
+            manifests[(chain_id, escrow_address)] = manifest
+
+    return manifests
+
+
+def invalidate_escrow_manifest(chain_id: int, escrow_address: str) -> None:
+    """
+    Removes the parsed escrow manifest from the memory of the current process.
+    The other processes keep using their copies until they expire,
+    see FeaturesConfig.parsed_manifest_cache_ttl.
+    """
+    Cache().remove_parsed_manifest(escrow_address, chain_id)
+
+
 def get_available_webhook_types(
     chain_id: int, escrow_address: str
 ) -> dict[str, OracleWebhookTypes]:
@@ -140,6 +140,18 @@ class CronConfig:
     track_completed_escrows_chunk_size = int(getenv("TRACK_COMPLETED_ESCROWS_CHUNK_SIZE", 100))
     track_escrow_validations_int = int(getenv("TRACK_ESCROW_VALIDATIONS_INT", 60))
     track_escrow_validations_chunk_size = int(getenv("TRACK_ESCROW_VALIDATIONS_CHUNK_SIZE", 1))
+    track_escrow_validations_prefetch_annotations = to_bool(
+        getenv("TRACK_ESCROW_VALIDATIONS_PREFETCH_ANNOTATIONS", "yes")
+    )
+    """
+    Export the annotations of the jobs changed in each validation iteration in advance,
+    so that only the jobs changed in the last iteration are exported with the escrow results
+    """
+
+    prefetch_job_annotations_int = int(getenv("PREFETCH_JOB_ANNOTATIONS_INT", 60))
+    prefetch_job_annotations_max_jobs = int(getenv("PREFETCH_JOB_ANNOTATIONS_MAX_JOBS", 100))
+    "Maximum number of job annotations prefetched from CVAT per cron job run"
+
     track_completed_escrows_max_downloading_retries = int(
         getenv("TRACK_COMPLETED_ESCROWS_MAX_DOWNLOADING_RETRIES", 10)
     )
@@ -148,7 +160,20 @@ class CronConfig:
     track_completed_escrows_jobs_downloading_batch_size = int(
         getenv("TRACK_COMPLETED_ESCROWS_JOBS_DOWNLOADING_BATCH_SIZE", 500)
     )
-    "Maximum number of parallel downloading requests during results downloading"
+    "Maximum number of pending export requests in CVAT during results downloading"
+
+    track_completed_escrows_max_concurrent_downloads = int(
+        getenv("TRACK_COMPLETED_ESCROWS_MAX_CONCURRENT_DOWNLOADS", 8)
+    )
+    "Maximum number of job annotation files downloaded in parallel during results downloading"
+
+    track_completed_escrows_max_memory_annotations_size = int(
+        getenv("TRACK_COMPLETED_ESCROWS_MAX_MEMORY_ANNOTATIONS_SIZE", 512 * 1024 * 1024)
+    )
+    """
+    Maximum total size of downloaded job annotation files kept in memory, in bytes.
+    The other files are stored in temporary files on disk.
+    """
 
     process_rejected_projects_chunk_size = int(getenv("REJECTED_PROJECTS_CHUNK_SIZE", 20))
     process_accepted_projects_chunk_size = int(getenv("ACCEPTED_PROJECTS_CHUNK_SIZE", 20))
@@ -156,6 +181,42 @@ class CronConfig:
     track_escrow_creation_chunk_size = int(getenv("TRACK_ESCROW_CREATION_CHUNK_SIZE", 20))
     track_escrow_creation_int = int(getenv("TRACK_ESCROW_CREATION_INT", 300))
 
+    log_cvat_api_client_stats_int = int(getenv("LOG_CVAT_API_CLIENT_STATS_INT", 300))
+    "The interval for logging the CVAT API connection reuse counters, in seconds"
+
+    run_in_api_server = to_bool(getenv("CRON_RUN_IN_API_SERVER", "yes"))
+    """
+    Run the cron jobs in the API server processes.
+    Can be disabled, if the cron jobs are run by a separate worker (run_worker.py).
+    """
+
+    thread_pool_size = int(getenv("CRON_THREAD_POOL_SIZE", 10))
+    "Max number of cron jobs running in parallel in threads"
+
+    process_pool_jobs = [
+        name.strip() for name in getenv("CRON_PROCESS_POOL_JOBS", "").split(",") if name.strip()
+    ]
+    """
+    Comma-separated names of the cron jobs to be run in the process pool,
+    e.g. "track_escrow_validations,process_incoming_job_launcher_webhooks".
+    The other cron jobs are run in threads.
+    """
+
+    process_pool_size = int(getenv("CRON_PROCESS_POOL_SIZE", 2))
+    "Max number of cron jobs running in parallel in the process pool"
+
+    webhook_notifications_enabled = to_bool(getenv("CRON_WEBHOOK_NOTIFICATIONS_ENABLED", "yes"))
+    """
+    Run the webhook processing cron jobs as soon as new webhooks are created,
+    using database notifications. The job intervals are used as a fallback.
+    """
+
+    leader_lock_check_interval = int(getenv("CRON_LEADER_LOCK_CHECK_INTERVAL", 10))
+    """
+    Interval for the cron leader lock checks, seconds. Only the process holding the lock
+    runs the cron jobs, the other processes try to get the lock with this interval.
+    """
+
 
 class CvatConfig:
     host_url = getenv("CVAT_URL", "http://localhost:8080")
@@ -167,6 +228,16 @@ class CvatConfig:
     max_jobs_per_task = int(getenv("CVAT_MAX_JOBS_PER_TASK", 1000))
     task_creation_check_interval = int(getenv("CVAT_TASK_CREATION_CHECK_INTERVAL", 5))
 
+    api_pool_size = int(getenv("CVAT_API_POOL_SIZE", 10))
+    "Max idle connections to the CVAT server kept open for reuse by the process"
+
+    max_concurrent_task_setups = int(getenv("CVAT_MAX_CONCURRENT_TASK_SETUPS", 1))
+    """
+    Max parallel CVAT task setups during escrow task creation. With values > 1, data uploading
+    is started for all the tasks at once, then validation is configured in the tasks
+    as soon as they are ready. 1 means tasks are created one by one.
+    """
+
     export_timeout = int(getenv("CVAT_EXPORT_TIMEOUT", 5 * 60))
     "Timeout, in seconds, for annotations or dataset export waiting"
 
@@ -232,9 +303,54 @@ class FeaturesConfig:
     manifest_cache_ttl = int(getenv("MANIFEST_CACHE_TTL", str(2 * 24 * 60 * 60)))
     "TTL for cached manifests"
 
+    manifest_cache_stale_ttl = int(getenv("MANIFEST_CACHE_STALE_TTL", str(60 * 60)))
+    "Time after the TTL when a cached manifest can still be used while it's being refreshed"
+
+    max_manifest_download_connections = int(getenv("MAX_MANIFEST_DOWNLOAD_CONNECTIONS", 8))
+    "Max parallel manifest downloads for the manifests missing in the cache (job listing, ...)"
+
+    parsed_manifest_cache_size = int(getenv("PARSED_MANIFEST_CACHE_SIZE", 1000))
+    """
+    Max number of parsed manifests kept in the process memory in front of the manifest cache.
+    0 disables the in-memory cache.
+    """
+
+    parsed_manifest_cache_ttl = int(getenv("PARSED_MANIFEST_CACHE_TTL", str(5 * 60)))
+    """
+    TTL for the parsed manifests kept in the process memory, seconds.
+    Limits the time the other processes can use a manifest after it's invalidated.
+    """
+
     max_data_storage_connections = int(getenv("MAX_DATA_STORAGE_CONNECTIONS", 5))
     "Max parallel data storage connections in 1 client (job creation, ...)"
 
+    max_roi_processing_workers = int(getenv("MAX_ROI_PROCESSING_WORKERS", 0))
+    """
+    Max parallel processes for RoI image extraction and encoding during job creation.
+    0 means RoIs are processed in the main process.
+    """
+
+    max_roi_download_buffer_size = int(getenv("MAX_ROI_DOWNLOAD_BUFFER_SIZE", 512 * 1024 * 1024))
+    """
+    Max total size of the downloaded source images waiting for RoI extraction, in bytes.
+    With RoI processing in the main process, the size of the decoded images is counted.
+    """
+
+    max_annotation_processing_workers = int(getenv("MAX_ANNOTATION_PROCESSING_WORKERS", 0))
+    """
+    Max parallel processes for job annotation conversion during escrow results export.
+    0 or 1 means annotations are converted in the main process.
+    """
+
+    source_data_cache_dir = getenv("SOURCE_DATA_CACHE_DIR", "")
+    """
+    A directory for caching of the downloaded source images between job creation attempts.
+    The cache can be shared by several processes. Empty value disables the cache.
+    """
+
+    source_data_cache_max_size = int(getenv("SOURCE_DATA_CACHE_MAX_SIZE", 10 * 1024 * 1024 * 1024))
+    "Max total size of the cached source images, in bytes. The least recently used are removed"
+
 
 class CoreConfig:
     default_assignment_time = int(getenv("DEFAULT_ASSIGNMENT_TIME", 1800))
@@ -322,6 +438,8 @@ class Config:
     workers_amount = int(getenv("WORKERS_AMOUNT", 1))
     webhook_max_retries = int(getenv("WEBHOOK_MAX_RETRIES", 5))
     webhook_delay_if_failed = int(getenv("WEBHOOK_DELAY_IF_FAILED", 60))
+    webhook_delivery_concurrency = int(getenv("WEBHOOK_DELIVERY_CONCURRENCY", 10))
+    "The maximum number of outgoing webhooks sent at the same time"
     loglevel = parse_log_level(getenv("LOGLEVEL", "info"))
 
     polygon_mainnet = PolygonMainnetConfig
@@ -1,6 +1,9 @@
 from src.core.config import Config
 from src.core.types import Networks
 
+JOB_ANNOTATIONS_CACHE_DIR = "job_annotations"
+"The directory for the exported job annotations in the escrow data directory"
+
 
 def compose_data_bucket_prefix(escrow_address: str, chain_id: Networks):
     return f"{escrow_address}@{chain_id}"
@@ -5,10 +5,18 @@ from tempfile import TemporaryDirectory
 
 import attrs
 import datumaro as dm
+import numpy as np
 from attrs import frozen
 from datumaro.util import dump_json, parse_json
 
 from src.core.config import Config
+from src.utils.coco import try_dump_coco_instances, try_parse_coco_instances
+from src.utils.record_table import (
+    RecordTable,
+    dump_mapping,
+    is_columns_data,
+    load_mapping,
+)
 
 DEFAULT_ASSIGNMENT_SIZE_MULTIPLIER = Config.core_config.skeleton_assignment_size_mult
 
@@ -19,8 +27,11 @@ SkeletonBboxMapping = dict[int, int]
 class RoiInfo:
     original_image_key: int
     bbox_id: int
-    bbox_x: int
-    bbox_y: int
+
+    # bbox coordinates are relative to the RoI and can be fractional
+    bbox_x: float
+    bbox_y: float
+
     bbox_label: int
 
     # RoI is centered on the bbox center
@@ -37,6 +48,19 @@ class RoiInfo:
 
 RoiInfos = Sequence[RoiInfo]
 
+
+class RoiInfoTable(RecordTable[RoiInfo]):
+    "A columnar RoiInfo storage for big escrows"
+
+    record_type = RoiInfo
+    dtype = np.dtype(
+        [
+            (field.name, np.float64 if field.name in ("bbox_x", "bbox_y") else np.int64)
+            for field in attrs.fields(RoiInfo)
+        ]
+    )
+
+
 RoiFilenames = dict[int, str]
 
 PointLabelsMapping = dict[tuple[str, str], str]
@@ -47,12 +71,17 @@ class TaskMetaLayout:
     GT_FILENAME = "gt.json"
     BOXES_FILENAME = "boxes.json"
     POINT_LABELS_FILENAME = "point_labels.json"
-    SKELETON_BBOX_MAPPING_FILENAME = "skeleton_bbox_mapping.json"
-    ROI_INFO_FILENAME = "rois.json"
+    SKELETON_BBOX_MAPPING_FILENAME = "skeleton_bbox_mapping.npz"
+    ROI_INFO_FILENAME = "rois.npz"
 
-    ROI_FILENAMES_FILENAME = "roi_filenames.json"
+    ROI_FILENAMES_FILENAME = "roi_filenames.npz"
     # this is separated from the general roi info to make name mangling more "optional"
 
+    # The previous JSON versions of the files above, for the escrows created before
+    LEGACY_SKELETON_BBOX_MAPPING_FILENAME = "skeleton_bbox_mapping.json"
+    LEGACY_ROI_INFO_FILENAME = "rois.json"
+    LEGACY_ROI_FILENAMES_FILENAME = "roi_filenames.json"
+
 
 class TaskMetaSerializer:
     GT_DATASET_FORMAT = "coco_person_keypoints"
@@ -67,19 +96,25 @@ class TaskMetaSerializer:
             ).read_bytes()
 
     def serialize_bbox_annotations(self, bbox_dataset: dm.Dataset) -> bytes:
+        if (data := try_dump_coco_instances(bbox_dataset)) is not None:
+            return data
+
         with TemporaryDirectory() as temp_dir:
             bbox_dataset_dir = os.path.join(temp_dir, "bbox_dataset")
             bbox_dataset.export(bbox_dataset_dir, self.BBOX_DATASET_FORMAT)
             return (Path(bbox_dataset_dir) / "annotations" / "instances_default.json").read_bytes()
 
     def serialize_skeleton_bbox_mapping(self, skeleton_bbox_mapping: SkeletonBboxMapping) -> bytes:
-        return dump_json({str(k): str(v) for k, v in skeleton_bbox_mapping.items()})
+        return dump_mapping(skeleton_bbox_mapping, key_dtype="int64", value_dtype="int64")
 
     def serialize_roi_info(self, rois_info: RoiInfos) -> bytes:
-        return dump_json([roi_info.asdict() for roi_info in rois_info])
+        if not isinstance(rois_info, RoiInfoTable):
+            rois_info = RoiInfoTable.from_records(rois_info)
+
+        return rois_info.dump()
 
     def serialize_roi_filenames(self, roi_filenames: RoiFilenames) -> bytes:
-        return dump_json({str(k): v for k, v in roi_filenames.items()})
+        return dump_mapping(roi_filenames, key_dtype="int64", value_dtype="str")
 
     def serialize_point_labels(self, point_labels: PointLabelsMapping) -> bytes:
         return dump_json(
@@ -104,6 +139,9 @@ class TaskMetaSerializer:
             return dataset
 
     def parse_bbox_annotations(self, bbox_dataset_data: bytes) -> dm.Dataset:
+        if (dataset := try_parse_coco_instances(bbox_dataset_data)) is not None:
+            return dataset
+
         with TemporaryDirectory() as temp_dir:
             annotations_filename = os.path.join(temp_dir, "annotations.json")
             with open(annotations_filename, "wb") as f:
@@ -113,13 +151,23 @@ class TaskMetaSerializer:
             dataset.init_cache()
             return dataset
 
+    # The parse functions below also support the legacy JSON formats
     def parse_skeleton_bbox_mapping(self, skeleton_bbox_mapping_data: bytes) -> SkeletonBboxMapping:
+        if is_columns_data(skeleton_bbox_mapping_data):
+            return load_mapping(skeleton_bbox_mapping_data)
+
         return {int(k): int(v) for k, v in parse_json(skeleton_bbox_mapping_data).items()}
 
     def parse_roi_info(self, rois_info_data: bytes) -> RoiInfos:
+        if is_columns_data(rois_info_data):
+            return RoiInfoTable.load(rois_info_data)
+
         return [RoiInfo(**roi_info) for roi_info in parse_json(rois_info_data)]
 
     def parse_roi_filenames(self, roi_filenames_data: bytes) -> RoiFilenames:
+        if is_columns_data(roi_filenames_data):
+            return load_mapping(roi_filenames_data)
+
         return {int(k): v for k, v in parse_json(roi_filenames_data).items()}
 
     def parse_point_labels(self, point_labels_data: bytes) -> PointLabelsMapping:
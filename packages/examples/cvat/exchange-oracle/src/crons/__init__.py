@@ -1,8 +1,21 @@
+import logging
+import multiprocessing
+import signal
+from collections.abc import Callable
+from itertools import chain
+from threading import Event, Thread
+
+from apscheduler.executors.pool import ProcessPoolExecutor, ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import BaseScheduler
 from fastapi import FastAPI
 
 from src.core.config import Config
+from src.crons._leader_lock import LeaderLock
+from src.crons._webhook_notifications import CronJobWaker, WebhookNotificationListener
+from src.crons.cvat.api_client_stats import log_cvat_api_client_stats
 from src.crons.cvat.state_trackers import (
+    prefetch_job_annotations,
     track_assignments,
     track_completed_escrows,
     track_completed_projects,
@@ -22,74 +35,192 @@ from src.crons.webhooks.recording_oracle import (
 )
 from src.crons.webhooks.reputation_oracle import process_incoming_reputation_oracle_webhooks
 
+_LEADER_LOCK_NAME = "exchange-oracle-cron-jobs"
 
-def setup_cron_jobs(app: FastAPI) -> None:
-    @app.on_event("startup")
-    def cron_record():
-        scheduler = BackgroundScheduler()
-        scheduler.add_job(
+_PROCESS_POOL_EXECUTOR = "processpool"
+
+
+_WEBHOOK_CRON_JOBS: dict[str, list[Callable[[], bool | None]]] = {
+    "incoming:job_launcher": [process_incoming_job_launcher_webhooks],
+    "outgoing:job_launcher": [process_outgoing_job_launcher_webhooks],
+    "incoming:recording_oracle": [
+        process_incoming_recording_oracle_webhooks,
+        process_incoming_recording_oracle_webhook_job_completed,
+    ],
+    "outgoing:recording_oracle": [process_outgoing_recording_oracle_webhooks],
+    "incoming:reputation_oracle": [process_incoming_reputation_oracle_webhooks],
+}
+"The webhook processing cron jobs by the new webhook notification payload"
+
+
+def _get_cron_jobs() -> list[tuple[Callable[[], bool | None], int]]:
+    "Returns (cron job, interval in seconds) pairs"
+
+    return [
+        (
             process_incoming_job_launcher_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_job_launcher_webhooks_int,
-        )
-        scheduler.add_job(
+            Config.cron_config.process_job_launcher_webhooks_int,
+        ),
+        (
             process_outgoing_job_launcher_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_job_launcher_webhooks_int,
-        )
-        scheduler.add_job(
+            Config.cron_config.process_job_launcher_webhooks_int,
+        ),
+        (
             process_incoming_recording_oracle_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_recording_oracle_webhooks_int,
-        )
-        scheduler.add_job(
+            Config.cron_config.process_recording_oracle_webhooks_int,
+        ),
+        (
             process_incoming_recording_oracle_webhook_job_completed,
-            "interval",
-            seconds=Config.cron_config.process_recording_oracle_webhooks_int,
-        )
-        scheduler.add_job(
+            Config.cron_config.process_recording_oracle_webhooks_int,
+        ),
+        (
             process_outgoing_recording_oracle_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_recording_oracle_webhooks_int,
-        )
-        scheduler.add_job(
+            Config.cron_config.process_recording_oracle_webhooks_int,
+        ),
+        (
             process_incoming_reputation_oracle_webhooks,
-            "interval",
-            seconds=Config.cron_config.process_reputation_oracle_webhooks_int,
-        )
-        scheduler.add_job(
-            track_completed_projects,
-            "interval",
-            seconds=Config.cron_config.track_completed_projects_int,
-        )
-        scheduler.add_job(
-            track_completed_tasks,
-            "interval",
-            seconds=Config.cron_config.track_completed_tasks_int,
-        )
-        scheduler.add_job(
-            track_completed_escrows,
-            "interval",
-            seconds=Config.cron_config.track_completed_escrows_int,
-        )
-        scheduler.add_job(
-            track_escrow_validations,
-            "interval",
-            seconds=Config.cron_config.track_escrow_validations_int,
-        )
-        scheduler.add_job(
-            track_task_creation,
-            "interval",
-            seconds=Config.cron_config.track_creating_tasks_int,
-        )
-        scheduler.add_job(
-            track_escrow_creation,
-            "interval",
-            seconds=Config.cron_config.track_escrow_creation_int,
+            Config.cron_config.process_reputation_oracle_webhooks_int,
+        ),
+        (track_completed_projects, Config.cron_config.track_completed_projects_int),
+        (track_completed_tasks, Config.cron_config.track_completed_tasks_int),
+        (track_completed_escrows, Config.cron_config.track_completed_escrows_int),
+        (track_escrow_validations, Config.cron_config.track_escrow_validations_int),
+        (prefetch_job_annotations, Config.cron_config.prefetch_job_annotations_int),
+        (track_task_creation, Config.cron_config.track_creating_tasks_int),
+        (track_escrow_creation, Config.cron_config.track_escrow_creation_int),
+        (track_assignments, Config.cron_config.track_assignments_int),
+        (log_cvat_api_client_stats, Config.cron_config.log_cvat_api_client_stats_int),
+    ]
+
+
+def create_scheduler(scheduler_class: type[BaseScheduler] = BackgroundScheduler) -> BaseScheduler:
+    """
+    Creates a scheduler with all the cron jobs. The jobs listed in the process pool jobs
+    config are run in the process pool, the others - in the thread pool.
+    """
+
+    cron_jobs = _get_cron_jobs()
+
+    process_pool_jobs = set(Config.cron_config.process_pool_jobs)
+    unknown_jobs = process_pool_jobs.difference(cron_job.__name__ for cron_job, _ in cron_jobs)
+    if unknown_jobs:
+        raise ValueError(f"Unknown cron jobs in the process pool config: {sorted(unknown_jobs)}")
+
+    executors = {"default": ThreadPoolExecutor(Config.cron_config.thread_pool_size)}
+    if process_pool_jobs:
+        executors[_PROCESS_POOL_EXECUTOR] = ProcessPoolExecutor(
+            Config.cron_config.process_pool_size,
+            # Forking is unsafe in a multithreaded process
+            pool_kwargs={"mp_context": multiprocessing.get_context("spawn")},
         )
+
+    scheduler = scheduler_class(executors=executors)
+    for cron_job, interval in cron_jobs:
         scheduler.add_job(
-            track_assignments,
+            cron_job,
             "interval",
-            seconds=Config.cron_config.track_assignments_int,
+            id=cron_job.__name__,
+            seconds=interval,
+            executor=(
+                _PROCESS_POOL_EXECUTOR if cron_job.__name__ in process_pool_jobs else "default"
+            ),
         )
-        scheduler.start()
+
+    return scheduler
+
+
+def run_cron_jobs(scheduler: BaseScheduler, *, stop_event: Event) -> None:
+    """
+    Runs the scheduled cron jobs until the stop event is set.
+    The jobs are only run while the process holds the leader lock, so that they are not
+    run by several processes at once. The other processes wait for the lock.
+
+    If the lock is lost, the scheduler is only paused. The jobs that are already running
+    are not interrupted and can overlap with the same jobs started by the new leader.
+    This is expected to be rare, as the lock is lost with the database connection,
+    which the running jobs also need. Most of the jobs select the processed rows
+    with "FOR UPDATE SKIP LOCKED", so overlapping runs don't process the same rows.
+    """
+
+    logger = logging.getLogger("app")
+    leader_lock = LeaderLock(_LEADER_LOCK_NAME)
+
+    webhook_listener = None
+    if Config.cron_config.webhook_notifications_enabled:
+        job_waker = CronJobWaker(scheduler)
+
+        def _on_webhook_notification(payload: str | None) -> None:
+            if payload is None:
+                cron_jobs = chain.from_iterable(_WEBHOOK_CRON_JOBS.values())
+            else:
+                cron_jobs = _WEBHOOK_CRON_JOBS.get(payload, [])
+
+            for cron_job in cron_jobs:
+                job_waker.wake(cron_job.__name__)
+
+        webhook_listener = WebhookNotificationListener(_on_webhook_notification)
+
+    scheduler.start(paused=True)
+    try:
+        while True:
+            if leader_lock.is_acquired:
+                if not leader_lock.check():
+                    scheduler.pause()
+                    if webhook_listener:
+                        webhook_listener.stop()
+
+                    logger.warning("The cron leader lock is lost, cron jobs are paused")
+            else:
+                try:
+                    if leader_lock.try_acquire():
+                        scheduler.resume()
+                        if webhook_listener:
+                            webhook_listener.start()
+
+                        logger.info("The cron leader lock is acquired, cron jobs are started")
+                except Exception:  # noqa: BLE001
+                    logger.warning("Failed to get the cron leader lock", exc_info=True)
+
+            if stop_event.wait(Config.cron_config.leader_lock_check_interval):
+                break
+    finally:
+        if webhook_listener:
+            webhook_listener.stop()
+
+        scheduler.shutdown()
+        leader_lock.release()
+
+
+def run_cron_worker() -> None:
+    """
+    Runs the cron jobs in the current process, separately from the API server.
+    The worker is stopped by SIGINT or SIGTERM.
+    """
+
+    stop_event = Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop_event.set())
+
+    logging.getLogger("app").info("Cron worker is up and running!")
+    run_cron_jobs(create_scheduler(), stop_event=stop_event)
+
+
+def setup_cron_jobs(app: FastAPI) -> None:
+    if not Config.cron_config.run_in_api_server:
+        return
+
+    stop_event = Event()
+
+    @app.on_event("startup")
+    def cron_record():
+        Thread(
+            target=run_cron_jobs,
+            args=(create_scheduler(),),
+            kwargs={"stop_event": stop_event},
+            name="cron-scheduler",
+            daemon=True,
+        ).start()
+
+    @app.on_event("shutdown")
+    def cron_stop():
+        stop_event.set()
@@ -16,7 +16,7 @@ class CronSpec(NamedTuple):
     repr: str
 
 
-def _validate_cron_function_signature(fn: Callable[..., None]) -> CronSpec:
+def _validate_cron_function_signature(fn: Callable[..., bool | None]) -> CronSpec:
     cron_repr = repr(fn.__name__)
     parameters = dict(inspect.signature(fn).parameters)
 
@@ -37,7 +37,7 @@ def _validate_cron_function_signature(fn: Callable[..., None]) -> CronSpec:
     return CronSpec(manage_session=session_param is not None, repr=cron_repr)
 
 
-def cron_job(fn: Callable[..., None]) -> Callable[[], None]:
+def cron_job(fn: Callable[..., bool | None]) -> Callable[[], bool | None]:
     """
     Wrapper that supplies logger and optionally session to the cron job.
 
@@ -50,6 +50,8 @@ def cron_job(fn: Callable[..., None]) -> Callable[[], None]:
         >>> def handle_webhook(logger: logging.Logger, session: Session) -> None:
         >>>     ...
 
+    The cron job can return True to be run again right away, e.g. when there is more work.
+
     Returns:
         Cron job ready to be registered in scheduler.
     """
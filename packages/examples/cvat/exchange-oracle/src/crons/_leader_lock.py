@@ -0,0 +1,78 @@
+import zlib
+
+from sqlalchemy import Connection, func, select
+
+from src.db import engine
+
+
+class LeaderLock:
+    """
+    A lock shared by all the oracle processes, based on a PostgreSQL session-level
+    advisory lock. The lock is held while its database connection is alive.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._key = zlib.crc32(name.encode())
+        self._connection: Connection | None = None
+
+    @property
+    def is_acquired(self) -> bool:
+        return self._connection is not None
+
+    def try_acquire(self) -> bool:
+        "Tries to get the lock without waiting. Returns True if the lock is held"
+
+        if self._connection is not None:
+            return self.check()
+
+        connection = engine.connect()
+        try:
+            acquired = connection.execute(select(func.pg_try_advisory_lock(self._key))).scalar()
+            connection.commit()
+        except BaseException:
+            connection.close()
+            raise
+
+        if acquired:
+            self._connection = connection
+        else:
+            connection.close()
+
+        return bool(acquired)
+
+    def check(self) -> bool:
+        """
+        Checks that the lock is still held. The lock is released by the server
+        if the database connection is lost.
+        """
+
+        if self._connection is None:
+            return False
+
+        try:
+            self._connection.execute(select(1))
+            self._connection.commit()
+        except Exception:  # noqa: BLE001
+            self._close()
+            return False
+
+        return True
+
+    def release(self) -> None:
+        if self._connection is None:
+            return
+
+        try:
+            self._connection.execute(select(func.pg_advisory_unlock(self._key)))
+            self._connection.commit()
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        connection = self._connection
+        self._connection = None
+
+        # The connection can be broken, so it's not returned into the pool
+        connection.invalidate()
+        connection.close()
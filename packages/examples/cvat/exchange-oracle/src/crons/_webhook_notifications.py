@@ -0,0 +1,153 @@
+"""
+Running the webhook processing cron jobs as soon as new webhooks are created.
+
+The webhook queues send a database notification for each new webhook
+(see OracleWebhookQueue.create_webhook). The listener receives the notifications
+and wakes up the corresponding cron jobs, which then process the webhooks until
+the queue is empty. The regular job intervals remain as a fallback.
+"""
+
+import logging
+import select
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime
+from threading import Event, Lock, Thread
+
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+)
+from apscheduler.schedulers.base import BaseScheduler
+
+from src.db import engine
+from src.services.webhook import WEBHOOK_NOTIFICATION_CHANNEL
+
+
+class CronJobWaker:
+    """
+    Runs the scheduled cron jobs ahead of their schedule.
+
+    A job woken up while it's running is run again after it finishes.
+    A job returning True (meaning there can be more work) is also run again.
+    """
+
+    def __init__(self, scheduler: BaseScheduler) -> None:
+        self._scheduler = scheduler
+        self._lock = Lock()
+        self._pending_jobs: set[str] = set()
+
+        # The submission event can come after the job is finished,
+        # so the running jobs are counted instead of being marked
+        self._running_jobs: Counter[str] = Counter()
+
+        scheduler.add_listener(self._on_job_submitted, EVENT_JOB_SUBMITTED)
+        scheduler.add_listener(self._on_job_skipped, EVENT_JOB_MAX_INSTANCES)
+        scheduler.add_listener(self._on_job_finished, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
+
+    def wake(self, job_id: str) -> None:
+        with self._lock:
+            if self._running_jobs[job_id] > 0:
+                self._pending_jobs.add(job_id)
+                return
+
+        self._scheduler.modify_job(job_id, next_run_time=datetime.now(self._scheduler.timezone))
+
+    def _on_job_submitted(self, event: JobEvent) -> None:
+        with self._lock:
+            self._running_jobs[event.job_id] += 1
+
+    def _on_job_skipped(self, event: JobEvent) -> None:
+        # The job is still running
+        with self._lock:
+            self._pending_jobs.add(event.job_id)
+
+    def _on_job_finished(self, event: JobEvent) -> None:
+        with self._lock:
+            self._running_jobs[event.job_id] -= 1
+
+            run_again = event.job_id in self._pending_jobs or getattr(event, "retval", None) is True
+            self._pending_jobs.discard(event.job_id)
+
+        if run_again:
+            # The event can be dispatched by the scheduler thread while it's processing the jobs,
+            # in this case the next run time would be overwritten by the scheduler
+            Thread(target=self.wake, args=(event.job_id,), daemon=True).start()
+
+
+class WebhookNotificationListener:
+    """
+    Receives the new webhook notifications from the database in a background thread.
+
+    The callback is called with the notification payload, which is "<direction>:<webhook type>".
+    After each (re)connection, the callback is called with None, because the notifications
+    could be missed while the listener was disconnected.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[str | None], None],
+        *,
+        poll_interval: float = 5,
+        reconnect_delay: float = 10,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+
+        self._callback = callback
+        self._stop_event = Event()
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        assert not self._thread
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, name="webhook-notification-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if not self._thread:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except Exception:  # noqa: BLE001
+                logging.getLogger("app").warning(
+                    "Failed to listen for webhook notifications", exc_info=True
+                )
+                self._stop_event.wait(self.reconnect_delay)
+
+    def _listen(self) -> None:
+        connection = engine.raw_connection()
+        try:
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True
+
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {WEBHOOK_NOTIFICATION_CHANNEL}")
+
+            self._callback(None)
+
+            while not self._stop_event.is_set():
+                if not select.select([dbapi_connection], [], [], self.poll_interval)[0]:
+                    continue
+
+                dbapi_connection.poll()
+                payloads = {notification.payload for notification in dbapi_connection.notifies}
+                dbapi_connection.notifies.clear()
+
+                for payload in payloads:
+                    self._callback(payload)
+        finally:
+            # The connection is in the listening mode, so it's not returned into the pool
+            connection.invalidate()
+            connection.close()
@@ -0,0 +1,20 @@
+import logging
+
+from src.crons._cron_job import cron_job
+from src.cvat import client_pool
+
+
+@cron_job
+def log_cvat_api_client_stats(logger: logging.Logger) -> None:
+    """
+    Logs the CVAT API connection reuse counters of the current process.
+    The jobs run in the process pool use their own clients, which are not included.
+    """
+
+    stats = client_pool.get_pool().get_stats()
+    logger.info(
+        "CVAT API client stats: "
+        f"requests={stats.requests} "
+        f"connections={stats.connections} "
+        f"reused_connections={stats.reused_connections}"
+    )
@@ -14,7 +14,10 @@ from src.crons._cron_job import cron_job
 from src.db import SessionLocal
 from src.db import errors as db_errors
 from src.db.utils import ForUpdateParams
-from src.handlers.completed_escrows import handle_escrows_validations
+from src.handlers.completed_escrows import (
+    handle_escrows_validations,
+    handle_job_annotations_prefetching,
+)
 from src.utils.logging import format_sequence
 
 
@@ -131,6 +134,19 @@ def track_escrow_validations(logger: logging.Logger) -> None:
     handle_escrows_validations(logger)
 
 
+@cron_job
+def prefetch_job_annotations(logger: logging.Logger) -> bool:
+    """
+    Exports the job annotations of the escrows being validated in advance,
+    separately from the validation requests, which are not delayed by the exports.
+    """
+
+    if not CronConfig.track_escrow_validations_prefetch_annotations:
+        return False
+
+    return handle_job_annotations_prefetching(logger)
+
+
 @cron_job
 def track_task_creation(logger: logging.Logger, session: Session) -> None:
     """
@@ -2,14 +2,22 @@ import logging
 from collections.abc import Callable
 from contextlib import contextmanager
 
-import httpx
 from sqlalchemy.orm import Session
 
 from src.core.types import OracleWebhookTypes
 from src.db.utils import ForUpdateParams
 from src.models.webhook import Webhook
 from src.services import webhook as webhook_service
-from src.utils.webhooks import prepare_outgoing_webhook_body, prepare_signed_message
+from src.utils.webhook_delivery import deliver_webhooks
+
+
+def _log_webhook_attempt(logger: logging.Logger, webhook: Webhook) -> None:
+    logger.debug(
+        "Processing webhook "
+        f"{webhook.type}.{webhook.event_type}~{webhook.signature} "
+        f"in escrow_address={webhook.escrow_address} "
+        f"(attempt {webhook.attempts + 1})"
+    )
 
 
 @contextmanager
@@ -21,12 +29,7 @@ def handle_webhook(
     queue: webhook_service.OracleWebhookQueue,
     on_fail: Callable[[Session, Webhook, Exception], None] = lambda _s, _w, _e: None,
 ):
-    logger.debug(
-        "Processing webhook "
-        f"{webhook.type}.{webhook.event_type}~{webhook.signature} "
-        f"in escrow_address={webhook.escrow_address} "
-        f"(attempt {webhook.attempts + 1})"
-    )
+    _log_webhook_attempt(logger, webhook)
     savepoint = session.begin_nested()
     try:
         yield
@@ -46,25 +49,6 @@ def handle_webhook(
         logger.debug("Webhook handled successfully")
 
 
-def _send_webhook(url: str, webhook: Webhook, *, with_timestamp: bool = True) -> None:
-    body = prepare_outgoing_webhook_body(
-        webhook.escrow_address,
-        webhook.chain_id,
-        webhook.event_type,
-        webhook.event_data,
-        timestamp=webhook.created_at if with_timestamp else None,
-    )
-    _, signature = prepare_signed_message(
-        webhook.escrow_address,
-        webhook.chain_id,
-        body=body,
-    )
-    headers = {"human-signature": signature}
-    with httpx.Client() as client:
-        response = client.post(url, headers=headers, json=body)
-        response.raise_for_status()
-
-
 def process_outgoing_webhooks(
     logger: logging.Logger,
     session: Session,
@@ -73,7 +57,12 @@ def process_outgoing_webhooks(
     chunk_size: int,
     *,
     with_timestamp: bool = True,
-):
+) -> bool:
+    """
+    Sends a chunk of pending webhooks.
+    Returns True if there can be more pending webhooks.
+    """
+
     webhooks = webhook_service.outbox.get_pending_webhooks(
         session,
         webhook_type,
@@ -81,6 +70,23 @@ def process_outgoing_webhooks(
         for_update=ForUpdateParams(skip_locked=True),
     )
     for webhook in webhooks:
-        with handle_webhook(logger, session, webhook, queue=webhook_service.outbox):
-            webhook_url = url_getter(webhook.chain_id, webhook.escrow_address)
-            _send_webhook(webhook_url, webhook, with_timestamp=with_timestamp)
+        _log_webhook_attempt(logger, webhook)
+
+    results = deliver_webhooks(webhooks, url_getter, with_timestamp=with_timestamp)
+
+    for result in results:
+        if result.is_successful:
+            logger.debug(f"Webhook {result.webhook.id} handled successfully")
+        else:
+            logger.error(
+                f"Webhook {result.webhook.id} sending failed: {result.error}",
+                exc_info=result.error,
+            )
+
+    webhook_service.outbox.handle_webhook_results(
+        session,
+        succeeded_ids=[result.webhook.id for result in results if result.is_successful],
+        failed_ids=[result.webhook.id for result in results if not result.is_successful],
+    )
+
+    return len(webhooks) == chunk_size
@@ -41,7 +41,7 @@ def handle_failure(session: Session, webhook: Webhook, exc: Exception) -> None:
 
 
 @cron_job
-def process_incoming_job_launcher_webhooks(logger: logging.Logger, session: Session):
+def process_incoming_job_launcher_webhooks(logger: logging.Logger, session: Session) -> bool:
     """
     Process incoming job launcher webhooks
     """
@@ -58,6 +58,9 @@ def process_incoming_job_launcher_webhooks(logger: logging.Logger, session: Sess
         ):
             handle_job_launcher_event(webhook, db_session=session, logger=logger)
 
+    # There can be more pending webhooks, if the chunk is full
+    return len(webhooks) == CronConfig.process_job_launcher_webhooks_chunk_size
+
 
 def handle_job_launcher_event(webhook: Webhook, *, db_session: Session, logger: logging.Logger):
     assert webhook.type == OracleWebhookTypes.job_launcher
@@ -88,19 +91,27 @@ def handle_job_launcher_event(webhook: Webhook, *, db_session: Session, logger:
                 cvat.create_task(webhook.escrow_address, webhook.chain_id)
 
             except Exception:
+                if webhook.attempts + 1 < Config.webhook_max_retries:
+                    # Keep the uploaded data and the created CVAT objects,
+                    # the next attempt will continue from the saved progress
+                    raise
+
                 projects = cvat_db_service.get_projects_by_escrow_address(
                     db_session, webhook.escrow_address
                 )
 
-                cleanup_escrow(
-                    webhook.escrow_address,
-                    Networks(webhook.chain_id),
-                    projects=projects,
-                    session=db_session,
-                )
-                cvat_db_service.delete_projects(
-                    db_session, webhook.escrow_address, webhook.chain_id
-                )
+                try:
+                    cvat.discard_task_creation_progress(webhook.escrow_address, webhook.chain_id)
+                finally:
+                    cleanup_escrow(
+                        webhook.escrow_address,
+                        Networks(webhook.chain_id),
+                        projects=projects,
+                        session=db_session,
+                    )
+                    cvat_db_service.delete_projects(
+                        db_session, webhook.escrow_address, webhook.chain_id
+                    )
                 raise
 
         case JobLauncherEventTypes.escrow_canceled:
@@ -114,6 +125,22 @@ def handle_job_launcher_event(webhook: Webhook, *, db_session: Session, logger:
                 db_session, webhook.escrow_address, for_update=True, limit=None
             )
             if not projects:
+                # The task creation can be waiting for a retry. The CVAT objects and the data
+                # of the failed attempts don't have projects in the DB yet
+                if cvat.discard_task_creation_progress(webhook.escrow_address, webhook.chain_id):
+                    cleanup_escrow(
+                        webhook.escrow_address,
+                        Networks(webhook.chain_id),
+                        projects=[],
+                        session=db_session,
+                    )
+                    logger.info(
+                        "Received escrow cancel event "
+                        f"(escrow_address={webhook.escrow_address}). "
+                        "Removed the unfinished task creation data"
+                    )
+                    return
+
                 logger.error(
                     "Received escrow cancel event "
                     f"(escrow_address={webhook.escrow_address}). "
@@ -163,8 +190,8 @@ def handle_job_launcher_event(webhook: Webhook, *, db_session: Session, logger:
 
 
 @cron_job
-def process_outgoing_job_launcher_webhooks(logger: logging.Logger, session: Session):
-    process_outgoing_webhooks(
+def process_outgoing_job_launcher_webhooks(logger: logging.Logger, session: Session) -> bool:
+    return process_outgoing_webhooks(
         logger,
         session,
         OracleWebhookTypes.job_launcher,
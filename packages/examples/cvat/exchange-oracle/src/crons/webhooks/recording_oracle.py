@@ -24,7 +24,7 @@ from src.models.webhook import Webhook
 
 
 @cron_job
-def process_incoming_recording_oracle_webhooks(logger: logging.Logger, session: Session):
+def process_incoming_recording_oracle_webhooks(logger: logging.Logger, session: Session) -> bool:
     """
     Process incoming oracle webhooks
     """
@@ -40,11 +40,14 @@ def process_incoming_recording_oracle_webhooks(logger: logging.Logger, session:
         with handle_webhook(logger, session, webhook, queue=oracle_db_service.inbox):
             handle_recording_oracle_event(webhook, db_session=session, logger=logger)
 
+    # There can be more pending webhooks, if the chunk is full
+    return len(webhooks) == CronConfig.process_recording_oracle_webhooks_chunk_size
+
 
 @cron_job
 def process_incoming_recording_oracle_webhook_job_completed(
     logger: logging.Logger, session: Session
-):
+) -> bool:
     """
     Process incoming oracle webhooks of type job_completed
     We do it in a separate job as this is a long operation that should not block
@@ -62,6 +65,9 @@ def process_incoming_recording_oracle_webhook_job_completed(
         with handle_webhook(logger, session, webhook, queue=oracle_db_service.inbox):
             handle_recording_oracle_event(webhook, db_session=session, logger=logger)
 
+    # There can be more pending webhooks, if the chunk is full
+    return len(webhooks) == CronConfig.process_recording_oracle_webhooks_chunk_size
+
 
 def handle_recording_oracle_event(webhook: Webhook, *, db_session: Session, logger: logging.Logger):  # noqa: PLR0912
     assert webhook.type == OracleWebhookTypes.recording_oracle
@@ -251,8 +257,8 @@ def handle_recording_oracle_event(webhook: Webhook, *, db_session: Session, logg
 
 
 @cron_job
-def process_outgoing_recording_oracle_webhooks(logger: logging.Logger, session: Session):
-    process_outgoing_webhooks(
+def process_outgoing_recording_oracle_webhooks(logger: logging.Logger, session: Session) -> bool:
+    return process_outgoing_webhooks(
         logger,
         session,
         OracleWebhookTypes.recording_oracle,
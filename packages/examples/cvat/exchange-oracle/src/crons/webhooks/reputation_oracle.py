@@ -15,7 +15,7 @@ from src.handlers.escrow_cleanup import cleanup_escrow
 
 
 @cron_job
-def process_incoming_reputation_oracle_webhooks(logger: logging.Logger, session: Session):
+def process_incoming_reputation_oracle_webhooks(logger: logging.Logger, session: Session) -> bool:
     webhooks = oracle_db_service.inbox.get_pending_webhooks(
         session,
         OracleWebhookTypes.reputation_oracle,
@@ -53,10 +53,13 @@ def process_incoming_reputation_oracle_webhooks(logger: logging.Logger, session:
                 case _:
                     raise TypeError(f"Unknown reputation oracle event {webhook.event_type}")
 
+    # There can be more pending webhooks, if the chunk is full
+    return len(webhooks) == CronConfig.process_reputation_oracle_webhooks_chunk_size
+
 
 @cron_job
-def process_outgoing_reputation_oracle_webhooks(logger: logging.Logger, session: Session):
-    process_outgoing_webhooks(
+def process_outgoing_reputation_oracle_webhooks(logger: logging.Logger, session: Session) -> bool:
+    return process_outgoing_webhooks(
         logger,
         session,
         OracleWebhookTypes.recording_oracle,
@@ -5,24 +5,22 @@ import zipfile
 from collections.abc import Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
-from datetime import datetime, timedelta, timezone
 from enum import Enum
 from http import HTTPStatus
 from io import BytesIO
 from pathlib import Path
-from time import sleep
 from typing import Any
 
-from cvat_sdk import Client, make_client
-from cvat_sdk.api_client import ApiClient, Configuration, exceptions, models
+from cvat_sdk import Client
+from cvat_sdk.api_client import ApiClient, exceptions, models
 from cvat_sdk.api_client.api_client import Endpoint
 from cvat_sdk.core.helpers import get_paginated_collection
 from cvat_sdk.core.uploading import AnnotationUploader
 from httpx import URL
 
 from src.core.config import Config
+from src.cvat import client_pool, request_waiter
 from src.utils.enums import BetterEnumMeta
-from src.utils.time import utcnow
 
 _NOTSET = object()
 
@@ -73,25 +71,22 @@ def _get_annotations(
     _get_annotations(request_id, ...)
     """
 
-    time_begin = utcnow()
-
     if timeout is _NOTSET:
         timeout = Config.cvat_config.export_timeout
 
-    while True:
-        request_info = api_client.requests_api.retrieve(request_id)[0]
-        if request_info.status.value == models.RequestStatus.allowed_values[("value",)]["FAILED"]:
-            raise Exception(
-                f"Failed to export annotations for {request_id=}: {request_info.message}"
-            )
-
-        if request_info.status.value == models.RequestStatus.allowed_values[("value",)]["FINISHED"]:
-            break
-
-        if timeout is not None and timedelta(seconds=timeout) < (utcnow() - time_begin):
-            raise Exception("Failed to retrieve the dataset from CVAT within the timeout interval")
+    try:
+        request_info = (
+            request_waiter.get_waiter()
+            .wait_for_request(request_id, timeout=timeout, max_interval=attempt_interval)
+            .result()
+        )
+    except TimeoutError as ex:
+        raise Exception(
+            "Failed to retrieve the dataset from CVAT within the timeout interval"
+        ) from ex
 
-        sleep(attempt_interval)
+    if request_info.status.value == models.RequestStatus.allowed_values[("value",)]["FAILED"]:
+        raise Exception(f"Failed to export annotations for {request_id=}: {request_info.message}")
 
     result_url = URL(request_info.result_url)
     query_params = result_url.params
@@ -129,26 +124,11 @@ def get_api_client() -> ApiClient:
     if current_api_client:
         return current_api_client
 
-    configuration = Configuration(
-        host=Config.cvat_config.host_url,
-        username=Config.cvat_config.admin_login,
-        password=Config.cvat_config.admin_pass,
-    )
-
-    api_client = ApiClient(configuration=configuration)
-    api_client.set_default_header("X-organization", Config.cvat_config.org_slug)
-
-    return api_client
+    return client_pool.get_pool().get_api_client()
 
 
 def get_sdk_client() -> Client:
-    client = make_client(
-        host=Config.cvat_config.host_url,
-        credentials=(Config.cvat_config.admin_login, Config.cvat_config.admin_pass),
-    )
-    client.organization_slug = Config.cvat_config.org_slug
-
-    return client
+    return client_pool.get_pool().get_sdk_client()
 
 
 def create_cloudstorage(
@@ -518,6 +498,16 @@ def delete_project(cvat_id: int) -> None:
             raise
 
 
+def delete_task(cvat_id: int) -> None:
+    logger = logging.getLogger("app")
+    with get_api_client() as api_client:
+        try:
+            api_client.tasks_api.destroy(cvat_id)
+        except exceptions.ApiException as e:
+            logger.exception(f"Exception when calling TasksApi.destroy(): {e}\n")
+            raise
+
+
 def delete_cloudstorage(cvat_id: int) -> None:
     logger = logging.getLogger("app")
     with get_api_client() as api_client:
@@ -618,7 +608,6 @@ def upload_gt_annotations(
     timeout: int | None = Config.cvat_config.import_timeout,
 ) -> None:
     # FUTURE-TODO: use job.import_annotations when CVAT supports a waiting timeout
-    start_time = datetime.now(timezone.utc)
     logger = logging.getLogger("app")
 
     with get_sdk_client() as client:
@@ -645,36 +634,29 @@ def upload_gt_annotations(
                 f"uploading GT annotations to the {job_id} job"
             )
 
-        while True:
-            try:
-                (request_details, _) = client.api_client.requests_api.retrieve(request_id)
-            except exceptions.ApiException as ex:
-                logger.exception(f"Exception occurred while importing GT annotations: {ex}\n")
-                raise
-
-            if (
-                request_details.status.value
-                == models.RequestStatus.allowed_values[("value",)]["FINISHED"]
-            ):
-                break
-
-            if (
-                request_details.status.value
-                == models.RequestStatus.allowed_values[("value",)]["FAILED"]
-            ):
-                raise Exception(
-                    "Annotations upload failed. "
-                    f"Previous status was: {request_details.status.value}."
-                )
-
-            if timeout is not None and timedelta(seconds=timeout) < (utcnow() - start_time):
-                raise Exception(
-                    "Failed to upload the GT annotations to CVAT within the timeout interval. "
-                    f"Previous status was: {request_details.status.value}. "
-                    f"Timeout: {timeout} seconds."
-                )
-
-            sleep(sleep_interval)
+        try:
+            request_details = (
+                request_waiter.get_waiter()
+                .wait_for_request(request_id, timeout=timeout, max_interval=sleep_interval)
+                .result()
+            )
+        except exceptions.ApiException as ex:
+            logger.exception(f"Exception occurred while importing GT annotations: {ex}\n")
+            raise
+        except TimeoutError as ex:
+            raise Exception(
+                "Failed to upload the GT annotations to CVAT within the timeout interval. "
+                f"Timeout: {timeout} seconds."
+            ) from ex
+
+        if (
+            request_details.status.value
+            == models.RequestStatus.allowed_values[("value",)]["FAILED"]
+        ):
+            raise Exception(
+                "Annotations upload failed. "
+                f"Previous status was: {request_details.status.value}."
+            )
 
     logger.info(f"GT annotations for the job {job_id} have been uploaded to CVAT.")
 
@@ -0,0 +1,145 @@
+"""
+Process-wide CVAT API clients with persistent HTTP connections.
+
+Creating a new ApiClient for each request means a new connection pool, so each request
+has to establish a new TCP (and, possibly, TLS) connection to the server. Here, a single
+client is shared by all the threads of the process. The underlying urllib3 connection pool
+is thread-safe and keeps up to the configured number of idle connections to the server.
+"""
+
+import os
+from dataclasses import dataclass
+from threading import Lock
+
+from cvat_sdk import Client
+from cvat_sdk.api_client import ApiClient, Configuration
+
+from src.core.config import Config
+
+
+class _SharedApiClient(ApiClient):
+    """
+    An ApiClient that can be used by several threads at the same time.
+    It is not closed when used as a context manager and keeps no session cookies,
+    the requests are authorized with basic auth.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def _update_cookies_from_response(self, response):
+        pass
+
+    def shutdown(self) -> None:
+        super().__exit__(None, None, None)
+        self.rest_client.pool_manager.clear()
+
+
+@dataclass(frozen=True)
+class ApiClientPoolStats:
+    requests: int
+    "The number of requests sent by the live connection pools"
+
+    connections: int
+    "The number of connections opened by the live connection pools"
+
+    @property
+    def reused_connections(self) -> int:
+        "The number of requests sent over previously opened connections"
+        return max(0, self.requests - self.connections)
+
+
+class ApiClientPool:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._api_client: _SharedApiClient | None = None
+        self._sdk_client: Client | None = None
+
+    def get_api_client(self) -> ApiClient:
+        api_client = self._api_client
+        if api_client:
+            return api_client
+
+        with self._lock:
+            if not self._api_client:
+                self._api_client = self._make_api_client()
+
+            return self._api_client
+
+    def get_sdk_client(self) -> Client:
+        sdk_client = self._sdk_client
+        if sdk_client:
+            return sdk_client
+
+        api_client = self.get_api_client()
+
+        with self._lock:
+            if not self._sdk_client:
+                self._sdk_client = self._make_sdk_client(api_client)
+
+            return self._sdk_client
+
+    def _make_api_client(self) -> _SharedApiClient:
+        configuration = Configuration(
+            host=Config.cvat_config.host_url,
+            username=Config.cvat_config.admin_login,
+            password=Config.cvat_config.admin_pass,
+        )
+        configuration.connection_pool_maxsize = Config.cvat_config.api_pool_size
+
+        api_client = _SharedApiClient(configuration=configuration)
+        api_client.set_default_header("X-organization", Config.cvat_config.org_slug)
+
+        return api_client
+
+    def _make_sdk_client(self, api_client: ApiClient) -> Client:
+        # The shared ApiClient is authorized with basic auth and has the organization header,
+        # so no login is needed.
+        client = Client(Config.cvat_config.host_url, check_server_version=False)
+        client.api_client.close()
+        client.api_client = api_client
+
+        return client
+
+    def get_stats(self) -> ApiClientPoolStats:
+        requests = 0
+        connections = 0
+
+        api_client = self._api_client
+        if api_client:
+            pool_manager = api_client.rest_client.pool_manager
+            # The container doesn't support direct iteration, keys() returns a copy
+            for pool_key in pool_manager.pools.keys():  # noqa: SIM118
+                pool = pool_manager.pools.get(pool_key)
+                if not pool:
+                    continue
+
+                requests += pool.num_requests
+                connections += pool.num_connections
+
+        return ApiClientPoolStats(requests=requests, connections=connections)
+
+    def reset(self) -> None:
+        with self._lock:
+            api_client = self._api_client
+            self._api_client = None
+            self._sdk_client = None
+
+        if api_client:
+            api_client.shutdown()
+
+
+_pool = ApiClientPool()
+
+
+def _reset_pool_after_fork() -> None:
+    # The connections can't be shared with the parent process
+    global _pool  # noqa: PLW0603
+    _pool = ApiClientPool()
+
+
+os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+def get_pool() -> ApiClientPool:
+    return _pool
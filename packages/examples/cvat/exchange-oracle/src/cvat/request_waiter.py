@@ -0,0 +1,250 @@
+"""
+Waiting for CVAT background requests, such as exports, imports and task creation.
+
+All the outstanding requests of the process are tracked by a single thread,
+and the callers get futures for the results. When several requests are to be checked,
+the requests API is queried for the lists of queued and started requests,
+and only the requests that are not in these lists anymore are retrieved one by one.
+The check interval for a request grows while the request is running.
+"""
+
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from threading import Condition, Thread
+from time import monotonic
+from typing import TypeVar
+
+from cvat_sdk.api_client import models
+from cvat_sdk.core.helpers import get_paginated_collection
+
+from src.cvat import client_pool
+
+T = TypeVar("T")
+
+_IN_PROGRESS_STATUSES = (
+    models.RequestStatus.allowed_values[("value",)]["QUEUED"],
+    models.RequestStatus.allowed_values[("value",)]["STARTED"],
+)
+
+
+@dataclass(eq=False)
+class _Entry:
+    future: Future
+    check: Callable[[], object | None]
+    request_id: str | None
+    deadline: float | None
+    max_interval: float
+    interval: float = 0
+    next_check: float = field(default_factory=monotonic)
+
+
+class RequestWaiter:
+    def __init__(
+        self,
+        *,
+        min_interval: float = 0.5,
+        max_interval: float = 10,
+        backoff_factor: float = 1.5,
+        batch_threshold: int = 3,
+    ) -> None:
+        """
+        Args:
+            min_interval: The initial check interval for a request, seconds
+            max_interval: The default max check interval for a request, seconds
+            backoff_factor: The check interval multiplier for a running request
+            batch_threshold: The min number of requests checked with request list queries
+        """
+
+        assert 0 < min_interval <= max_interval
+        assert backoff_factor >= 1
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.batch_threshold = batch_threshold
+
+        self._condition = Condition()
+        self._entries: list[_Entry] = []
+        self._thread: Thread | None = None
+
+    def wait_for_request(
+        self,
+        request_id: str,
+        *,
+        timeout: float | None = None,
+        max_interval: float | None = None,
+    ) -> Future[models.Request]:
+        """
+        Waits for a request in the CVAT requests API to be finished or failed.
+        The future result is the request details.
+        """
+
+        return self._add(
+            self._make_request_check(request_id),
+            request_id=request_id,
+            timeout=timeout,
+            max_interval=max_interval,
+        )
+
+    def wait_for(
+        self,
+        check: Callable[[], T | None],
+        *,
+        timeout: float | None = None,
+        max_interval: float | None = None,
+    ) -> Future[T]:
+        """
+        Calls the check function periodically until it returns a value other than None.
+        An exception raised by the check function is set in the future.
+        """
+
+        return self._add(check, request_id=None, timeout=timeout, max_interval=max_interval)
+
+    def _add(
+        self,
+        check: Callable[[], T | None],
+        *,
+        request_id: str | None,
+        timeout: float | None,
+        max_interval: float | None,
+    ) -> Future[T]:
+        entry = _Entry(
+            future=Future(),
+            check=check,
+            request_id=request_id,
+            deadline=monotonic() + timeout if timeout is not None else None,
+            max_interval=max(max_interval or self.max_interval, self.min_interval),
+        )
+
+        with self._condition:
+            self._entries.append(entry)
+
+            if not self._thread:
+                self._thread = Thread(target=self._run, name="cvat-request-waiter", daemon=True)
+                self._thread.start()
+
+            self._condition.notify()
+
+        return entry.future
+
+    @staticmethod
+    def _make_request_check(request_id: str) -> Callable[[], models.Request | None]:
+        def _check() -> models.Request | None:
+            api_client = client_pool.get_pool().get_api_client()
+            request, _ = api_client.requests_api.retrieve(request_id)
+            if request.status.value in _IN_PROGRESS_STATUSES:
+                return None
+
+            return request
+
+        return _check
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                due_entries = self._get_due_entries()
+                while not due_entries:
+                    next_check = min((e.next_check for e in self._entries), default=None)
+                    self._condition.wait(
+                        timeout=max(0, next_check - monotonic()) if next_check is not None else None
+                    )
+                    due_entries = self._get_due_entries()
+
+            try:
+                self._check_entries(due_entries)
+            except Exception:
+                logging.getLogger("app").exception("Failed to check CVAT requests")
+
+    def _get_due_entries(self) -> list[_Entry]:
+        now = monotonic()
+
+        due_entries = []
+        for entry in list(self._entries):
+            if entry.future.cancelled():
+                self._entries.remove(entry)
+            elif entry.deadline is not None and entry.deadline < now:
+                self._entries.remove(entry)
+                self._resolve(entry, exception=TimeoutError("The request has not finished in time"))
+            elif entry.next_check <= now:
+                due_entries.append(entry)
+
+        return due_entries
+
+    def _check_entries(self, entries: list[_Entry]) -> None:
+        running_request_ids = self._get_running_request_ids(entries)
+
+        for entry in entries:
+            if entry.request_id is not None and entry.request_id in running_request_ids:
+                result = None
+            else:
+                try:
+                    result = entry.check()
+                except Exception as ex:  # noqa: BLE001
+                    self._complete(entry, exception=ex)
+                    continue
+
+            if result is not None:
+                self._complete(entry, result=result)
+            else:
+                entry.interval = min(
+                    max(entry.interval * self.backoff_factor, self.min_interval),
+                    entry.max_interval,
+                )
+                entry.next_check = monotonic() + entry.interval
+
+    def _get_running_request_ids(self, entries: list[_Entry]) -> set[str]:
+        if sum(1 for e in entries if e.request_id is not None) < self.batch_threshold:
+            return set()
+
+        try:
+            api_client = client_pool.get_pool().get_api_client()
+            return {
+                request.id
+                for status in _IN_PROGRESS_STATUSES
+                for request in get_paginated_collection(
+                    api_client.requests_api.list_endpoint, status=status
+                )
+            }
+        except Exception:  # noqa: BLE001
+            # The requests will be checked one by one
+            logging.getLogger("app").warning("Failed to list CVAT requests", exc_info=True)
+            return set()
+
+    def _complete(
+        self, entry: _Entry, *, result: object = None, exception: BaseException | None = None
+    ) -> None:
+        with self._condition:
+            self._entries.remove(entry)
+
+        self._resolve(entry, result=result, exception=exception)
+
+    @staticmethod
+    def _resolve(
+        entry: _Entry, *, result: object = None, exception: BaseException | None = None
+    ) -> None:
+        if not entry.future.set_running_or_notify_cancel():
+            return
+
+        if exception is not None:
+            entry.future.set_exception(exception)
+        else:
+            entry.future.set_result(result)
+
+
+_waiter = RequestWaiter()
+
+
+def _reset_waiter_after_fork() -> None:
+    # The waiting thread is not copied into the child process
+    global _waiter  # noqa: PLW0603
+    _waiter = RequestWaiter()
+
+
+os.register_at_fork(after_in_child=_reset_waiter_after_fork)
+
+
+def get_waiter() -> RequestWaiter:
+    return _waiter
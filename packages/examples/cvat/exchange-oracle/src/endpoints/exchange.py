@@ -16,7 +16,6 @@ import src.services.exchange as oracle_service
 from src.core.config import Config
 from src.core.types import ProjectStatuses, TaskTypes
 from src.db import SessionLocal
-from src.db import engine as db_engine
 from src.endpoints.authentication import (
     AuthorizationData,
     AuthorizationParam,
@@ -28,6 +27,7 @@ from src.endpoints.pagination import Page, paginate
 from src.endpoints.serializers import (
     ASSIGNMENT_PROJECT_VALIDATION_STATUSES,
     PROJECT_COMPLETED_STATUSES,
+    get_project_manifests,
     serialize_assignment,
     serialize_job,
 )
@@ -90,7 +90,7 @@ class JobsFilter(Filter):
     ]
 
     class Constants(Filter.Constants):
-        model = cvat_service.Project
+        model = cvat_service.Escrow
 
         sorting_direction_field_name = "sort"
         sorting_field_name = "sort_field"
@@ -114,11 +114,11 @@ async def list_jobs(
 ) -> Page[JobResponse]:
     wallet_address = token.wallet_address
 
-    query = select(cvat_service.Project)
+    query = select(cvat_service.Escrow)
 
     # These states are internal, they should not be visible through the API
     query = query.filter(
-        cvat_service.Project.status.not_in(
+        cvat_service.Escrow.status.not_in(
             [
                 ProjectStatuses.creation,
                 ProjectStatuses.deleted,
@@ -130,9 +130,11 @@ async def list_jobs(
 
     if wallet_address:
         query = query.filter(
-            cvat_service.Project.jobs.any(
-                cvat_service.Job.assignments.any(
-                    cvat_service.Assignment.user_wallet_address == wallet_address
+            cvat_service.Escrow.projects.any(
+                cvat_service.Project.jobs.any(
+                    cvat_service.Job.assignments.any(
+                        cvat_service.Assignment.user_wallet_address == wallet_address
+                    )
                 )
             )
         )
@@ -140,54 +142,42 @@ async def list_jobs(
     if status:
         match status:
             case JobStatuses.active:
-                query = query.filter(cvat_service.Project.status == ProjectStatuses.annotation)
+                query = query.filter(cvat_service.Escrow.status == ProjectStatuses.annotation)
             case JobStatuses.canceled:
                 query = query.filter(
-                    cvat_service.Project.status == cvat_service.ProjectStatuses.canceled
+                    cvat_service.Escrow.status == cvat_service.ProjectStatuses.canceled
                 )
             case JobStatuses.completed:
-                query = query.filter(cvat_service.Project.status.in_(PROJECT_COMPLETED_STATUSES))
+                query = query.filter(cvat_service.Escrow.status.in_(PROJECT_COMPLETED_STATUSES))
             case _:
                 raise NotImplementedError(f"Unsupported status {status}")
 
     if created_after:
-        query = query.filter(created_after < cvat_service.Project.created_at)
+        query = query.filter(created_after < cvat_service.Escrow.created_at)
 
     if updated_after:
-        query = query.filter(updated_after < cvat_service.Project.updated_at)
+        query = query.filter(updated_after < cvat_service.Escrow.updated_at)
 
     query = filter.filter_(query)
-
-    # We need only high-level jobs (i.e. escrows) without project details
-    if db_engine.driver == "psycopg2":
-        # Here we create a subquery to leave only unique escrows from all the previous entries.
-        # This is required to support custom ordering after the filtering,
-        # as DISTINCT ON requires ORDER BY by the distinct on field
-        query = (
-            query.order_by(cvat_service.Project.escrow_address)
-            .distinct(
-                cvat_service.Project.escrow_address
-                # DISTINCT ON is a postgres feature
-            )
-            .with_only_columns(cvat_service.Project.id)
-        )
-        query = select(cvat_service.Project).filter(cvat_service.Project.id.in_(query))
-    else:
-        # should be something like
-        # select(Project).where(id.in_(select(Project.id).group_by(Project.escrow_address)))
-        raise NotImplementedError(f"DB engine {db_engine.driver} not supported in this operation")
-
     query = filter.sort_(query)
 
     with SessionLocal() as session:
 
         def _page_serializer(
-            projects: Sequence[cvat_service.Project],
+            escrows: Sequence[cvat_service.Escrow],
         ) -> Sequence[JobResponse]:
-            page = [serialize_job(p, session=session) for p in projects]
+            manifests = get_project_manifests(escrows)
+            page = [
+                serialize_job(
+                    e,
+                    session=session,
+                    manifest=manifests.get((e.chain_id, e.escrow_address), False),
+                )
+                for e in escrows
+            ]
             return [filter.select_fields_(p) for p in page]
 
-        return paginate(session, query, transformer=_page_serializer)
+        return paginate(session, query, transformer=_page_serializer, sorting=filter.sorting_())
 
 
 @router.post("/register", description="Binds a CVAT user to a HUMAN App user")
@@ -262,6 +252,10 @@ class AssignmentFilter(Filter):
 
         sorting_direction_field_name = "sort"
         sorting_field_name = "sort_field"
+        sorting_field_columns = {
+            "chain_id": cvat_service.Project.chain_id,
+            "job_type": cvat_service.Project.job_type,
+        }
 
 
 @router.get(
@@ -375,14 +369,23 @@ async def list_assignments(
                 )
             }
 
+            manifests = get_project_manifests(projects_for_assignments.values())
+
             for assignment in assignments:
                 job = jobs_for_assignments[assignment.cvat_job_id]
                 project = projects_for_assignments[job.cvat_project_id]
-                results.append(serialize_assignment(assignment, session=session, project=project))
+                results.append(
+                    serialize_assignment(
+                        assignment,
+                        session=session,
+                        project=project,
+                        manifest=manifests.get((project.chain_id, project.escrow_address), False),
+                    )
+                )
 
             return results
 
-        return paginate(session, query, transformer=_page_serializer)
+        return paginate(session, query, transformer=_page_serializer, sorting=filter.sorting_())
 
 
 @router.post(
@@ -472,15 +475,12 @@ async def get_stats() -> OracleStatsResponse:
     with SessionLocal.begin() as session:
         stats = {}
 
-        stats["escrows_processed"] = (
-            session.query(cvat_service.Project.escrow_address).distinct().count()
-        )
+        stats["escrows_processed"] = session.query(cvat_service.Escrow.id).count()
 
         stats["escrows_active"] = (
-            session.query(cvat_service.Project.escrow_address)
-            .distinct()
+            session.query(cvat_service.Escrow.id)
             .where(
-                cvat_service.Project.status.in_(
+                cvat_service.Escrow.status.in_(
                     [ProjectStatuses.annotation, ProjectStatuses.validation]
                 )
             )
@@ -488,9 +488,8 @@ async def get_stats() -> OracleStatsResponse:
         )
 
         stats["escrows_cancelled"] = (
-            session.query(cvat_service.Project.escrow_address)
-            .distinct()
-            .where(cvat_service.Project.status == ProjectStatuses.canceled)
+            session.query(cvat_service.Escrow.id)
+            .where(cvat_service.Escrow.status == ProjectStatuses.canceled)
             .count()
         )
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeVar
 
 import fastapi
 import fastapi.params
@@ -31,6 +31,15 @@ class OrderingDirection(str, Enum, metaclass=BetterEnumMeta):
         return None
 
 
+class Sorting(NamedTuple):
+    columns: list[sqlalchemy.ColumnElement]  # the last one is the model id to make rows unique
+    direction: OrderingDirection
+
+    # Cursor pagination relies on the model indexes on the sorting columns,
+    # so it's not available for the columns of other tables
+    allows_cursor: bool = True
+
+
 ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
@@ -45,6 +54,10 @@ class Filter(_Filter):
         sorting_direction_field_name: ClassVar[str | None] = None
         sorting_field_name: ClassVar[str | None] = None
 
+        # The columns for the sorting fields that are not the model columns.
+        # Such fields can't be used with cursor pagination
+        sorting_field_columns: ClassVar[dict[str, sqlalchemy.ColumnElement] | None] = None
+
         selector_field_name: ClassVar[str | None] = None
         selectable_fields_enum_name: ClassVar[str | None] = None
 
@@ -74,32 +87,50 @@ class Filter(_Filter):
 
         return fields.items()
 
+    def sorting_(self) -> Sorting | None:
+        if not self.Constants.sorting_field_name:
+            return None
+
+        direction_value = getattr(
+            self, self.Constants.sorting_direction_field_name
+        ) or self.get_default_field_value(self.Constants.sorting_direction_field_name)
+
+        order_by_param_value = getattr(
+            self, self.Constants.sorting_field_name
+        ) or self.get_default_field_value(self.Constants.sorting_field_name)
+
+        sorting_fields = [order_by_param_value.value]
+
+        if (
+            default_sort_field := getattr(self, "default_sort_field", None)
+        ) and default_sort_field != order_by_param_value:
+            # multi-criteria sorting
+            sorting_fields.append(default_sort_field.value)
+
+        field_columns = self.Constants.sorting_field_columns or {}
+        columns = [
+            field_columns[field] if field in field_columns else getattr(self.Constants.model, field)
+            for field in sorting_fields
+        ]
+        columns.append(self.Constants.model.id)
+
+        return Sorting(
+            columns=columns,
+            direction=OrderingDirection(direction_value),
+            allows_cursor=not any(field in field_columns for field in sorting_fields),
+        )
+
     def sort_(
         self, query: sqlalchemy.orm.Query | sqlalchemy.Select
     ) -> sqlalchemy.orm.Query | sqlalchemy.Select:
-        if self.Constants.sorting_field_name:
-            direction_value = getattr(
-                self, self.Constants.sorting_direction_field_name
-            ) or self.get_default_field_value(self.Constants.sorting_direction_field_name)
-
-            order_by_param_value = getattr(
-                self, self.Constants.sorting_field_name
-            ) or self.get_default_field_value(self.Constants.sorting_field_name)
-
+        if sorting := self.sorting_():
+            # NULLs are the greatest values, as in the Postgres default order
             sorting_func = {
-                OrderingDirection.asc: sqlalchemy.asc,
-                OrderingDirection.desc: sqlalchemy.desc,
-            }[direction_value]
-
-            sorting_args = [sorting_func(order_by_param_value.value)]
-
-            if (
-                default_sort_field := getattr(self, "default_sort_field", None)
-            ) and default_sort_field != order_by_param_value:
-                # multi-criteria sorting
-                sorting_args.append(sorting_func(default_sort_field.value))
+                OrderingDirection.asc: lambda c: sqlalchemy.asc(c).nulls_last(),
+                OrderingDirection.desc: lambda c: sqlalchemy.desc(c).nulls_first(),
+            }[sorting.direction]
 
-            query = query.order_by(*sorting_args)
+            query = query.order_by(*map(sorting_func, sorting.columns))
 
         return query
 
@@ -157,4 +188,4 @@ def _get_field_info(klass: type[BaseModel], field_name: str):
     return klass.model_fields[field_name]
 
 
-__all__ = ["Filter", "FilterDepends", "with_prefix", "OrderingDirection"]
+__all__ = ["Filter", "FilterDepends", "with_prefix", "OrderingDirection", "Sorting"]
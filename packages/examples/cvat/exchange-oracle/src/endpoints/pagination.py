@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import fastapi_pagination.bases
 import fastapi_pagination.default
+import sqlalchemy
 from fastapi import Query
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi.exceptions import RequestValidationError
+from fastapi_pagination.api import apply_items_transformer, create_page, resolve_params
+from fastapi_pagination.ext.sqlalchemy import create_count_query
+from fastapi_pagination.ext.sqlalchemy import paginate as _paginate
 from pydantic import Field
 
 from src.core.config import Config
+from src.endpoints.filtering import OrderingDirection, Sorting
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
+
+    from sqlalchemy.orm import Session
 
 FIRST_PAGE = 0
 
@@ -25,14 +36,31 @@ class PaginationParams(fastapi_pagination.default.Params):
         description="Page size",
         alias="page_size",  # request query parameter name
     )
+    cursor: str | None = Query(
+        None,
+        description=(
+            "Enables cursor pagination, which is faster for the distant pages. "
+            "Use an empty value to get the first page, then the 'next_cursor' value "
+            "from the previous page. Can't be used with 'page' and with the sorting fields "
+            "of the related objects"
+        ),
+    )
+    include_total: bool = Query(
+        True,  # noqa: FBT003
+        description="Include the total number of results and pages",
+    )
 
     def to_raw_params(self) -> fastapi_pagination.bases.RawParams:
         if FIRST_PAGE == 0:
             return fastapi_pagination.bases.RawParams(
                 limit=self.size,
                 offset=self.size * self.page,
+                include_total=self.include_total,
             )
-        return super().to_raw_params()
+
+        raw_params = super().to_raw_params()
+        raw_params.include_total = self.include_total
+        return raw_params
 
 
 T = TypeVar("T")
@@ -50,7 +78,7 @@ class Page(fastapi_pagination.default.Page[T]):
         alias="total_results",  # response parameter name
         validation_alias="total",
     )
-    pages: fastapi_pagination.default.GreaterEqualZero = Field(
+    pages: fastapi_pagination.default.GreaterEqualZero | None = Field(
         default=FIRST_PAGE,
         alias="total_pages",  # response parameter name
         validation_alias="pages",
@@ -60,6 +88,10 @@ class Page(fastapi_pagination.default.Page[T]):
         alias="page_size",  # response parameter name
         default=Config.api_config.default_page_size,
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description="The cursor of the next page, if cursor pagination is used",
+    )
 
     @classmethod
     def create(
@@ -74,4 +106,135 @@ class Page(fastapi_pagination.default.Page[T]):
         return super().create(items, params, total=total, **kwargs)
 
 
+def _cursor_error(message: str) -> RequestValidationError:
+    return RequestValidationError(
+        [{"loc": ("query", "cursor"), "msg": message, "type": "value_error"}]
+    )
+
+
+def _cursor_key(sorting: Sorting) -> list[str]:
+    return [str(column) for column in sorting.columns] + [sorting.direction.value]
+
+
+def _encode_cursor(sorting: Sorting, values: Sequence[Any]) -> str:
+    cursor = {
+        "key": _cursor_key(sorting),
+        "values": [v.isoformat() if isinstance(v, datetime) else v for v in values],
+    }
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+
+def _decode_cursor(sorting: Sorting, cursor: str) -> list[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["key"] != _cursor_key(sorting):
+            raise _cursor_error("The cursor doesn't match the sorting parameters")
+
+        values = payload["values"]
+        return [
+            datetime.fromisoformat(v)
+            if isinstance(column.type, sqlalchemy.DateTime) and v is not None
+            else v
+            for column, v in zip(sorting.columns, values, strict=True)
+        ]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise _cursor_error("Invalid cursor") from e
+
+
+def _is_nullable(column: sqlalchemy.ColumnElement) -> bool:
+    return getattr(column.expression, "nullable", True)
+
+
+def _after_cursor(sorting: Sorting, values: Sequence[Any]) -> sqlalchemy.ColumnElement[bool]:
+    # (c1, c2, ...) > (v1, v2, ...) in the sorting order, where NULLs are the greatest values,
+    # see Filter.sort_()
+    columns = list(sorting.columns)
+    values = list(values)
+    is_asc = sorting.direction == OrderingDirection.asc
+
+    # The NOT NULL suffix is compared as a row value, which is an index range condition
+    nonnull_suffix_start = len(columns)
+    while (
+        nonnull_suffix_start
+        and values[nonnull_suffix_start - 1] is not None
+        and not _is_nullable(columns[nonnull_suffix_start - 1])
+    ):
+        nonnull_suffix_start -= 1
+
+    if nonnull_suffix_start < len(columns):
+        suffix_columns = sqlalchemy.tuple_(*columns[nonnull_suffix_start:])
+        suffix_values = sqlalchemy.tuple_(
+            *(
+                sqlalchemy.literal(value, column.type)
+                for column, value in zip(
+                    columns[nonnull_suffix_start:], values[nonnull_suffix_start:], strict=True
+                )
+            )
+        )
+        condition = suffix_columns > suffix_values if is_asc else suffix_columns < suffix_values
+    else:
+        condition = sqlalchemy.false()
+
+    # The nullable columns are expanded. NULLs can't be compared as row values
+    for column, value in reversed(
+        list(zip(columns[:nonnull_suffix_start], values[:nonnull_suffix_start], strict=True))
+    ):
+        if value is None:
+            if is_asc:
+                condition = column.is_(None) & condition
+            else:
+                condition = column.is_not(None) | (column.is_(None) & condition)
+        elif is_asc:
+            condition = (column > value) | column.is_(None) | ((column == value) & condition)
+        else:
+            # The redundant bound allows an index range scan
+            condition = (column <= value) & ((column < value) | condition)
+
+    return condition
+
+
+def paginate(
+    session: Session,
+    query: sqlalchemy.Select,
+    *,
+    transformer: Callable[[Sequence[Any]], Sequence[Any]] | None = None,
+    sorting: Sorting | None = None,
+) -> Page:
+    """
+    Returns a page of the query results using the request pagination parameters.
+
+    With the 'cursor' parameter, the rows following the cursor row in the sorting order
+    are returned instead of skipping the rows of the previous pages. The sorting must be
+    the same as the query ordering.
+    """
+    params: PaginationParams = resolve_params()
+    if params.cursor is None:
+        return _paginate(session, query, transformer=transformer)
+
+    assert sorting, "Cursor pagination requires sorting"
+
+    if not sorting.allows_cursor:
+        raise _cursor_error("The cursor can't be used with the sorting field")
+
+    if params.page != FIRST_PAGE:
+        raise _cursor_error("The cursor can't be used with the page number")
+
+    total = session.scalar(create_count_query(query)) if params.include_total else None
+
+    if params.cursor:
+        query = query.where(_after_cursor(sorting, _decode_cursor(sorting, params.cursor)))
+
+    # The next page existence is checked by the extra row
+    query = query.add_columns(*sorting.columns).limit(params.size + 1)
+    rows = session.execute(query).all()
+
+    next_cursor = None
+    if len(rows) > params.size:
+        rows = rows[: params.size]
+        next_cursor = _encode_cursor(sorting, rows[-1][1:])
+
+    items = apply_items_transformer([row[0] for row in rows], transformer)
+    return create_page(items, total=total, params=params, next_cursor=next_cursor)
+
+
 __all__ = ["PaginationParams", "Page", "paginate"]
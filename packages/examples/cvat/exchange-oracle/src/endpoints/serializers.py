@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from contextlib import ExitStack, suppress
 from typing import Literal
 
@@ -5,12 +6,12 @@ from human_protocol_sdk.storage import StorageFileNotFoundError
 from sqlalchemy.orm import Session
 
 import src.services.cvat as cvat_service
-from src.chain.escrow import get_escrow_manifest
+from src.chain.escrow import get_escrow_task_manifest, get_escrow_task_manifests
 from src.core.manifest import TaskManifest
 from src.core.types import AssignmentStatuses, ProjectStatuses
 from src.db import SessionLocal
 from src.schemas import exchange as service_api
-from src.utils.assignments import compose_assignment_url, parse_manifest
+from src.utils.assignments import compose_assignment_url
 
 PROJECT_COMPLETED_STATUSES = {
     ProjectStatuses.recorded,
@@ -18,8 +19,21 @@ PROJECT_COMPLETED_STATUSES = {
 }
 
 
+def get_project_manifests(
+    projects: Iterable[cvat_service.Project | cvat_service.Escrow],
+) -> dict[tuple[int, str], TaskManifest]:
+    """
+    Returns the parsed manifests for the projects or escrows, by (chain_id, escrow_address).
+    The projects with missing manifest files are not included.
+    Can be used to serialize a list of jobs or assignments, see the 'manifest' parameter.
+    """
+    return get_escrow_task_manifests(
+        ((project.chain_id, project.escrow_address) for project in projects), skip_missing=True
+    )
+
+
 def serialize_job(
-    project: str | cvat_service.Project,
+    project: str | cvat_service.Project | cvat_service.Escrow,
     *,
     manifest: None | TaskManifest | Literal[False] = None,
     session: Session | None = None,
@@ -31,17 +45,15 @@ def serialize_job(
         if isinstance(project, str):
             project = cvat_service.get_project_by_id(session, project)
             assert project
-        elif not isinstance(project, cvat_service.Project):
+        elif not isinstance(project, cvat_service.Project | cvat_service.Escrow):
             raise TypeError(
-                f"Project must be either project id "
-                f"or a cvat_service.Project instance, not {project!r}"
+                f"Project must be either project id, a cvat_service.Project "
+                f"or a cvat_service.Escrow instance, not {project!r}"
             )
 
         if manifest is None:
             with suppress(StorageFileNotFoundError):
-                manifest = parse_manifest(
-                    get_escrow_manifest(project.chain_id, project.escrow_address)
-                )
+                manifest = get_escrow_task_manifest(project.chain_id, project.escrow_address)
 
         if project.status == ProjectStatuses.canceled:
             api_status = service_api.JobStatuses.canceled
@@ -107,9 +119,7 @@ def serialize_assignment(
 
         if manifest is None:
             with suppress(StorageFileNotFoundError):
-                manifest = parse_manifest(
-                    get_escrow_manifest(project.chain_id, project.escrow_address)
-                )
+                manifest = get_escrow_task_manifest(project.chain_id, project.escrow_address)
 
         assignment_status_mapping = {
             AssignmentStatuses.created: service_api.AssignmentStatuses.active,
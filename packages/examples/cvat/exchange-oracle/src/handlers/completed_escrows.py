@@ -1,10 +1,12 @@
 import io
 import logging
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import ExitStack, closing
+from dataclasses import dataclass
 from functools import partial
 from typing import Any
 
-from datumaro.util import take_by
 from sqlalchemy.orm import Session
 
 import src.cvat.api_calls as cvat_api
@@ -13,12 +15,16 @@ import src.services.cvat as cvat_service
 import src.services.webhook as oracle_db_service
 from src.chain.escrow import get_escrow_manifest, validate_escrow
 from src.core.annotation_meta import ANNOTATION_RESULTS_METAFILE_NAME, RESULTING_ANNOTATIONS_FILE
-from src.core.config import CronConfig, StorageConfig
+from src.core.config import Config, CronConfig, StorageConfig
 from src.core.oracle_events import (
     ExchangeOracleEvent_EscrowRecorded,
     ExchangeOracleEvent_JobFinished,
 )
-from src.core.storage import compose_results_bucket_filename
+from src.core.storage import (
+    JOB_ANNOTATIONS_CACHE_DIR,
+    compose_data_bucket_filename,
+    compose_results_bucket_filename,
+)
 from src.core.types import EscrowValidationStatuses, OracleWebhookTypes, TaskTypes
 from src.db import SessionLocal
 from src.db.utils import ForUpdateParams
@@ -31,6 +37,7 @@ from src.handlers.job_export import (
 from src.models.cvat import Job, Project
 from src.services.cloud.types import BucketAccessInfo
 from src.utils.assignments import parse_manifest
+from src.utils.spill import SpillStorage
 
 
 def _download_with_retries(
@@ -62,6 +69,99 @@ def _download_with_retries(
     return None
 
 
+@dataclass(frozen=True)
+class _JobExport:
+    job_cvat_id: int
+
+    filename: str
+    "The job annotations filename in the escrow results"
+
+    cache_filename: str
+    "The job annotations filename in the export cache, unique for the job assignment"
+
+
+def _prepare_job_exports(jobs: Sequence[Job]) -> list[_JobExport]:
+    job_exports = []
+    for job in jobs:
+        job_assignment = job.latest_assignment
+        job_exports.append(
+            _JobExport(
+                job_cvat_id=job.cvat_id,
+                filename="project_{}-task_{}-job_{}-user_{}-assignment_{}.zip".format(
+                    job.cvat_project_id,
+                    job.cvat_task_id,
+                    job.cvat_id,
+                    job_assignment.user.cvat_id,
+                    job_assignment.id,
+                ),
+                cache_filename=f"job_{job.cvat_id}-assignment_{job_assignment.id}.zip",
+            )
+        )
+
+    return job_exports
+
+
+class _JobAnnotationsCache:
+    """
+    Keeps the raw job annotations, exported from CVAT, in the escrow data directory
+    of the oracle bucket. The entries are keyed by the job assignment, so a job
+    is only exported again after it gets a new assignment. The cache is removed
+    with the other escrow data on escrow cleanup.
+    """
+
+    def __init__(self, logger: logging.Logger, escrow_address: str, chain_id: int) -> None:
+        self.logger = logger
+        self.escrow_address = escrow_address
+        self.chain_id = chain_id
+
+        storage_info = BucketAccessInfo.parse_obj(StorageConfig)
+        self._storage_client = cloud_service.make_client(storage_info)
+        self._cached_filenames = set(
+            self._storage_client.list_files(prefix=self._get_key(""), trim_prefix=True)
+        )
+
+    def _get_key(self, filename: str) -> str:
+        return compose_data_bucket_filename(
+            self.escrow_address, self.chain_id, f"{JOB_ANNOTATIONS_CACHE_DIR}/{filename}"
+        )
+
+    def __contains__(self, job_export: _JobExport) -> bool:
+        return job_export.cache_filename in self._cached_filenames
+
+    def download(self, job_export: _JobExport) -> io.RawIOBase:
+        return io.BytesIO(
+            self._storage_client.download_file(self._get_key(job_export.cache_filename))
+        )
+
+    def store(self, files: Sequence[tuple[_JobExport, io.RawIOBase]]) -> None:
+        """
+        Uploads the exported job annotations. Failures are only logged,
+        as the annotations can be exported again.
+        """
+
+        if not files:
+            return
+
+        for _, file in files:
+            file.seek(0)
+
+        try:
+            self._storage_client.create_files(
+                ((self._get_key(job_export.cache_filename), file) for job_export, file in files),
+                max_concurrency=Config.features.max_data_storage_connections,
+            )
+        except Exception:  # noqa: BLE001
+            self.logger.warning(
+                f"Failed to cache job annotations for the escrow ({self.escrow_address=})",
+                exc_info=True,
+            )
+        else:
+            self._cached_filenames.update(job_export.cache_filename for job_export, _ in files)
+
+        for _, file in files:
+            file.seek(0)
+
+
 def _export_escrow_annotations(
     logger: logging.Logger,
     chain_id: int,
@@ -89,69 +189,87 @@ def _export_escrow_annotations(
 
     logger.debug(f"Downloading results for the escrow ({escrow_address=})")
 
-    annotation_format = CVAT_EXPORT_FORMAT_MAPPING[manifest.annotation.type]
-    # FUTURE-TODO: probably can be removed in the future since
-    # these annotations are no longer used in Recording Oracle
-    job_annotations = _download_job_annotations(logger, annotation_format, jobs)
-
-    if manifest.annotation.type == TaskTypes.image_skeletons_from_boxes.value:
-        # we'll have to merge annotations ourselves for skeletons
-        # might want to make this the only behavior in the future
-        project_annotations_file = None
-        project_images = None
-    else:
-        # escrows with simple task types must have only one project
-        try:
-            (project,) = escrow_projects
-        except ValueError:
-            raise NotImplementedError(
-                f"{manifest.annotation.type} is expected to have exactly one project,"
-                f" not {len(escrow_projects)}"
-            )
-        project_annotations_file = _download_project_annotations(
+    with (
+        SpillStorage(
+            max_memory_size=CronConfig.track_completed_escrows_max_memory_annotations_size
+        ) as spill_storage,
+        ExitStack() as exit_stack,
+    ):
+        annotation_format = CVAT_EXPORT_FORMAT_MAPPING[manifest.annotation.type]
+        # FUTURE-TODO: probably can be removed in the future since
+        # these annotations are no longer used in Recording Oracle
+        job_annotations = _download_job_annotations(
             logger,
             annotation_format,
-            project.cvat_id,
+            _prepare_job_exports(jobs),
+            spill_storage=spill_storage,
+            cache=_JobAnnotationsCache(logger, escrow_address, chain_id),
         )
-        project_images = cvat_service.get_project_images(session, project.cvat_id)
 
-    resulting_annotations_file_desc = FileDescriptor(
-        filename=RESULTING_ANNOTATIONS_FILE,
-        file=project_annotations_file,
-    )
+        if manifest.annotation.type == TaskTypes.image_skeletons_from_boxes.value:
+            # we'll have to merge annotations ourselves for skeletons
+            # might want to make this the only behavior in the future
+            project_annotations_file = None
+            project_images = None
+        else:
+            # The merged annotations are still exported from CVAT as a whole project
+            # for these task types, only the job annotations are reused from the cache.
+            # escrows with simple task types must have only one project
+            try:
+                (project,) = escrow_projects
+            except ValueError:
+                raise NotImplementedError(
+                    f"{manifest.annotation.type} is expected to have exactly one project,"
+                    f" not {len(escrow_projects)}"
+                )
+            project_annotations_file = _download_project_annotations(
+                logger,
+                annotation_format,
+                project.cvat_id,
+            )
+            project_images = cvat_service.get_project_images(session, project.cvat_id)
 
-    logger.debug(f"Postprocessing results for the escrow ({escrow_address=})")
+        resulting_annotations_file_desc = FileDescriptor(
+            filename=RESULTING_ANNOTATIONS_FILE,
+            file=project_annotations_file,
+        )
 
-    postprocess_annotations(
-        escrow_address=escrow_address,
-        chain_id=chain_id,
-        annotations=(
-            resulting_annotations_file_desc,
-            *job_annotations.values(),
-        ),
-        merged_annotation=resulting_annotations_file_desc,
-        manifest=manifest,
-        project_images=project_images,
-    )
-    logger.debug(f"Uploading annotations for the escrow ({escrow_address=})")
+        logger.debug(f"Postprocessing results for the escrow ({escrow_address=})")
 
-    _upload_escrow_results(
-        files=(
-            resulting_annotations_file_desc,
-            *job_annotations.values(),
-            prepare_annotation_metafile(jobs=jobs),
-        ),
-        chain_id=chain_id,
-        escrow_address=escrow_address,
-    )
+        postprocess_annotations(
+            escrow_address=escrow_address,
+            chain_id=chain_id,
+            annotations=(
+                resulting_annotations_file_desc,
+                *job_annotations.values(),
+            ),
+            merged_annotation=resulting_annotations_file_desc,
+            manifest=manifest,
+            project_images=project_images,
+        )
 
-    oracle_db_service.outbox.create_webhook(
-        session,
-        escrow_address=escrow_address,
-        chain_id=chain_id,
-        type=OracleWebhookTypes.recording_oracle,
-        event=ExchangeOracleEvent_EscrowRecorded(),
-    )
+        for file_descriptor in (resulting_annotations_file_desc, *job_annotations.values()):
+            exit_stack.enter_context(closing(file_descriptor.file))
+
+        logger.debug(f"Uploading annotations for the escrow ({escrow_address=})")
+
+        _upload_escrow_results(
+            files=(
+                resulting_annotations_file_desc,
+                *job_annotations.values(),
+                prepare_annotation_metafile(jobs=jobs),
+            ),
+            chain_id=chain_id,
+            escrow_address=escrow_address,
+        )
+
+        oracle_db_service.outbox.create_webhook(
+            session,
+            escrow_address=escrow_address,
+            chain_id=chain_id,
+            type=OracleWebhookTypes.recording_oracle,
+            event=ExchangeOracleEvent_EscrowRecorded(),
+        )
 
     logger.info(
         f"The escrow ({escrow_address=}) is completed, "
@@ -169,7 +287,8 @@ def _request_escrow_validation(
     # TODO: lock escrow once there is such a DB object
     assert escrow_projects  # unused, but must hold a lock
 
-    # TODO: maybe upload only current iteration jobs
+    # The annotation meta must describe all the escrow jobs.
+    # The job annotations are exported incrementally, see handle_job_annotations_prefetching()
     jobs = cvat_service.get_jobs_by_escrow_address(session, escrow_address, chain_id)
 
     logger.debug(f"Uploading assignment info for the escrow ({escrow_address=})")
@@ -206,18 +325,21 @@ def _upload_escrow_results(
         )
     ) - {ANNOTATION_RESULTS_METAFILE_NAME, RESULTING_ANNOTATIONS_FILE}
 
-    for file_descriptor in files:
-        if file_descriptor.filename in existing_storage_files:
-            continue
-
-        storage_client.create_file(
-            compose_results_bucket_filename(
-                escrow_address,
-                chain_id,
-                file_descriptor.filename,
-            ),
-            file_descriptor.file.read(),
-        )
+    storage_client.create_files(
+        (
+            (
+                compose_results_bucket_filename(
+                    escrow_address,
+                    chain_id,
+                    file_descriptor.filename,
+                ),
+                file_descriptor.file,
+            )
+            for file_descriptor in files
+            if file_descriptor.filename not in existing_storage_files
+        ),
+        max_concurrency=Config.features.max_data_storage_connections,
+    )
 
 
 def _download_project_annotations(
@@ -244,48 +366,174 @@ def _download_project_annotations(
 
 
 def _download_job_annotations(
-    logger: logging.Logger, annotation_format: str, jobs: Sequence[Job]
+    logger: logging.Logger,
+    annotation_format: str,
+    job_exports: Sequence[_JobExport],
+    *,
+    spill_storage: SpillStorage,
+    cache: _JobAnnotationsCache,
 ) -> dict[int, FileDescriptor]:
-    # Collect raw annotations from CVAT, validate and convert them
-    # into a recording oracle suitable format
+    """
+    Collects raw annotations from CVAT. Export requests are sent for a sliding window of jobs,
+    so that CVAT can prepare the next exports while the finished ones are being downloaded.
+    The annotations of the jobs with unchanged assignments are downloaded from the cache,
+    and the new exports are added to the cache.
+    The downloaded files are kept in the spill storage.
+    """
+
+    def _request_export(job_cvat_id: int) -> str:
+        return cvat_api.request_job_annotations(job_cvat_id, format_name=annotation_format)
+
+    def _download_export(job_export: _JobExport, request_id: str) -> tuple[int, io.RawIOBase]:
+        request_ids = [request_id]
+
+        job_annotations_file = _download_with_retries(
+            logger,
+            download_callback=lambda: cvat_api.get_job_annotations(request_id=request_ids[-1]),
+            retry_callback=lambda: request_ids.append(_request_export(job_export.job_cvat_id)),
+        )
+
+        return job_export.job_cvat_id, spill_storage.store(job_annotations_file)
+
+    def _download_cached(job_export: _JobExport) -> tuple[int, io.RawIOBase]:
+        return job_export.job_cvat_id, spill_storage.store(cache.download(job_export))
+
     job_annotations: dict[int, FileDescriptor] = {}
 
-    export_ids: list[tuple[Job, str]] = []
+    def _collect_downloads(downloads: Iterable[Future[tuple[int, io.RawIOBase]]]):
+        for download in downloads:
+            job_cvat_id, job_annotations_file = download.result()
+            job_annotations[job_cvat_id].file = job_annotations_file
+
+    exported_jobs: list[_JobExport] = []
+    max_pending_exports = CronConfig.track_completed_escrows_jobs_downloading_batch_size
+    downloads: set[Future[tuple[int, io.RawIOBase]]] = set()
+    with ThreadPoolExecutor(
+        max_workers=CronConfig.track_completed_escrows_max_concurrent_downloads
+    ) as executor:
+        try:
+            for job_export in job_exports:
+                if max_pending_exports <= len(downloads):
+                    finished_downloads, downloads = wait(downloads, return_when=FIRST_COMPLETED)
+                    _collect_downloads(finished_downloads)
+
+                job_annotations[job_export.job_cvat_id] = FileDescriptor(
+                    filename=job_export.filename, file=None
+                )
+
+                if job_export in cache:
+                    downloads.add(executor.submit(_download_cached, job_export))
+                else:
+                    exported_jobs.append(job_export)
+                    downloads.add(
+                        executor.submit(
+                            _download_export, job_export, _request_export(job_export.job_cvat_id)
+                        )
+                    )
+
+            _collect_downloads(as_completed(downloads))
+        except BaseException:
+            for download in downloads:
+                download.cancel()
+
+            raise
+
+    if exported_jobs:
+        logger.debug(
+            f"Exported annotations for {len(exported_jobs)} of {len(job_exports)} jobs "
+            f"from CVAT, the other jobs are unchanged"
+        )
 
-    def _request_export(job: Job):
-        request_id = cvat_api.request_job_annotations(job.cvat_id, format_name=annotation_format)
-        export_ids.append((job, request_id))
-        return request_id
+    cache.store(
+        [(job_export, job_annotations[job_export.job_cvat_id].file) for job_export in exported_jobs]
+    )
+
+    return job_annotations
 
-    for jobs_batch in take_by(
-        jobs, count=CronConfig.track_completed_escrows_jobs_downloading_batch_size
-    ):
-        # Request jobs before downloading for faster batch downloading
-        for job in jobs_batch:
-            _request_export(job)
 
-        while export_ids:
-            (job, request_id) = export_ids.pop(0)
+def _prefetch_job_annotations(
+    logger: logging.Logger,
+    escrow_address: str,
+    chain_id: int,
+    job_exports: Sequence[_JobExport],
+    *,
+    max_jobs: int,
+) -> int:
+    """
+    Exports the annotations of the escrow jobs missing in the cache into the cache,
+    so that the final escrow export only needs to export the jobs changed
+    in the last validation iteration. Returns the number of the jobs requested from CVAT.
+    """
+
+    missing_job_exports = []
+    try:
+        cache = _JobAnnotationsCache(logger, escrow_address, chain_id)
+
+        missing_job_exports = [job_export for job_export in job_exports if job_export not in cache][
+            :max_jobs
+        ]
+        if not missing_job_exports:
+            return 0
 
-            job_annotations_file = _download_with_retries(
+        manifest = parse_manifest(get_escrow_manifest(chain_id, escrow_address))
+        annotation_format = CVAT_EXPORT_FORMAT_MAPPING[manifest.annotation.type]
+
+        logger.debug(
+            f"Prefetching annotations for {len(missing_job_exports)} jobs "
+            f"of the escrow ({escrow_address=})"
+        )
+
+        with SpillStorage(
+            max_memory_size=CronConfig.track_completed_escrows_max_memory_annotations_size
+        ) as spill_storage:
+            _download_job_annotations(
                 logger,
-                download_callback=partial(cvat_api.get_job_annotations, request_id=request_id),
-                retry_callback=partial(_request_export, job),
+                annotation_format,
+                missing_job_exports,
+                spill_storage=spill_storage,
+                cache=cache,
             )
+    except Exception:  # noqa: BLE001
+        # The annotations will be exported with the escrow results
+        logger.warning(
+            f"Failed to prefetch job annotations for the escrow ({escrow_address=})",
+            exc_info=True,
+        )
 
-            job_assignment = job.latest_assignment
-            job_annotations[job.cvat_id] = FileDescriptor(
-                filename="project_{}-task_{}-job_{}-user_{}-assignment_{}.zip".format(
-                    job.cvat_project_id,
-                    job.cvat_task_id,
-                    job.cvat_id,
-                    job_assignment.user.cvat_id,
-                    job_assignment.id,
-                ),
-                file=job_annotations_file,
+    return len(missing_job_exports)
+
+
+def handle_job_annotations_prefetching(logger: logging.Logger) -> bool:
+    """
+    Exports the job annotations of the escrows being validated into the job annotations cache.
+    The escrow jobs can't change during validation, so their annotations are final
+    for the current assignments. The number of the jobs exported per call is limited.
+
+    Returns True if the limit is reached and there can be more jobs to export.
+    """
+
+    with SessionLocal.begin() as session:
+        escrows = [
+            (escrow_validation.escrow_address, escrow_validation.chain_id)
+            for escrow_validation in cvat_service.get_escrow_validations_by_status(
+                session, EscrowValidationStatuses.in_progress
             )
+        ]
 
-    return job_annotations
+    max_jobs = CronConfig.prefetch_job_annotations_max_jobs
+    for escrow_address, chain_id in escrows:
+        with SessionLocal.begin() as session:
+            job_exports = _prepare_job_exports(
+                cvat_service.get_jobs_by_escrow_address(session, escrow_address, chain_id)
+            )
+
+        max_jobs -= _prefetch_job_annotations(
+            logger, escrow_address, chain_id, job_exports, max_jobs=max_jobs
+        )
+        if max_jobs <= 0:
+            return True
+
+    return False
 
 
 def _handle_escrow_validation(
@@ -8,6 +8,7 @@ from cvat_sdk.api_client.exceptions import NotFoundException
 
 import src.cvat.api_calls as cvat_api
 import src.services.cloud as cloud_service
+from src.chain.escrow import invalidate_escrow_manifest
 from src.core.config import Config
 from src.core.storage import compose_data_bucket_prefix, compose_results_bucket_prefix
 from src.log import get_logger_name
@@ -100,5 +101,6 @@ def cleanup_escrow(
     finally:
         # in case both _cleanup_cvat and _cleanup_storage raise an exception,
         # both will be in the traceback
+        invalidate_escrow_manifest(chain_id, escrow_address)
         _cleanup_storage(escrow_address, chain_id)
         _cleanup_db(session, escrow_address, chain_id)
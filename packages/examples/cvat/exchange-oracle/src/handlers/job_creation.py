@@ -1,26 +1,28 @@
 from __future__ import annotations
 
+import hashlib
 import math
 import os
 import random
+import secrets
 import uuid
 from abc import ABCMeta, abstractmethod
-from concurrent.futures import Future, ThreadPoolExecutor
-from contextlib import ExitStack
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, suppress
+from dataclasses import dataclass, field, replace
+from functools import partial
 from itertools import chain, groupby
 from math import ceil
 from pathlib import Path
-from queue import Queue
 from tempfile import TemporaryDirectory
-from time import sleep
-from typing import TYPE_CHECKING, TypeVar, cast
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, cast
 
 import cv2
 import datumaro as dm
 import numpy as np
-from datumaro.util import filter_dict, take_by
-from datumaro.util.annotation_util import BboxCoords, bbox_iou
+from cvat_sdk.api_client.exceptions import NotFoundException
+from datumaro.util import dump_json, filter_dict, parse_json, take_by
 from datumaro.util.image import IMAGE_EXTENSIONS, decode_image, encode_image
 
 import src.core.tasks.boxes_from_points as boxes_from_points_task
@@ -34,21 +36,34 @@ from src.chain.escrow import get_escrow_manifest
 from src.core.config import Config
 from src.core.storage import compose_data_bucket_filename, compose_data_bucket_prefix
 from src.core.types import CvatLabelTypes, TaskStatuses, TaskTypes
+from src.cvat import request_waiter
 from src.db import SessionLocal
 from src.log import ROOT_LOGGER_NAME
 from src.models.cvat import Project
 from src.services.cloud import CloudProviders, StorageClient
 from src.services.cloud.utils import BucketAccessInfo
-from src.utils.annotations import InstanceSegmentsToBbox, ProjectLabels, is_point_in_bbox
+from src.utils.annotations import (
+    InstanceSegmentsToBbox,
+    ProjectLabels,
+    find_unambiguous_matches,
+    is_point_in_bbox,
+    match_overlapping_boxes,
+    match_points_in_boxes,
+)
 from src.utils.assignments import parse_manifest
+from src.utils.coco import COCO_INSTANCES_FORMAT, try_parse_coco_instances
+from src.utils.disk_cache import DiskCache
 from src.utils.logging import NullLogger, format_sequence, get_function_logger
-from src.utils.roi_uploader import BufferedRoiImageUploader
+from src.utils.roi_pipeline import RoiExtractionPipeline
 from src.utils.zip_archive import write_dir_to_zip_archive
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Sequence
+    from collections.abc import Callable, Generator, Iterable, Sequence
     from logging import Logger
 
+    from cvat_sdk.api_client import models
+    from datumaro.util.annotation_util import BboxCoords
+
     from src.core.manifest import TaskManifest
 
 module_logger = f"{ROOT_LOGGER_NAME}.cron.cvat"
@@ -147,6 +162,104 @@ class _ExcludedAnnotationsInfo:
         )
 
 
+TASK_CREATION_CHECKPOINT_FILENAME = "task_creation_checkpoint.json"
+
+
+@dataclass
+class _TaskCreationCheckpoint:
+    """
+    Task creation progress for an escrow. It is kept in the oracle bucket until the task
+    creation is finished and allows a retried task creation to continue from the last
+    completed stage instead of starting from scratch.
+    """
+
+    VERSION: ClassVar[int] = 1
+
+    seed: int = field(default_factory=lambda: secrets.randbits(64))
+    "Makes the random choices reproducible in retries, such as RoI filenames and task splits"
+
+    completed_stages: list[str] = field(default_factory=list)
+
+    cvat_objects: dict[str, int] = field(default_factory=dict)
+    "Created CVAT objects, '<object type>:<key>' -> CVAT id"
+
+    configured_cvat_tasks: dict[str, str] = field(default_factory=dict)
+    "CVAT tasks with the data and validation set up, '<object type>:<key>' -> initial status"
+
+    @staticmethod
+    def _get_filename(escrow_address: str, chain_id: int) -> str:
+        return compose_data_bucket_filename(
+            escrow_address, chain_id, TASK_CREATION_CHECKPOINT_FILENAME
+        )
+
+    @classmethod
+    def load(
+        cls,
+        storage_client: StorageClient,
+        escrow_address: str,
+        chain_id: int,
+        *,
+        logger: Logger,
+    ) -> _TaskCreationCheckpoint | None:
+        filename = cls._get_filename(escrow_address, chain_id)
+        if not storage_client.file_exists(filename):
+            return None
+
+        data = storage_client.download_file(filename)
+        try:
+            parsed_data = parse_json(data)
+            if parsed_data.get("version") == cls.VERSION:
+                return cls(
+                    seed=int(parsed_data["seed"]),
+                    completed_stages=list(parsed_data["completed_stages"]),
+                    cvat_objects=dict(parsed_data["cvat_objects"]),
+                    configured_cvat_tasks=dict(parsed_data["configured_cvat_tasks"]),
+                )
+
+            error = f"unsupported version {parsed_data.get('version')}"
+        except Exception as e:  # noqa: BLE001
+            error = e
+
+        # Can't continue from an unknown state, the task creation will start anew
+        logger.warning(
+            "Ignoring invalid task creation checkpoint for escrow '%s': %s", escrow_address, error
+        )
+        return None
+
+    def save(self, storage_client: StorageClient, escrow_address: str, chain_id: int) -> None:
+        storage_client.create_file(
+            self._get_filename(escrow_address, chain_id),
+            dump_json(
+                {
+                    "version": self.VERSION,
+                    "seed": self.seed,
+                    "completed_stages": self.completed_stages,
+                    "cvat_objects": self.cvat_objects,
+                    "configured_cvat_tasks": self.configured_cvat_tasks,
+                }
+            ),
+        )
+
+    @classmethod
+    def remove(cls, storage_client: StorageClient, escrow_address: str, chain_id: int) -> None:
+        storage_client.remove_file(cls._get_filename(escrow_address, chain_id))
+
+
+@dataclass(frozen=True)
+class _CvatTaskSpec:
+    key: str
+    "A unique key of the task in the escrow, the same in task creation retries"
+
+    project_id: int
+    name: str
+
+    put_data: Callable[[int], None]
+    "Starts the task data uploading, receives the task id"
+
+    setup: Callable[[int], None]
+    "Configures the task after the data is uploaded, receives the task id"
+
+
 class _TaskBuilderBase(metaclass=ABCMeta):
     def __init__(self, manifest: TaskManifest, escrow_address: str, chain_id: int) -> None:
         self.exit_stack = ExitStack()
@@ -158,6 +271,11 @@ class _TaskBuilderBase(metaclass=ABCMeta):
 
         self._oracle_data_bucket = BucketAccessInfo.parse_obj(Config.storage_config)
 
+        self._checkpoint: _MaybeUnset[_TaskCreationCheckpoint] = _unset
+
+        self._dataset_lock = Lock()
+        "Datumaro datasets are not thread-safe, the lock is used for concurrent task setup"
+
     @property
     def _task_segment_size(self) -> int:
         return self.manifest.annotation.job_size
@@ -184,6 +302,153 @@ class _TaskBuilderBase(metaclass=ABCMeta):
         self.logger = logger
         return self
 
+    def _get_checkpoint(self) -> _TaskCreationCheckpoint:
+        if self._checkpoint is _unset:
+            checkpoint = _TaskCreationCheckpoint.load(
+                self._make_cloud_storage_client(self._oracle_data_bucket),
+                self.escrow_address,
+                self.chain_id,
+                logger=self.logger,
+            )
+            if checkpoint:
+                self.logger.info(
+                    "Task creation for escrow '%s': continuing from the checkpoint, "
+                    "completed stages: %s",
+                    self.escrow_address,
+                    format_sequence(checkpoint.completed_stages),
+                )
+            else:
+                checkpoint = _TaskCreationCheckpoint()
+
+            self._checkpoint = checkpoint
+
+        return self._checkpoint
+
+    def _save_checkpoint(self) -> None:
+        self._get_checkpoint().save(
+            self._make_cloud_storage_client(self._oracle_data_bucket),
+            self.escrow_address,
+            self.chain_id,
+        )
+
+    def _run_stage(self, stage: str, fn: Callable[[], None]) -> None:
+        "Runs the stage, unless it was completed in a previous task creation attempt"
+        checkpoint = self._get_checkpoint()
+        if stage in checkpoint.completed_stages:
+            return
+
+        fn()
+
+        checkpoint.completed_stages.append(stage)
+        self._save_checkpoint()
+
+    def _get_random(self, key: str) -> random.Random:
+        "Returns a random generator, which produces the same values in task creation retries"
+        return random.Random(f"{self._get_checkpoint().seed}:{key}")  # noqa: S311
+
+    def _make_mangled_filename(self, key: int | str) -> str:
+        "Returns a random-looking filename, which is the same in task creation retries"
+        digest = hashlib.sha256(f"{self._get_checkpoint().seed}:{key}".encode()).digest()
+        return str(uuid.UUID(bytes=digest[:16], version=4))
+
+    def _get_or_create_cvat_object(
+        self, key: str, create: Callable[..., Any], *args, **kwargs
+    ) -> int:
+        """
+        Returns the id of the CVAT object created in this or previous task creation attempts
+        or creates a new object by calling create(*args, **kwargs).
+
+        key - '<object type>:<key>', where the object type is 'cloudstorage', 'project',
+            'webhook' or 'task'
+        """
+
+        checkpoint = self._get_checkpoint()
+        object_id = checkpoint.cvat_objects.get(key)
+        if object_id is None:
+            object_id = create(*args, **kwargs).id
+            checkpoint.cvat_objects[key] = object_id
+            self._save_checkpoint()
+
+        return object_id
+
+    def _provision_cvat_tasks(
+        self, tasks: Sequence[_CvatTaskSpec], *, segment_size: int
+    ) -> list[tuple[int, TaskStatuses]]:
+        """
+        Creates and configures CVAT tasks, reusing the tasks configured in previous
+        task creation attempts. A task that was not configured completely is recreated.
+
+        If concurrent task setup is enabled, the data uploading is started for all the tasks
+        first, then the tasks are configured in parallel, as soon as the data is uploaded.
+
+        Returns the ids and the initial statuses of the tasks.
+        """
+
+        checkpoint = self._get_checkpoint()
+        checkpoint_lock = Lock()
+
+        def _start_task_creation(task: _CvatTaskSpec) -> models.TaskRead:
+            key = f"task:{task.key}"
+
+            if (task_id := checkpoint.cvat_objects.pop(key, None)) is not None:
+                with suppress(NotFoundException):
+                    cvat_api.delete_task(task_id)
+
+            cvat_task = cvat_api.create_task(task.project_id, task.name, segment_size=segment_size)
+            checkpoint.cvat_objects[key] = cvat_task.id
+            self._save_checkpoint()
+
+            task.put_data(cvat_task.id)
+            return cvat_task
+
+        def _finish_task_creation(task: _CvatTaskSpec, cvat_task: models.TaskRead) -> None:
+            task.setup(cvat_task.id)
+
+            with checkpoint_lock:
+                checkpoint.configured_cvat_tasks[f"task:{task.key}"] = cvat_task.status
+                self._save_checkpoint()
+
+        new_tasks = [
+            task for task in tasks if f"task:{task.key}" not in checkpoint.configured_cvat_tasks
+        ]
+        if len(new_tasks) < len(tasks):
+            self.logger.info(
+                "Task creation for escrow '%s': %s of %s CVAT tasks are already created",
+                self.escrow_address,
+                len(tasks) - len(new_tasks),
+                len(tasks),
+            )
+
+        max_workers = Config.cvat_config.max_concurrent_task_setups
+        if max_workers <= 1:
+            for task in new_tasks:
+                _finish_task_creation(task, _start_task_creation(task))
+        else:
+            started_tasks = [(task, _start_task_creation(task)) for task in new_tasks]
+
+            with ThreadPoolExecutor(max_workers) as pool:
+                futures = [
+                    pool.submit(_finish_task_creation, task, cvat_task)
+                    for task, cvat_task in started_tasks
+                ]
+
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        results = []
+        for task in tasks:
+            key = f"task:{task.key}"
+            results.append(
+                (checkpoint.cvat_objects[key], TaskStatuses[checkpoint.configured_cvat_tasks[key]])
+            )
+
+        return results
+
     @classmethod
     def _make_cloud_storage_client(cls, bucket_info: BucketAccessInfo) -> StorageClient:
         extra_args = {}
@@ -212,12 +477,20 @@ class _TaskBuilderBase(metaclass=ABCMeta):
     def _wait_task_creation(self, task_id: int) -> cvat_api.RequestStatus:
         # TODO: add a timeout or
         # save gt datasets in the oracle bucket and upload in track_task_creation()
-        while True:
+        def _check_task_status() -> cvat_api.RequestStatus | None:
             task_status, _ = cvat_api.get_task_upload_status(task_id)
             if task_status not in [cvat_api.RequestStatus.STARTED, cvat_api.RequestStatus.QUEUED]:
                 return task_status
 
-            sleep(Config.cvat_config.task_creation_check_interval)
+            return None
+
+        return (
+            request_waiter.get_waiter()
+            .wait_for(
+                _check_task_status, max_interval=Config.cvat_config.task_creation_check_interval
+            )
+            .result()
+        )
 
     def _setup_gt_job_for_cvat_task(
         self, task_id: int, gt_dataset: dm.Dataset, *, dm_export_format: str = "coco"
@@ -234,7 +507,10 @@ class _TaskBuilderBase(metaclass=ABCMeta):
 
         with TemporaryDirectory() as tmp_dir:
             export_dir = Path(tmp_dir) / "export"
-            gt_dataset.export(save_dir=str(export_dir), save_images=False, format=dm_export_format)
+            with self._dataset_lock:
+                gt_dataset.export(
+                    save_dir=str(export_dir), save_images=False, format=dm_export_format
+                )
 
             annotations_archive_path = Path(tmp_dir) / "annotations.zip"
             with annotations_archive_path.open("wb") as annotations_archive:
@@ -266,13 +542,105 @@ class _TaskBuilderBase(metaclass=ABCMeta):
         values.update(**overrides)
         cvat_api.update_quality_control_settings(settings.id, **values)
 
+    def _run_roi_extraction(
+        self,
+        source_images: Iterable[_RoiSourceImage],
+        *,
+        renderer: _RoiImageRendererBase,
+        src_bucket: BucketAccessInfo,
+        dst_bucket: BucketAccessInfo,
+    ) -> None:
+        src_prefix = src_bucket.path
+        src_client = self._make_cloud_storage_client(src_bucket)
+        dst_client = self._make_cloud_storage_client(dst_bucket)
+
+        # The RoI filenames depend on the checkpoint, it must be available in retries
+        self._save_checkpoint()
+
+        # Skip the RoIs uploaded in the previous task creation attempts
+        uploaded_roi_filenames = set(
+            dst_client.list_files(
+                prefix=compose_data_bucket_prefix(self.escrow_address, self.chain_id),
+                trim_prefix=True,
+            )
+        )
+        if uploaded_roi_filenames:
+            self.logger.info(
+                "RoI extraction for escrow '%s': %s files are already uploaded",
+                self.escrow_address,
+                len(uploaded_roi_filenames),
+            )
+
+            source_images = (
+                replace(
+                    source_image,
+                    rois=[
+                        (roi, roi_filename)
+                        for roi, roi_filename in source_image.rois
+                        if roi_filename not in uploaded_roi_filenames
+                    ],
+                )
+                for source_image in source_images
+            )
+            source_images = (source_image for source_image in source_images if source_image.rois)
+
+        source_cache = None
+        if Config.features.source_data_cache_dir:
+            source_cache = DiskCache(
+                Config.features.source_data_cache_dir,
+                max_size=Config.features.source_data_cache_max_size,
+            )
+
+        def download_image(source_image: _RoiSourceImage) -> memoryview:
+            key = os.path.join(src_prefix, source_image.filename)
+            if not source_cache:
+                return src_client.download_file_buffer(key)
+
+            # The file version is checked on each access, as the bucket contents can change.
+            # The cached version tag is sent with the download request,
+            # so the file is only downloaded if it's missing in the cache or changed.
+            cache_key = (
+                f"{src_bucket.provider.name}/{src_bucket.host_url}/{src_bucket.bucket_name}/{key}"
+            )
+            cached_data, cached_etag = source_cache.get_with_tag(cache_key) or (None, None)
+
+            data, etag = src_client.download_file_buffer_if_changed(key, etag=cached_etag)
+            if data is None:
+                return cached_data
+
+            source_cache.put(cache_key, data, tag=etag)
+            return data
+
+        def upload_roi(roi_filename: str, roi_bytes: bytes) -> None:
+            dst_client.create_file(
+                compose_data_bucket_filename(self.escrow_address, self.chain_id, roi_filename),
+                roi_bytes,
+            )
+
+        pool_size = Config.features.max_data_storage_connections
+        pipeline = RoiExtractionPipeline(
+            download_workers=pool_size,
+            upload_workers=pool_size,
+            processing_workers=Config.features.max_roi_processing_workers,
+            download_buffer_size=Config.features.max_roi_download_buffer_size,
+        )
+        stats = pipeline.run(
+            source_images,
+            download=download_image,
+            decode=decode_image,
+            process=renderer.render_rois,
+            upload=upload_roi,
+        )
+
+        self.logger.info("RoI extraction for escrow '%s' finished: %s", self.escrow_address, stats)
+
     def _split_dataset_per_task(
         self,
         data_filenames: list[str],
         *,
         subset_size: int,
     ) -> Generator[str]:
-        random.shuffle(data_filenames)
+        self._get_random("task_split").shuffle(data_filenames)
         yield from take_by(data_filenames, subset_size)
 
     @abstractmethod
@@ -297,35 +665,40 @@ class SimpleTaskBuilder(_TaskBuilderBase):
         )
 
         storage_client = self._make_cloud_storage_client(self._oracle_data_bucket)
-        for file_data, filename in file_list:
-            storage_client.create_file(
-                compose_data_bucket_filename(self.escrow_address, self.chain_id, filename),
-                file_data,
-            )
+        storage_client.create_files(
+            (
+                (compose_data_bucket_filename(self.escrow_address, self.chain_id, filename), data)
+                for data, filename in file_list
+            ),
+            max_concurrency=Config.features.max_data_storage_connections,
+        )
 
     def _parse_gt_dataset(
         self, gt_file_data: bytes, *, add_prefix: str | None = None
     ) -> dm.Dataset:
-        with TemporaryDirectory() as gt_temp_dir:
-            gt_filename = os.path.join(gt_temp_dir, "gt_annotations.json")
-            with open(gt_filename, "wb") as f:
-                f.write(gt_file_data)
+        gt_format = DM_GT_DATASET_FORMAT_MAPPING[self.manifest.annotation.type]
 
-            gt_dataset = dm.Dataset.import_from(
-                gt_filename,
-                format=DM_GT_DATASET_FORMAT_MAPPING[self.manifest.annotation.type],
-            )
+        gt_dataset = None
+        if gt_format == COCO_INSTANCES_FORMAT:
+            gt_dataset = try_parse_coco_instances(gt_file_data)
 
-            if add_prefix:
-                gt_dataset = dm.Dataset.from_iterable(
-                    [s.wrap(id=os.path.join(add_prefix, s.id)) for s in gt_dataset],
-                    categories=gt_dataset.categories(),
-                    media_type=gt_dataset.media_type(),
-                )
+        if gt_dataset is None:
+            with TemporaryDirectory() as gt_temp_dir:
+                gt_filename = os.path.join(gt_temp_dir, "gt_annotations.json")
+                with open(gt_filename, "wb") as f:
+                    f.write(gt_file_data)
 
-            gt_dataset.init_cache()
+                gt_dataset = dm.Dataset.import_from(gt_filename, format=gt_format)
+                gt_dataset.init_cache()
 
-            return gt_dataset
+        if add_prefix:
+            gt_dataset = dm.Dataset.from_iterable(
+                [s.wrap(id=os.path.join(add_prefix, s.id)) for s in gt_dataset],
+                categories=gt_dataset.categories(),
+                media_type=gt_dataset.media_type(),
+            )
+
+        return gt_dataset
 
     def _get_gt_filenames(
         self, gt_dataset: dm.Dataset, data_filenames: list[str], *, manifest: TaskManifest
@@ -375,20 +748,28 @@ class SimpleTaskBuilder(_TaskBuilderBase):
         data_to_be_annotated = [f for f in data_filenames if f not in set(gt_filenames)]
         label_configuration = make_label_configuration(manifest)
 
-        self._upload_task_meta(gt_dataset)
+        self._run_stage("task_meta_upload", lambda: self._upload_task_meta(gt_dataset))
 
         # Register cloud storage on CVAT to pass user dataset
-        cloud_storage = cvat_api.create_cloudstorage(**_make_cvat_cloud_storage_params(data_bucket))
+        cloud_storage_id = self._get_or_create_cvat_object(
+            "cloudstorage:",
+            cvat_api.create_cloudstorage,
+            **_make_cvat_cloud_storage_params(data_bucket),
+        )
 
         # Create a project
-        cvat_project = cvat_api.create_project(
+        cvat_project_id = self._get_or_create_cvat_object(
+            "project:",
+            cvat_api.create_project,
             escrow_address,
             labels=label_configuration,
             user_guide=manifest.annotation.user_guide,
         )
 
         # Setup webhooks for a project (update:task, update:job)
-        cvat_webhook = cvat_api.create_cvat_webhook(cvat_project.id)
+        cvat_webhook_id = self._get_or_create_cvat_object(
+            "webhook:", cvat_api.create_cvat_webhook, cvat_project_id
+        )
 
         with SessionLocal.begin() as session:
             segment_size = self._task_segment_size
@@ -405,35 +786,24 @@ class SimpleTaskBuilder(_TaskBuilderBase):
 
             project_id = db_service.create_project(
                 session,
-                cvat_project.id,
-                cloud_storage.id,
+                cvat_project_id,
+                cloud_storage_id,
                 manifest.annotation.type,
                 escrow_address,
                 chain_id,
                 data_bucket.to_url(),
-                cvat_webhook_id=cvat_webhook.id,
+                cvat_webhook_id=cvat_webhook_id,
             )
 
             db_service.get_project_by_id(session, project_id, for_update=True)  # lock the row
-            db_service.add_project_images(session, cvat_project.id, data_filenames)
-
-            for data_subset in self._split_dataset_per_task(
-                data_to_be_annotated,
-                subset_size=Config.cvat_config.max_jobs_per_task * segment_size,
-            ):
-                cvat_task = cvat_api.create_task(
-                    cvat_project.id, escrow_address, segment_size=segment_size
-                )
-                task_id = db_service.create_task(
-                    session, cvat_task.id, cvat_project.id, TaskStatuses[cvat_task.status]
-                )
-                db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
+            db_service.add_project_images(session, cvat_project_id, data_filenames)
 
+            def _put_task_data(cvat_task_id: int, *, filenames: list[str]) -> None:
                 # The task is fully created once 'update:task' webhook is received.
                 cvat_api.put_task_data(
-                    cvat_task.id,
-                    cloud_storage.id,
-                    filenames=data_subset,
+                    cvat_task_id,
+                    cloud_storage_id,
+                    filenames=filenames,
                     chunk_size=self._task_chunk_size,
                     validation_params={
                         "gt_filenames": gt_filenames,  # include whole GT dataset into each task
@@ -441,10 +811,36 @@ class SimpleTaskBuilder(_TaskBuilderBase):
                     },
                 )
 
-                self._setup_gt_job_for_cvat_task(cvat_task.id, gt_dataset)
-                self._setup_quality_settings(cvat_task.id)
+            def _setup_task(cvat_task_id: int) -> None:
+                self._setup_gt_job_for_cvat_task(cvat_task_id, gt_dataset)
+                self._setup_quality_settings(cvat_task_id)
+
+            cvat_tasks = self._provision_cvat_tasks(
+                [
+                    _CvatTaskSpec(
+                        key=str(subset_index),
+                        project_id=cvat_project_id,
+                        name=escrow_address,
+                        put_data=partial(_put_task_data, filenames=data_subset),
+                        setup=_setup_task,
+                    )
+                    for subset_index, data_subset in enumerate(
+                        self._split_dataset_per_task(
+                            data_to_be_annotated,
+                            subset_size=Config.cvat_config.max_jobs_per_task * segment_size,
+                        )
+                    )
+                ],
+                segment_size=segment_size,
+            )
+
+            for cvat_task_id, cvat_task_status in cvat_tasks:
+                task_id = db_service.create_task(
+                    session, cvat_task_id, cvat_project_id, cvat_task_status
+                )
+                db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
 
-                db_service.create_data_upload(session, cvat_task.id)
+                db_service.create_data_upload(session, cvat_task_id)
             db_service.touch(session, Project, [project_id])
 
 
@@ -504,11 +900,13 @@ class PointsTaskBuilder(SimpleTaskBuilder):
         )
 
         storage_client = self._make_cloud_storage_client(self._oracle_data_bucket)
-        for file_data, filename in file_list:
-            storage_client.create_file(
-                compose_data_bucket_filename(self.escrow_address, self.chain_id, filename),
-                file_data,
-            )
+        storage_client.create_files(
+            (
+                (compose_data_bucket_filename(self.escrow_address, self.chain_id, filename), data)
+                for data, filename in file_list
+            ),
+            max_concurrency=Config.features.max_data_storage_connections,
+        )
 
     def _setup_gt_job_for_cvat_task(
         self, task_id: int, gt_dataset: dm.Dataset, *, dm_export_format: str = "datumaro"
@@ -566,6 +964,144 @@ class PolygonTaskBuilder(SimpleTaskBuilder):
         super()._setup_quality_settings(task_id, **values)
 
 
+_RoiT = TypeVar("_RoiT")
+
+
+@dataclass(frozen=True)
+class _RoiSourceImage(Generic[_RoiT]):
+    filename: str
+    "Source image filename, relative to the data bucket prefix"
+
+    image_size: tuple[int, int]
+    "Expected image size, (h, w)"
+
+    rois: Sequence[tuple[_RoiT, str]]
+    "RoIs to be extracted from the image and the corresponding RoI filenames"
+
+
+@dataclass(frozen=True)
+class _RoiImageRendererBase(Generic[_RoiT], metaclass=ABCMeta):
+    """
+    Extracts and encodes RoI images from a source image.
+
+    The renderers only keep simple rendering parameters, so that they can be sent
+    to and used in a separate process.
+    """
+
+    roi_background_color: tuple[int, int, int]
+
+    def extract_roi(
+        self,
+        source_pixels: np.ndarray,
+        roi_info: boxes_from_points_task.RoiInfo | skeletons_from_boxes_task.RoiInfo,
+    ) -> np.ndarray:
+        img_h, img_w, *_ = source_pixels.shape
+
+        roi_pixels = source_pixels[
+            max(0, roi_info.roi_y) : min(img_h, roi_info.roi_y + roi_info.roi_h),
+            max(0, roi_info.roi_x) : min(img_w, roi_info.roi_x + roi_info.roi_w),
+        ]
+
+        if not (
+            (0 <= roi_info.roi_x < roi_info.roi_x + roi_info.roi_w < img_w)
+            and (0 <= roi_info.roi_y < roi_info.roi_y + roi_info.roi_h < img_h)
+        ):
+            # Coords can be outside the original image
+            # In this case a border should be added to RoI, so that the image was centered on bbox
+            wrapped_roi_pixels = np.zeros((roi_info.roi_h, roi_info.roi_w, 3), dtype=np.float32)
+            wrapped_roi_pixels[:, :] = self.roi_background_color
+
+            dst_y = max(-roi_info.roi_y, 0)
+            dst_x = max(-roi_info.roi_x, 0)
+            wrapped_roi_pixels[
+                dst_y : dst_y + roi_pixels.shape[0],
+                dst_x : dst_x + roi_pixels.shape[1],
+            ] = roi_pixels
+
+            roi_pixels = wrapped_roi_pixels
+        else:
+            roi_pixels = roi_pixels.copy()
+
+        return roi_pixels
+
+    @abstractmethod
+    def render_roi(self, source_pixels: np.ndarray, roi: _RoiT) -> np.ndarray: ...
+
+    def render_rois(
+        self, source_image: _RoiSourceImage[_RoiT], image_pixels: np.ndarray
+    ) -> list[tuple[str, bytes]]:
+        """
+        Produces encoded RoI images for the source image.
+
+        Returns: a list of (RoI filename, RoI image bytes) pairs
+        """
+
+        if tuple(source_image.image_size) != tuple(image_pixels.shape[:2]):
+            # TODO: maybe rois should be regenerated instead
+            # Option 2: accumulate errors, fail when some threshold is reached
+            # Option 3: add special handling for cases when image is only rotated (exif etc.)
+            raise InvalidImageInfo(
+                f"Sample '{source_image.filename}': "
+                "invalid size provided in the point annotations"
+            )
+
+        image_rois = []
+        for roi, roi_filename in source_image.rois:
+            roi_pixels = self.render_roi(image_pixels, roi)
+            roi_bytes = encode_image(roi_pixels, os.path.splitext(roi_filename)[-1])
+            image_rois.append((roi_filename, roi_bytes))
+
+        return image_rois
+
+
+@dataclass(frozen=True)
+class _PointRoiImageRenderer(_RoiImageRendererBase[boxes_from_points_task.RoiInfo]):
+    embed_point_in_roi_image: bool
+    embedded_point_radius: int
+    min_embedded_point_radius_percent: float
+    max_embedded_point_radius_percent: float
+    embedded_point_color: tuple[int, int, int]
+
+    def draw_roi_point(
+        self, roi_pixels: np.ndarray, roi_info: boxes_from_points_task.RoiInfo
+    ) -> np.ndarray:
+        center = (roi_info.point_x, roi_info.point_y)
+
+        roi_r = (roi_info.roi_w**2 + roi_info.roi_h**2) ** 0.5 / 2
+        point_size = int(
+            min(
+                self.max_embedded_point_radius_percent * roi_r,
+                max(self.embedded_point_radius, self.min_embedded_point_radius_percent * roi_r),
+            )
+        )
+
+        roi_pixels = roi_pixels.copy()
+        roi_pixels = cv2.circle(
+            roi_pixels,
+            center,
+            point_size + 1,
+            (255, 255, 255),
+            cv2.FILLED,
+        )
+        return cv2.circle(
+            roi_pixels,
+            center,
+            point_size,
+            self.embedded_point_color,
+            cv2.FILLED,
+        )
+
+    def render_roi(
+        self, source_pixels: np.ndarray, roi: boxes_from_points_task.RoiInfo
+    ) -> np.ndarray:
+        roi_pixels = self.extract_roi(source_pixels, roi)
+
+        if self.embed_point_in_roi_image:
+            roi_pixels = self.draw_roi_point(roi_pixels, roi)
+
+        return roi_pixels
+
+
 class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
     def __init__(self, manifest: TaskManifest, escrow_address: str, chain_id: int) -> None:
         super().__init__(manifest=manifest, escrow_address=escrow_address, chain_id=chain_id)
@@ -585,7 +1121,7 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         self._roi_size_estimations: _MaybeUnset[dict[int, tuple[float, float]]] = _unset
         "label_id -> (rel. w, rel. h)"
 
-        self._rois: _MaybeUnset[boxes_from_points_task.RoiInfos] = _unset
+        self._rois: _MaybeUnset[boxes_from_points_task.RoiInfoTable] = _unset
         self._roi_filenames: _MaybeUnset[boxes_from_points_task.RoiFilenames] = _unset
         self._roi_filenames_to_be_annotated: _MaybeUnset[Sequence[str]] = _unset
         self._gt_roi_filenames: _MaybeUnset[Sequence[str]] = _unset
@@ -951,60 +1487,50 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         self._validate_points_filenames()
         self._validate_points_annotations()
 
-    @staticmethod
-    def _is_point_in_bbox(px: float, py: float, bbox: dm.Bbox) -> bool:
-        return is_point_in_bbox(px, py, bbox)
-
     def _prepare_gt(self):
         def _find_unambiguous_matches(
             input_skeletons: list[dm.Skeleton],
             gt_boxes: list[dm.Bbox],
         ) -> list[tuple[dm.Skeleton, dm.Bbox]]:
-            matches = [
-                [
-                    (input_skeleton.label == gt_bbox.label)
-                    and (
-                        self._is_point_in_bbox(
-                            *input_skeleton.elements[0].points[0:2], bbox=gt_bbox
-                        )
-                    )
-                    for gt_bbox in gt_boxes
+            skeleton_labels = np.array([s.label for s in input_skeletons], dtype=int)
+            skeleton_points = np.array(
+                [s.elements[0].points[0:2] for s in input_skeletons], dtype=float
+            ).reshape(-1, 2)
+            gt_labels = np.array([b.label for b in gt_boxes], dtype=int)
+            gt_coords = np.array([b.get_bbox() for b in gt_boxes], dtype=float).reshape(-1, 4)
+
+            matching = find_unambiguous_matches(
+                (skeleton_labels[:, np.newaxis] == gt_labels)
+                & match_points_in_boxes(skeleton_points, gt_coords)
+            )
+
+            for skeleton_idx in np.flatnonzero(matching.row_match_counts > 1):
+                # Handle ambiguous matches
+                input_skeleton = input_skeletons[skeleton_idx]
+                matched_boxes = [
+                    gt_boxes[j] for j in np.flatnonzero(matching.matches[skeleton_idx])
                 ]
-                for input_skeleton in input_skeletons
-            ]
-
-            ambiguous_boxes: list[int] = set()
-            ambiguous_skeletons: list[int] = set()
-            for skeleton_idx, input_skeleton in enumerate(input_skeletons):
-                matched_boxes: list[dm.Bbox] = [
-                    gt_boxes[j] for j in range(len(gt_boxes)) if matches[skeleton_idx][j]
-                ]
-
-                if len(matched_boxes) > 1:
-                    # Handle ambiguous matches
-                    excluded_points_info.add_message(
-                        "Sample '{}': point #{} ({}) and overlapping boxes skipped - "
-                        "too many matching boxes ({}) found".format(
-                            points_sample.id,
-                            input_skeleton.id,
-                            points_label_cat[input_skeleton.label].name,
-                            format_sequence([f"#{a.id}" for a in matched_boxes]),
-                        ),
-                        sample_id=points_sample.id,
-                        sample_subset=points_sample.subset,
-                    )
-                    # not an error, should not be counted as excluded for an error
-                    ambiguous_skeletons.add(input_skeleton.id)
-                    ambiguous_boxes.update(a.id for a in matched_boxes)
-                    continue
+                excluded_points_info.add_message(
+                    "Sample '{}': point #{} ({}) and overlapping boxes skipped - "
+                    "too many matching boxes ({}) found".format(
+                        points_sample.id,
+                        input_skeleton.id,
+                        points_label_cat[input_skeleton.label].name,
+                        format_sequence([f"#{a.id}" for a in matched_boxes]),
+                    ),
+                    sample_id=points_sample.id,
+                    sample_subset=points_sample.subset,
+                )
+                # not an error, should not be counted as excluded for an error
 
             for gt_idx, gt_bbox in enumerate(gt_boxes):
-                matched_skeletons: list[dm.Skeleton] = [
-                    input_skeletons[i] for i in range(len(input_skeletons)) if matches[i][gt_idx]
-                ]
+                matched_count = matching.col_match_counts[gt_idx]
 
-                if len(matched_skeletons) > 1:
+                if matched_count > 1:
                     # Handle ambiguous matches
+                    matched_skeletons = [
+                        input_skeletons[i] for i in np.flatnonzero(matching.matches[:, gt_idx])
+                    ]
                     excluded_gt_info.add_message(
                         "Sample '{}': GT bbox #{} ({}) and overlapping points skipped - "
                         "too many matching points ({}) found".format(
@@ -1017,10 +1543,8 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
                         sample_subset=gt_sample.subset,
                     )
                     # not an error, should not be counted as excluded for an error
-                    ambiguous_boxes.add(gt_bbox.id)
-                    ambiguous_skeletons.update(a.id for a in matched_skeletons)
                     continue
-                if not matched_skeletons:
+                if not matched_count:
                     # Handle unmatched skeletons
                     excluded_gt_info.add_message(
                         "Sample '{}': GT bbox #{} ({}) skipped - "
@@ -1035,24 +1559,10 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
                     excluded_gt_info.excluded_count += 1  # an error
                     continue
 
-            unambiguous_matches: list[tuple[dm.Bbox, dm.Skeleton]] = []
-            for skeleton_idx, input_skeleton in enumerate(input_skeletons):
-                if input_skeleton.id in ambiguous_skeletons:
-                    continue
-
-                matched_bbox = None
-                for gt_idx, gt_bbox in enumerate(gt_boxes):
-                    if gt_bbox.id in ambiguous_boxes:
-                        continue
-
-                    if matches[skeleton_idx][gt_idx]:
-                        matched_bbox = gt_bbox
-                        break
-
-                if matched_bbox:
-                    unambiguous_matches.append((input_skeleton, matched_bbox))
-
-            return unambiguous_matches
+            return [
+                (input_skeletons[skeleton_idx], gt_boxes[gt_idx])
+                for skeleton_idx, gt_idx in matching.pairs
+            ]
 
         def _find_good_gt_boxes(
             input_skeletons: list[dm.Skeleton],
@@ -1172,18 +1682,28 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
             label.name for label in self.manifest.annotation.labels
         ]
 
-        bbox_sizes_per_label = {}
+        bbox_labels = []
+        bbox_sizes = []
         for sample in self._gt_dataset:
             image_h, image_w = self._points_dataset.get(sample.id, sample.subset).image.size
 
             for gt_bbox in sample.annotations:
                 gt_bbox = cast(dm.Bbox, gt_bbox)
-                bbox_sizes_per_label.setdefault(gt_bbox.label, []).append(
-                    (
-                        gt_bbox.w / image_w,
-                        gt_bbox.h / image_h,
-                    )
-                )
+                bbox_labels.append(gt_bbox.label)
+                bbox_sizes.append((gt_bbox.w, gt_bbox.h, image_w, image_h))
+
+        bbox_labels = np.array(bbox_labels, dtype=int)
+        bbox_sizes = np.array(bbox_sizes, dtype=float).reshape(-1, 4)
+        relative_bbox_sizes = bbox_sizes[:, 0:2] / bbox_sizes[:, 2:4]
+
+        # Keep the labels in the order of appearance
+        label_ids, first_label_positions, label_indices = np.unique(
+            bbox_labels, return_index=True, return_inverse=True
+        )
+        label_order = np.argsort(first_label_positions)
+        label_sample_counts = np.bincount(label_indices, minlength=len(label_ids))
+        max_label_bbox_sizes = np.zeros((len(label_ids), 2))
+        np.maximum.at(max_label_bbox_sizes, label_indices, relative_bbox_sizes)
 
         # Consider bbox sides as normally-distributed random variables, estimate max
         # For big enough datasets, it should be reasonable approximation
@@ -1192,12 +1712,13 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         classes_with_default_roi: dict[int, str] = {}  # label_id -> reason
         roi_size_estimations_per_label = {}  # label id -> (w, h)
         default_roi_size = (2, 2)  # 2 will yield just the image size after halving
-        for label_id, label_sizes in bbox_sizes_per_label.items():
-            if len(label_sizes) < self.min_class_samples_for_roi_estimation:
+        for label_idx in label_order:
+            label_id = int(label_ids[label_idx])
+            if label_sample_counts[label_idx] < self.min_class_samples_for_roi_estimation:
                 estimated_size = default_roi_size
                 classes_with_default_roi[label_id] = "too few GT provided"
             else:
-                max_bbox = np.max(label_sizes, axis=0)
+                max_bbox = max_label_bbox_sizes[label_idx]
                 if np.any(max_bbox > self.max_class_roi_image_side_threshold):
                     estimated_size = default_roi_size
                     classes_with_default_roi[label_id] = "estimated RoI is unreliable"
@@ -1233,48 +1754,51 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         assert self._roi_size_estimations is not _unset
         assert self._points_dataset is not _unset
 
-        rois: list[boxes_from_points_task.RoiInfo] = []
+        point_ids = []
+        point_image_keys = []
+        point_labels = []
+        point_coords = []
+        image_sizes = []
         for sample in self._points_dataset:
+            image_h, image_w = sample.image.size
+
             for skeleton in sample.annotations:
                 if not isinstance(skeleton, dm.Skeleton):
                     continue
 
-                point_label_id = skeleton.label
-                original_point_x, original_point_y = skeleton.elements[0].points[:2]
-                original_point_x = int(original_point_x)
-                original_point_y = int(original_point_y)
-
-                image_h, image_w = sample.image.size
-
-                roi_est_w, roi_est_h = self._roi_size_estimations[point_label_id]
-                roi_est_w *= image_w
-                roi_est_h *= image_h
-                roi_est_w = max(roi_est_w, self.min_roi_size[0])
-                roi_est_h = max(roi_est_h, self.min_roi_size[1])
-
-                roi_left = max(0, original_point_x - int(roi_est_w / 2))
-                roi_top = max(0, original_point_y - int(roi_est_h / 2))
-                roi_right = min(image_w, original_point_x + ceil(roi_est_w / 2))
-                roi_bottom = min(image_h, original_point_y + ceil(roi_est_h / 2))
-
-                roi_w = roi_right - roi_left
-                roi_h = roi_bottom - roi_top
-
-                new_point_x = original_point_x - roi_left
-                new_point_y = original_point_y - roi_top
-
-                rois.append(
-                    boxes_from_points_task.RoiInfo(
-                        point_id=skeleton.id,
-                        original_image_key=sample.attributes["id"],
-                        point_x=new_point_x,
-                        point_y=new_point_y,
-                        roi_x=roi_left,
-                        roi_y=roi_top,
-                        roi_w=roi_w,
-                        roi_h=roi_h,
-                    )
-                )
+                point_ids.append(skeleton.id)
+                point_image_keys.append(sample.attributes["id"])
+                point_labels.append(skeleton.label)
+                point_coords.append(skeleton.elements[0].points[:2])
+                image_sizes.append((image_w, image_h))
+
+        point_coords = np.trunc(np.array(point_coords, dtype=float).reshape(-1, 2)).astype(int)
+        image_sizes = np.array(image_sizes, dtype=int).reshape(-1, 2)
+
+        roi_size_estimations = {
+            label_id: self._roi_size_estimations[label_id] for label_id in set(point_labels)
+        }
+        roi_est_sizes = np.array(
+            [roi_size_estimations[label_id] for label_id in point_labels], dtype=float
+        ).reshape(-1, 2)
+        roi_est_sizes *= image_sizes
+        roi_est_sizes = np.maximum(roi_est_sizes, self.min_roi_size)
+
+        roi_top_left = np.maximum(0, point_coords - np.trunc(roi_est_sizes / 2).astype(int))
+        roi_bottom_right = np.minimum(
+            image_sizes, point_coords + np.ceil(roi_est_sizes / 2).astype(int)
+        )
+
+        rois = boxes_from_points_task.RoiInfoTable.from_columns(
+            point_id=point_ids,
+            original_image_key=point_image_keys,
+            point_x=point_coords[:, 0] - roi_top_left[:, 0],
+            point_y=point_coords[:, 1] - roi_top_left[:, 1],
+            roi_x=roi_top_left[:, 0],
+            roi_y=roi_top_left[:, 1],
+            roi_w=roi_bottom_right[:, 0] - roi_top_left[:, 0],
+            roi_h=roi_bottom_right[:, 1] - roi_top_left[:, 1],
+        )
 
         self._rois = rois
 
@@ -1288,7 +1812,8 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         # TODO: maybe add different names for the same GT images in
         # different jobs to make them even less recognizable
         self._roi_filenames = {
-            roi.point_id: str(uuid.uuid4()) + self.roi_file_ext for roi in self._rois
+            roi.point_id: self._make_mangled_filename(roi.point_id) + self.roi_file_ext
+            for roi in self._rois
         }
 
     def _prepare_job_layout(self):
@@ -1340,71 +1865,22 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         )
 
         storage_client = self._make_cloud_storage_client(self.oracle_data_bucket)
-        for file_data, filename in file_list:
-            storage_client.create_file(
-                compose_data_bucket_filename(self.escrow_address, self.chain_id, filename),
-                file_data,
-            )
-
-    def _extract_roi(
-        self, source_pixels: np.ndarray, roi_info: boxes_from_points_task.RoiInfo
-    ) -> np.ndarray:
-        img_h, img_w, *_ = source_pixels.shape
-
-        roi_pixels = source_pixels[
-            max(0, roi_info.roi_y) : min(img_h, roi_info.roi_y + roi_info.roi_h),
-            max(0, roi_info.roi_x) : min(img_w, roi_info.roi_x + roi_info.roi_w),
-        ]
-
-        if not (
-            (0 <= roi_info.roi_x < roi_info.roi_x + roi_info.roi_w < img_w)
-            and (0 <= roi_info.roi_y < roi_info.roi_y + roi_info.roi_h < img_h)
-        ):
-            # Coords can be outside the original image
-            # In this case a border should be added to RoI, so that the image was centered on bbox
-            wrapped_roi_pixels = np.zeros((roi_info.roi_h, roi_info.roi_w, 3), dtype=np.float32)
-            wrapped_roi_pixels[:, :] = self.roi_background_color
-
-            dst_y = max(-roi_info.roi_y, 0)
-            dst_x = max(-roi_info.roi_x, 0)
-            wrapped_roi_pixels[
-                dst_y : dst_y + roi_pixels.shape[0],
-                dst_x : dst_x + roi_pixels.shape[1],
-            ] = roi_pixels
-
-            roi_pixels = wrapped_roi_pixels
-        else:
-            roi_pixels = roi_pixels.copy()
-
-        return roi_pixels
-
-    def _draw_roi_point(
-        self, roi_pixels: np.ndarray, roi_info: boxes_from_points_task.RoiInfo
-    ) -> np.ndarray:
-        center = (roi_info.point_x, roi_info.point_y)
-
-        roi_r = (roi_info.roi_w**2 + roi_info.roi_h**2) ** 0.5 / 2
-        point_size = int(
-            min(
-                self.max_embedded_point_radius_percent * roi_r,
-                max(self.embedded_point_radius, self.min_embedded_point_radius_percent * roi_r),
-            )
+        storage_client.create_files(
+            (
+                (compose_data_bucket_filename(self.escrow_address, self.chain_id, filename), data)
+                for data, filename in file_list
+            ),
+            max_concurrency=Config.features.max_data_storage_connections,
         )
 
-        roi_pixels = roi_pixels.copy()
-        roi_pixels = cv2.circle(
-            roi_pixels,
-            center,
-            point_size + 1,
-            (255, 255, 255),
-            cv2.FILLED,
-        )
-        return cv2.circle(
-            roi_pixels,
-            center,
-            point_size,
-            self.embedded_point_color,
-            cv2.FILLED,
+    def _make_roi_image_renderer(self) -> _PointRoiImageRenderer:
+        return _PointRoiImageRenderer(
+            roi_background_color=self.roi_background_color,
+            embed_point_in_roi_image=self.embed_point_in_roi_image,
+            embedded_point_radius=self.embedded_point_radius,
+            min_embedded_point_radius_percent=self.min_embedded_point_radius_percent,
+            max_embedded_point_radius_percent=self.max_embedded_point_radius_percent,
+            embedded_point_color=self.embedded_point_color,
         )
 
     def _extract_and_upload_rois(self):
@@ -1413,13 +1889,6 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         assert self._data_filenames is not _unset
         assert self._roi_filenames is not _unset
 
-        src_bucket = BucketAccessInfo.parse_obj(self.manifest.data.data_url)
-        src_prefix = src_bucket.path
-        dst_bucket = self.oracle_data_bucket
-
-        src_client = self._make_cloud_storage_client(src_bucket)
-        dst_client = self._make_cloud_storage_client(dst_bucket)
-
         image_id_to_filename = {
             sample.attributes["id"]: sample.image.path for sample in self._points_dataset
         }
@@ -1434,65 +1903,25 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
             for image_id, g in groupby(sorted(self._rois, key=_roi_key), key=_roi_key)
         }
 
-        def process_file(filename: str, image_pixels: np.ndarray):
-            image_roi_infos = rois_by_image.get(filename, [])
-            if not image_roi_infos:
-                return
-
-            sample = filename_to_sample[filename]
-            if tuple(sample.image.size) != tuple(image_pixels.shape[:2]):
-                # TODO: maybe rois should be regenerated instead
-                # Option 2: accumulate errors, fail when some threshold is reached
-                # Option 3: add special handling for cases when image is only rotated (exif etc.)
-                raise InvalidImageInfo(
-                    f"Sample '{filename}': invalid size provided in the point annotations"
-                )
-
-            image_rois = {}
-            for roi_info in image_roi_infos:
-                roi_pixels = self._extract_roi(image_pixels, roi_info)
-
-                if self.embed_point_in_roi_image:
-                    roi_pixels = self._draw_roi_point(roi_pixels, roi_info)
-
-                roi_filename = self._roi_filenames[roi_info.point_id]
-                roi_bytes = encode_image(roi_pixels, os.path.splitext(roi_filename)[-1])
-
-                image_rois[roi_filename] = roi_bytes
-
-            for roi_filename, roi_bytes in image_rois.items():
-                dst_client.create_file(
-                    compose_data_bucket_filename(self.escrow_address, self.chain_id, roi_filename),
-                    roi_bytes,
-                )
-
-        def download_and_decode(key: str):
-            image_bytes = src_client.download_file(key)
-            return decode_image(image_bytes)
-
-        pool_size = Config.features.max_data_storage_connections
-        download_queue_size = 4 * pool_size
-        download_queue = Queue[tuple[str, Future[np.ndarray]]](download_queue_size)
-        roi_uploader = BufferedRoiImageUploader(queue=download_queue)
-        with ThreadPoolExecutor(pool_size) as pool:
-
-            def put_callback(filename: str):
-                image_roi_infos = rois_by_image.get(filename, [])
-                if not image_roi_infos:
-                    return None
-
-                return (
-                    filename,
-                    pool.submit(download_and_decode, os.path.join(src_prefix, filename)),
-                )
-
-            def process_callback(result: tuple[str, Future]):
-                filename, task = result
-                process_file(filename, task.result())
-
-            roi_uploader.process_all(
-                self._data_filenames, put_callback=put_callback, process_callback=process_callback
+        source_images = (
+            _RoiSourceImage(
+                filename=filename,
+                image_size=tuple(filename_to_sample[filename].image.size),
+                rois=[
+                    (roi_info, self._roi_filenames[roi_info.point_id])
+                    for roi_info in rois_by_image[filename]
+                ],
             )
+            for filename in self._data_filenames
+            if rois_by_image.get(filename)
+        )
+
+        self._run_roi_extraction(
+            source_images,
+            renderer=self._make_roi_image_renderer(),
+            src_bucket=BucketAccessInfo.parse_obj(self.manifest.data.data_url),
+            dst_bucket=self.oracle_data_bucket,
+        )
 
     def _prepare_gt_roi_dataset(self):
         self._gt_roi_dataset = dm.Dataset(
@@ -1537,19 +1966,25 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         oracle_bucket = self.oracle_data_bucket
 
         # Register cloud storage on CVAT to pass user dataset
-        cvat_cloud_storage = cvat_api.create_cloudstorage(
-            **_make_cvat_cloud_storage_params(oracle_bucket)
+        cvat_cloud_storage_id = self._get_or_create_cvat_object(
+            "cloudstorage:",
+            cvat_api.create_cloudstorage,
+            **_make_cvat_cloud_storage_params(oracle_bucket),
         )
 
         # Create a project
-        cvat_project = cvat_api.create_project(
+        cvat_project_id = self._get_or_create_cvat_object(
+            "project:",
+            cvat_api.create_project,
             self.escrow_address,
             labels=self._label_configuration,
             user_guide=self.manifest.annotation.user_guide,
         )
 
         # Setup webhooks for a project (update:task, update:job)
-        cvat_webhook = cvat_api.create_cvat_webhook(cvat_project.id)
+        cvat_webhook_id = self._get_or_create_cvat_object(
+            "webhook:", cvat_api.create_cvat_webhook, cvat_project_id
+        )
 
         with SessionLocal.begin() as session:
             segment_size = self._task_segment_size
@@ -1568,51 +2003,40 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
 
             project_id = db_service.create_project(
                 session,
-                cvat_project.id,
-                cvat_cloud_storage.id,
+                cvat_project_id,
+                cvat_cloud_storage_id,
                 self.manifest.annotation.type,
                 self.escrow_address,
                 self.chain_id,
                 oracle_bucket.to_url().rstrip("/")
                 + "/"
                 + compose_data_bucket_prefix(self.escrow_address, self.chain_id),
-                cvat_webhook_id=cvat_webhook.id,
+                cvat_webhook_id=cvat_webhook_id,
             )
             db_service.get_project_by_id(session, project_id, for_update=True)  # lock the row
             db_service.add_project_images(
                 session,
-                cvat_project.id,
+                cvat_project_id,
                 [
                     compose_data_bucket_filename(self.escrow_address, self.chain_id, fn)
                     for fn in self._roi_filenames.values()
                 ],
             )
 
-            for data_subset in self._split_dataset_per_task(
-                self._roi_filenames_to_be_annotated,
-                subset_size=Config.cvat_config.max_jobs_per_task * segment_size,
-            ):
-                cvat_task = cvat_api.create_task(
-                    cvat_project.id, self.escrow_address, segment_size=segment_size
-                )
-
-                task_id = db_service.create_task(
-                    session, cvat_task.id, cvat_project.id, TaskStatuses[cvat_task.status]
-                )
-                db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
+            gt_filenames = [
+                compose_data_bucket_filename(self.escrow_address, self.chain_id, fn)
+                for fn in self._gt_roi_filenames
+            ]
 
+            def _put_task_data(cvat_task_id: int, *, data_subset: list[str]) -> None:
                 filenames = [
                     compose_data_bucket_filename(self.escrow_address, self.chain_id, fn)
                     for fn in data_subset
                 ]
-                gt_filenames = [
-                    compose_data_bucket_filename(self.escrow_address, self.chain_id, fn)
-                    for fn in self._gt_roi_filenames
-                ]
 
                 cvat_api.put_task_data(
-                    cvat_task.id,
-                    cvat_cloud_storage.id,
+                    cvat_task_id,
+                    cvat_cloud_storage_id,
                     filenames=filenames,
                     chunk_size=self._task_chunk_size,
                     validation_params={
@@ -1621,12 +2045,38 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
                     },
                 )
 
+            def _setup_task(cvat_task_id: int) -> None:
                 self._setup_gt_job_for_cvat_task(
-                    cvat_task.id, self._gt_roi_dataset, dm_export_format="coco"
+                    cvat_task_id, self._gt_roi_dataset, dm_export_format="coco"
+                )
+                self._setup_quality_settings(cvat_task_id)
+
+            cvat_tasks = self._provision_cvat_tasks(
+                [
+                    _CvatTaskSpec(
+                        key=str(subset_index),
+                        project_id=cvat_project_id,
+                        name=self.escrow_address,
+                        put_data=partial(_put_task_data, data_subset=data_subset),
+                        setup=_setup_task,
+                    )
+                    for subset_index, data_subset in enumerate(
+                        self._split_dataset_per_task(
+                            self._roi_filenames_to_be_annotated,
+                            subset_size=Config.cvat_config.max_jobs_per_task * segment_size,
+                        )
+                    )
+                ],
+                segment_size=segment_size,
+            )
+
+            for cvat_task_id, cvat_task_status in cvat_tasks:
+                task_id = db_service.create_task(
+                    session, cvat_task_id, cvat_project_id, cvat_task_status
                 )
-                self._setup_quality_settings(cvat_task.id)
+                db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
 
-                db_service.create_data_upload(session, cvat_task.id)
+                db_service.create_data_upload(session, cvat_task_id)
 
             db_service.touch(session, Project, [project_id])
 
@@ -1647,12 +2097,45 @@ class BoxesFromPointsTaskBuilder(_TaskBuilderBase):
         self._prepare_gt_roi_dataset()
 
         # Data preparation
-        self._extract_and_upload_rois()
-        self._upload_task_meta()
+        self._run_stage("roi_upload", self._extract_and_upload_rois)
+        self._run_stage("task_meta_upload", self._upload_task_meta)
 
         self._create_on_cvat()
 
 
+@dataclass(frozen=True)
+class _SkeletonRoiImageRenderer(
+    _RoiImageRendererBase[tuple[skeletons_from_boxes_task.RoiInfo, dm.Bbox]]
+):
+    embed_bbox_in_roi_image: bool
+    roi_embedded_bbox_color: tuple[int, int, int]
+
+    def draw_roi_bbox(self, roi_image: np.ndarray, bbox: dm.Bbox) -> np.ndarray:
+        roi_cy = roi_image.shape[0] // 2
+        roi_cx = roi_image.shape[1] // 2
+        return cv2.rectangle(
+            roi_image,
+            tuple(map(int, (roi_cx - bbox.w / 2, roi_cy - bbox.h / 2))),
+            tuple(map(int, (roi_cx + bbox.w / 2, roi_cy + bbox.h / 2))),
+            self.roi_embedded_bbox_color,
+            2,  # TODO: maybe improve line thickness
+            cv2.LINE_4,
+        )
+
+    def render_roi(
+        self,
+        source_pixels: np.ndarray,
+        roi: tuple[skeletons_from_boxes_task.RoiInfo, dm.Bbox],
+    ) -> np.ndarray:
+        roi_info, bbox = roi
+        roi_pixels = self.extract_roi(source_pixels, roi_info)
+
+        if self.embed_bbox_in_roi_image:
+            roi_pixels = self.draw_roi_bbox(roi_pixels, bbox)
+
+        return roi_pixels
+
+
 class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
     @dataclass
     class _TaskParams:
@@ -1674,7 +2157,7 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
         self._skeleton_bbox_mapping: _MaybeUnset[skeletons_from_boxes_task.SkeletonBboxMapping] = (
             _unset
         )
-        self._roi_infos: _MaybeUnset[skeletons_from_boxes_task.RoiInfos] = _unset
+        self._roi_infos: _MaybeUnset[skeletons_from_boxes_task.RoiInfoTable] = _unset
         self._roi_info_by_id: _MaybeUnset[dict[int, skeletons_from_boxes_task.RoiInfo]] = _unset
 
         self._gt_points_per_label: _MaybeUnset[
@@ -2031,8 +2514,9 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
         self._validate_boxes_filenames()
         self._validate_boxes_annotations()
 
-    def _match_boxes(self, a: BboxCoords, b: BboxCoords) -> bool:
-        return bbox_iou(a, b) > 0
+    def _match_boxes(self, a_boxes: np.ndarray, b_boxes: np.ndarray) -> np.ndarray:
+        "Computes the (N, M) match matrix for 2 arrays of boxes in the (x, y, w, h) format"
+        return match_overlapping_boxes(a_boxes, b_boxes)
 
     def _get_skeleton_bbox(
         self, skeleton: dm.Skeleton, annotations: Sequence[dm.Annotation]
@@ -2068,52 +2552,45 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
             *,
             gt_annotations: list[dm.Annotation],
         ) -> list[tuple[dm.Bbox, dm.Skeleton]]:
-            matches = [
-                [
-                    (input_bbox.label == gt_skeleton.label)
-                    and (
-                        self._match_boxes(
-                            input_bbox.get_bbox(),
-                            self._get_skeleton_bbox(gt_skeleton, gt_annotations),
-                        )
-                    )
-                    for gt_skeleton in gt_skeletons
-                ]
-                for input_bbox in input_boxes
-            ]
-
-            ambiguous_boxes: list[int] = set()
-            ambiguous_skeletons: list[int] = set()
-            for bbox_idx, input_bbox in enumerate(input_boxes):
-                matched_skeletons: list[dm.Skeleton] = [
-                    gt_skeletons[j] for j in range(len(gt_skeletons)) if matches[bbox_idx][j]
+            input_labels = np.array([b.label for b in input_boxes], dtype=int)
+            input_coords = np.array([b.get_bbox() for b in input_boxes], dtype=float).reshape(-1, 4)
+            gt_labels = np.array([s.label for s in gt_skeletons], dtype=int)
+            gt_coords = np.array(
+                [self._get_skeleton_bbox(s, gt_annotations) for s in gt_skeletons], dtype=float
+            ).reshape(-1, 4)
+
+            matching = find_unambiguous_matches(
+                (input_labels[:, np.newaxis] == gt_labels)
+                & self._match_boxes(input_coords, gt_coords)
+            )
+
+            for bbox_idx in np.flatnonzero(matching.row_match_counts > 1):
+                # Handle ambiguous matches
+                input_bbox = input_boxes[bbox_idx]
+                matched_skeletons = [
+                    gt_skeletons[j] for j in np.flatnonzero(matching.matches[bbox_idx])
                 ]
-
-                if len(matched_skeletons) > 1:
-                    # Handle ambiguous matches
-                    excluded_boxes_info.add_message(
-                        "Sample '{}': bbox #{} ({}) and overlapping skeletons skipped - "
-                        "too many matching skeletons ({}) found".format(
-                            boxes_sample.id,
-                            input_bbox.id,
-                            boxes_label_cat[input_bbox.label].name,
-                            format_sequence([f"#{a.id}" for a in matched_skeletons]),
-                        ),
-                        sample_id=boxes_sample.id,
-                        sample_subset=boxes_sample.subset,
-                    )
-                    # not an error, should not be counted as excluded for an error
-                    ambiguous_boxes.add(input_bbox.id)
-                    ambiguous_skeletons.update(s.id for s in matched_skeletons)
-                    continue
+                excluded_boxes_info.add_message(
+                    "Sample '{}': bbox #{} ({}) and overlapping skeletons skipped - "
+                    "too many matching skeletons ({}) found".format(
+                        boxes_sample.id,
+                        input_bbox.id,
+                        boxes_label_cat[input_bbox.label].name,
+                        format_sequence([f"#{a.id}" for a in matched_skeletons]),
+                    ),
+                    sample_id=boxes_sample.id,
+                    sample_subset=boxes_sample.subset,
+                )
+                # not an error, should not be counted as excluded for an error
 
             for skeleton_idx, gt_skeleton in enumerate(gt_skeletons):
-                matched_boxes: list[dm.Bbox] = [
-                    input_boxes[i] for i in range(len(input_boxes)) if matches[i][skeleton_idx]
-                ]
+                matched_count = matching.col_match_counts[skeleton_idx]
 
-                if len(matched_boxes) > 1:
+                if matched_count > 1:
                     # Handle ambiguous matches
+                    matched_boxes = [
+                        input_boxes[i] for i in np.flatnonzero(matching.matches[:, skeleton_idx])
+                    ]
                     excluded_gt_info.add_message(
                         "Sample '{}': GT skeleton #{} ({}) and overlapping boxes skipped - "
                         "too many matching boxes ({}) found".format(
@@ -2126,10 +2603,8 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
                         sample_subset=gt_sample.subset,
                     )
                     # not an error, should not be counted as excluded for an error
-                    ambiguous_skeletons.add(gt_skeleton.id)
-                    ambiguous_boxes.update(b.id for b in matched_boxes)
                     continue
-                if not matched_boxes:
+                if not matched_count:
                     # Handle unmatched skeletons
                     excluded_gt_info.add_message(
                         "Sample '{}': GT skeleton #{} ({}) skipped - "
@@ -2144,24 +2619,10 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
                     excluded_gt_info.excluded_count += 1  # an error
                     continue
 
-            unambiguous_matches: list[tuple[dm.Bbox, dm.Skeleton]] = []
-            for bbox_idx, input_bbox in enumerate(input_boxes):
-                if input_bbox.id in ambiguous_boxes:
-                    continue
-
-                matched_skeleton = None
-                for gt_idx, gt_skeleton in enumerate(gt_skeletons):
-                    if gt_skeleton.id in ambiguous_skeletons:
-                        continue
-
-                    if matches[bbox_idx][gt_idx]:
-                        matched_skeleton = gt_skeleton
-                        break
-
-                if matched_skeleton:
-                    unambiguous_matches.append((input_bbox, matched_skeleton))
-
-            return unambiguous_matches
+            return [
+                (input_boxes[bbox_idx], gt_skeletons[skeleton_idx])
+                for bbox_idx, skeleton_idx in matching.pairs
+            ]
 
         def _find_good_gt_skeletons(
             input_boxes: list[dm.Bbox],
@@ -2292,40 +2753,44 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
         assert self._gt_dataset is not _unset
         assert self._boxes_dataset is not _unset
 
-        rois: list[skeletons_from_boxes_task.RoiInfo] = []
+        bbox_ids = []
+        bbox_image_keys = []
+        bbox_labels = []
+        bbox_coords = []
         for sample in self._boxes_dataset:
             for bbox in sample.annotations:
                 if not isinstance(bbox, dm.Bbox):
                     continue
 
-                # RoI is centered on bbox center
-                original_bbox_cx = int(bbox.x + bbox.w / 2)
-                original_bbox_cy = int(bbox.y + bbox.h / 2)
-
-                roi_w = ceil(bbox.w * self.roi_size_mult)
-                roi_h = ceil(bbox.h * self.roi_size_mult)
-                roi_w = max(roi_w, self.min_roi_size[0])
-                roi_h = max(roi_h, self.min_roi_size[1])
-
-                roi_x = original_bbox_cx - int(roi_w / 2)
-                roi_y = original_bbox_cy - int(roi_h / 2)
-
-                new_bbox_x = bbox.x - roi_x
-                new_bbox_y = bbox.y - roi_y
-
-                rois.append(
-                    skeletons_from_boxes_task.RoiInfo(
-                        original_image_key=sample.attributes["id"],
-                        bbox_id=bbox.id,
-                        bbox_label=bbox.label,
-                        bbox_x=new_bbox_x,
-                        bbox_y=new_bbox_y,
-                        roi_x=roi_x,
-                        roi_y=roi_y,
-                        roi_w=roi_w,
-                        roi_h=roi_h,
-                    )
-                )
+                bbox_ids.append(bbox.id)
+                bbox_image_keys.append(sample.attributes["id"])
+                bbox_labels.append(bbox.label)
+                bbox_coords.append(bbox.get_bbox())
+
+        bbox_coords = np.array(bbox_coords, dtype=float).reshape(-1, 4)
+        bbox_xy = bbox_coords[:, 0:2]
+        bbox_wh = bbox_coords[:, 2:4]
+
+        # RoI is centered on bbox center
+        original_bbox_centers = np.trunc(bbox_xy + bbox_wh / 2).astype(int)
+
+        roi_sizes = np.ceil(bbox_wh * self.roi_size_mult).astype(int)
+        roi_sizes = np.maximum(roi_sizes, self.min_roi_size)
+
+        roi_xy = original_bbox_centers - np.trunc(roi_sizes / 2).astype(int)
+        new_bbox_xy = bbox_xy - roi_xy
+
+        rois = skeletons_from_boxes_task.RoiInfoTable.from_columns(
+            original_image_key=bbox_image_keys,
+            bbox_id=bbox_ids,
+            bbox_label=bbox_labels,
+            bbox_x=new_bbox_xy[:, 0],
+            bbox_y=new_bbox_xy[:, 1],
+            roi_x=roi_xy[:, 0],
+            roi_y=roi_xy[:, 1],
+            roi_w=roi_sizes[:, 0],
+            roi_h=roi_sizes[:, 1],
+        )
 
         self._roi_infos = rois
         self._roi_info_by_id = {roi_info.bbox_id: roi_info for roi_info in self._roi_infos}
@@ -2340,7 +2805,8 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
         # TODO: maybe add different names for the same GT images in
         # different jobs to make them even less recognizable
         self._roi_filenames = {
-            roi_info.bbox_id: str(uuid.uuid4()) + self.roi_file_ext for roi_info in self._roi_infos
+            roi_info.bbox_id: self._make_mangled_filename(roi_info.bbox_id) + self.roi_file_ext
+            for roi_info in self._roi_infos
         }
 
     @property
@@ -2366,6 +2832,16 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
             sample.attributes["id"]: sample.media.path for sample in self._boxes_dataset
         }
 
+        roi_ids = self._roi_infos.column("bbox_id")
+        roi_labels = self._roi_infos.column("bbox_label")
+        is_roi_from_gt_image = np.array(
+            [
+                image_id_to_filename[image_key] in input_gt_filenames
+                for image_key in self._roi_infos.column("original_image_key").tolist()
+            ],
+            dtype=bool,
+        )
+
         task_params: list[self._TaskParams] = []
         segment_size = self._task_segment_size
         for label_id, _ in enumerate(self.manifest.annotation.labels):
@@ -2375,14 +2851,12 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
                 if self._roi_info_by_id[roi_id].bbox_label == label_id
             )
 
-            label_data_roi_ids = [
-                roi_info.bbox_id
-                for roi_info in self._roi_infos
-                if roi_info.bbox_label == label_id
-                if roi_info.bbox_id not in label_gt_roi_ids
-                if image_id_to_filename[roi_info.original_image_key] not in input_gt_filenames
-            ]
-            random.shuffle(label_data_roi_ids)
+            label_data_roi_ids = roi_ids[
+                (roi_labels == label_id)
+                & ~np.isin(roi_ids, list(label_gt_roi_ids))
+                & ~is_roi_from_gt_image
+            ].tolist()
+            self._get_random(f"task_split:{label_id}").shuffle(label_data_roi_ids)
 
             task_params.extend(
                 [
@@ -2461,67 +2935,25 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
         )
 
         storage_client = self._make_cloud_storage_client(self.oracle_data_bucket)
-        for file_data, filename in file_list:
-            storage_client.create_file(
-                compose_data_bucket_filename(self.escrow_address, self.chain_id, filename),
-                file_data,
-            )
-
-    def _extract_roi(
-        self, source_pixels: np.ndarray, roi_info: skeletons_from_boxes_task.RoiInfo
-    ) -> np.ndarray:
-        img_h, img_w, *_ = source_pixels.shape
-
-        roi_pixels = source_pixels[
-            max(0, roi_info.roi_y) : min(img_h, roi_info.roi_y + roi_info.roi_h),
-            max(0, roi_info.roi_x) : min(img_w, roi_info.roi_x + roi_info.roi_w),
-        ]
-
-        if not (
-            (0 <= roi_info.roi_x < roi_info.roi_x + roi_info.roi_w < img_w)
-            and (0 <= roi_info.roi_y < roi_info.roi_y + roi_info.roi_h < img_h)
-        ):
-            # Coords can be outside the original image
-            # In this case a border should be added to RoI, so that the image was centered on bbox
-            wrapped_roi_pixels = np.zeros((roi_info.roi_h, roi_info.roi_w, 3), dtype=np.float32)
-            wrapped_roi_pixels[:, :] = self.roi_background_color
-
-            dst_y = max(-roi_info.roi_y, 0)
-            dst_x = max(-roi_info.roi_x, 0)
-            wrapped_roi_pixels[
-                dst_y : dst_y + roi_pixels.shape[0],
-                dst_x : dst_x + roi_pixels.shape[1],
-            ] = roi_pixels
-
-            roi_pixels = wrapped_roi_pixels
-        else:
-            roi_pixels = roi_pixels.copy()
-
-        return roi_pixels
+        storage_client.create_files(
+            (
+                (compose_data_bucket_filename(self.escrow_address, self.chain_id, filename), data)
+                for data, filename in file_list
+            ),
+            max_concurrency=Config.features.max_data_storage_connections,
+        )
 
-    def _draw_roi_bbox(self, roi_image: np.ndarray, bbox: dm.Bbox) -> np.ndarray:
-        roi_cy = roi_image.shape[0] // 2
-        roi_cx = roi_image.shape[1] // 2
-        return cv2.rectangle(
-            roi_image,
-            tuple(map(int, (roi_cx - bbox.w / 2, roi_cy - bbox.h / 2))),
-            tuple(map(int, (roi_cx + bbox.w / 2, roi_cy + bbox.h / 2))),
-            self.roi_embedded_bbox_color,
-            2,  # TODO: maybe improve line thickness
-            cv2.LINE_4,
+    def _make_roi_image_renderer(self) -> _SkeletonRoiImageRenderer:
+        return _SkeletonRoiImageRenderer(
+            roi_background_color=self.roi_background_color,
+            embed_bbox_in_roi_image=self.embed_bbox_in_roi_image,
+            roi_embedded_bbox_color=self.roi_embedded_bbox_color,
         )
 
     def _extract_and_upload_rois(self):
         assert self._roi_filenames is not _unset
         assert self._roi_infos is not _unset
 
-        src_bucket = BucketAccessInfo.parse_obj(self.manifest.data.data_url)
-        src_prefix = src_bucket.path
-        dst_bucket = self.oracle_data_bucket
-
-        src_client = self._make_cloud_storage_client(src_bucket)
-        dst_client = self._make_cloud_storage_client(dst_bucket)
-
         image_id_to_filename = {
             sample.attributes["id"]: sample.image.path for sample in self._boxes_dataset
         }
@@ -2545,61 +2977,28 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
             if isinstance(bbox, dm.Bbox)
         }
 
-        def process_file(filename: str, image_pixels: np.ndarray):
-            image_roi_infos = roi_info_by_image.get(filename, [])
-            if not image_roi_infos:
-                return
-
-            sample = filename_to_sample[filename]
-            if tuple(sample.image.size) != tuple(image_pixels.shape[:2]):
-                # TODO: maybe rois should be regenerated instead
-                # Option 2: accumulate errors, fail when some threshold is reached
-                # Option 3: add special handling for cases when image is only rotated (exif etc.)
-                raise InvalidImageInfo(
-                    f"Sample '{filename}': invalid size provided in the point annotations"
-                )
-
-            for roi_info in image_roi_infos:
-                roi_pixels = self._extract_roi(image_pixels, roi_info)
-
-                if self.embed_bbox_in_roi_image:
-                    roi_pixels = self._draw_roi_bbox(roi_pixels, bbox_by_id[roi_info.bbox_id])
-
-                filename = self._roi_filenames[roi_info.bbox_id]
-                roi_bytes = encode_image(roi_pixels, os.path.splitext(filename)[-1])
-
-                dst_client.create_file(
-                    compose_data_bucket_filename(self.escrow_address, self.chain_id, filename),
-                    data=roi_bytes,
-                )
-
-        def download_and_decode(key: str):
-            image_bytes = src_client.download_file(key)
-            return decode_image(image_bytes)
-
-        pool_size = Config.features.max_data_storage_connections
-        download_queue_size = 4 * pool_size
-        download_queue = Queue[tuple[str, Future[np.ndarray]]](download_queue_size)
-        roi_uploader = BufferedRoiImageUploader(queue=download_queue)
-        with ThreadPoolExecutor(pool_size) as pool:
-
-            def put_callback(filename: str):
-                image_roi_infos = roi_info_by_image.get(filename, [])
-                if not image_roi_infos:
-                    return None
-
-                return (
-                    filename,
-                    pool.submit(download_and_decode, os.path.join(src_prefix, filename)),
-                )
-
-            def process_callback(result: tuple[str, Future]):
-                filename, task = result
-                process_file(filename, task.result())
-
-            roi_uploader.process_all(
-                self._data_filenames, put_callback=put_callback, process_callback=process_callback
+        source_images = (
+            _RoiSourceImage(
+                filename=filename,
+                image_size=tuple(filename_to_sample[filename].image.size),
+                rois=[
+                    (
+                        (roi_info, bbox_by_id[roi_info.bbox_id]),
+                        self._roi_filenames[roi_info.bbox_id],
+                    )
+                    for roi_info in roi_info_by_image[filename]
+                ],
             )
+            for filename in self._data_filenames
+            if roi_info_by_image.get(filename)
+        )
+
+        self._run_roi_extraction(
+            source_images,
+            renderer=self._make_roi_image_renderer(),
+            src_bucket=BucketAccessInfo.parse_obj(self.manifest.data.data_url),
+            dst_bucket=self.oracle_data_bucket,
+        )
 
     def _prepare_gt_dataset_for_skeleton_point(
         self,
@@ -2699,8 +3098,10 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
         oracle_bucket = self.oracle_data_bucket
 
         # Register cloud storage on CVAT to pass user dataset
-        cvat_cloud_storage = cvat_api.create_cloudstorage(
-            **_make_cvat_cloud_storage_params(oracle_bucket)
+        cvat_cloud_storage_id = self._get_or_create_cvat_object(
+            "cloudstorage:",
+            cvat_api.create_cloudstorage,
+            **_make_cvat_cloud_storage_params(oracle_bucket),
         )
 
         segment_size = self._task_segment_size
@@ -2716,6 +3117,35 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
             total_jobs,
         )
 
+        def _put_task_data(
+            cvat_task_id: int, *, filenames: list[str], gt_filenames: list[str]
+        ) -> None:
+            # The task is fully created once 'update:task' webhook is received.
+            cvat_api.put_task_data(
+                cvat_task_id,
+                cvat_cloud_storage_id,
+                filenames=filenames + gt_filenames,
+                chunk_size=self._task_chunk_size,
+                validation_params={
+                    "gt_filenames": gt_filenames,
+                    "gt_frames_per_job_count": self._job_val_frames_count,
+                },
+            )
+
+        def _setup_task(
+            cvat_task_id: int, *, point_label_name: str, skeleton_label_id: int
+        ) -> None:
+            with self._dataset_lock:
+                gt_point_dataset = self._prepare_gt_dataset_for_skeleton_point(
+                    point_label_name=point_label_name,
+                    skeleton_label_id=skeleton_label_id,
+                )
+
+            self._setup_gt_job_for_cvat_task(
+                cvat_task_id, gt_point_dataset, dm_export_format="cvat"
+            )
+            self._setup_quality_settings(cvat_task_id, oks_sigma=Config.cvat_config.oks_sigma)
+
         with SessionLocal.begin() as session:
             db_service.create_escrow_creation(
                 session,
@@ -2724,6 +3154,7 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
                 total_jobs=total_jobs,
             )
             created_projects = []
+            cvat_task_specs: list[_CvatTaskSpec] = []
 
             for skeleton_label_id, skeleton_label_tasks in tasks_by_skeleton_label.items():
                 skeleton_label_filenames: list[list[str]] = []
@@ -2750,34 +3181,40 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
 
                 for point_label_spec in label_specs_by_skeleton[skeleton_label_id]:
                     point_label_name = point_label_spec["name"]
+                    project_key = f"{skeleton_label_id}:{point_label_name}"
+                    project_name = "{} ({} {})".format(
+                        self.escrow_address,
+                        self.manifest.annotation.labels[skeleton_label_id].name,
+                        point_label_name,
+                    )
 
                     # Create a project for each point label.
                     # CVAT doesn't support tasks with different labels in a project.
-                    cvat_project = cvat_api.create_project(
-                        name="{} ({} {})".format(
-                            self.escrow_address,
-                            self.manifest.annotation.labels[skeleton_label_id].name,
-                            point_label_name,
-                        ),
+                    cvat_project_id = self._get_or_create_cvat_object(
+                        f"project:{project_key}",
+                        cvat_api.create_project,
+                        name=project_name,
                         user_guide=self.manifest.annotation.user_guide,
                         labels=[point_label_spec],
                         # TODO: improve guide handling - split for different points
                     )
 
                     # Setup webhooks for a project (update:task, update:job)
-                    cvat_webhook = cvat_api.create_cvat_webhook(cvat_project.id)
+                    cvat_webhook_id = self._get_or_create_cvat_object(
+                        f"webhook:{project_key}", cvat_api.create_cvat_webhook, cvat_project_id
+                    )
 
                     project_id = db_service.create_project(
                         session,
-                        cvat_project.id,
-                        cvat_cloud_storage.id,
+                        cvat_project_id,
+                        cvat_cloud_storage_id,
                         self.manifest.annotation.type,
                         self.escrow_address,
                         self.chain_id,
                         oracle_bucket.to_url().rstrip("/")
                         + "/"
                         + compose_data_bucket_prefix(self.escrow_address, self.chain_id),
-                        cvat_webhook_id=cvat_webhook.id,
+                        cvat_webhook_id=cvat_webhook_id,
                     )
                     created_projects.append(project_id)
 
@@ -2786,49 +3223,49 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
                     )  # lock the row
                     db_service.add_project_images(
                         session,
-                        cvat_project.id,
+                        cvat_project_id,
                         list(set(chain.from_iterable(skeleton_label_filenames))),
                     )
 
-                    for point_label_filenames, gt_point_label_filenames in zip(
-                        skeleton_label_filenames, gt_skeleton_label_filenames, strict=False
-                    ):
-                        cvat_task = cvat_api.create_task(
-                            cvat_project.id,
-                            name=cvat_project.name,
-                            segment_size=segment_size,
-                        )
-
-                        task_id = db_service.create_task(
-                            session, cvat_task.id, cvat_project.id, TaskStatuses[cvat_task.status]
+                    cvat_task_specs.extend(
+                        _CvatTaskSpec(
+                            key=f"{project_key}:{task_index}",
+                            project_id=cvat_project_id,
+                            name=project_name,
+                            put_data=partial(
+                                _put_task_data,
+                                filenames=point_label_filenames,
+                                gt_filenames=gt_point_label_filenames,
+                            ),
+                            setup=partial(
+                                _setup_task,
+                                point_label_name=point_label_name,
+                                skeleton_label_id=skeleton_label_id,
+                            ),
                         )
-                        db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
-
-                        # The task is fully created once 'update:task' webhook is received.
-                        cvat_api.put_task_data(
-                            cvat_task.id,
-                            cvat_cloud_storage.id,
-                            filenames=point_label_filenames + gt_point_label_filenames,
-                            chunk_size=self._task_chunk_size,
-                            validation_params={
-                                "gt_filenames": gt_point_label_filenames,
-                                "gt_frames_per_job_count": self._job_val_frames_count,
-                            },
+                        for task_index, (point_label_filenames, gt_point_label_filenames) in (
+                            enumerate(
+                                zip(
+                                    skeleton_label_filenames,
+                                    gt_skeleton_label_filenames,
+                                    strict=False,
+                                )
+                            )
                         )
+                    )
 
-                        gt_point_dataset = self._prepare_gt_dataset_for_skeleton_point(
-                            point_label_name=point_label_name,
-                            skeleton_label_id=skeleton_label_id,
-                        )
+            # The tasks are created after the projects to allow concurrent task setup
+            cvat_tasks = self._provision_cvat_tasks(cvat_task_specs, segment_size=segment_size)
 
-                        self._setup_gt_job_for_cvat_task(
-                            cvat_task.id, gt_point_dataset, dm_export_format="cvat"
-                        )
-                        self._setup_quality_settings(
-                            cvat_task.id, oks_sigma=Config.cvat_config.oks_sigma
-                        )
+            for cvat_task_spec, (cvat_task_id, cvat_task_status) in zip(
+                cvat_task_specs, cvat_tasks, strict=True
+            ):
+                task_id = db_service.create_task(
+                    session, cvat_task_id, cvat_task_spec.project_id, cvat_task_status
+                )
+                db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
 
-                        db_service.create_data_upload(session, cvat_task.id)
+                db_service.create_data_upload(session, cvat_task_id)
 
             db_service.touch(session, Project, created_projects)
 
@@ -2847,8 +3284,8 @@ class SkeletonsFromBoxesTaskBuilder(_TaskBuilderBase):
         self._prepare_job_labels()
 
         # Data preparation
-        self._extract_and_upload_rois()
-        self._upload_task_meta()
+        self._run_stage("roi_upload", self._extract_and_upload_rois)
+        self._run_stage("task_meta_upload", self._upload_task_meta)
         self._prepare_gt_points_mapping()
 
         self._create_on_cvat()
@@ -2916,3 +3353,46 @@ def create_task(escrow_address: str, chain_id: int) -> None:
     with builder_type(manifest, escrow_address, chain_id) as task_builder:
         task_builder.set_logger(logger)
         task_builder.build()
+
+    # The task creation is finished, the progress is not needed anymore
+    try:
+        _TaskCreationCheckpoint.remove(
+            cloud_service.make_client(BucketAccessInfo.parse_obj(Config.storage_config)),
+            escrow_address,
+            chain_id,
+        )
+    except Exception as e:  # noqa: BLE001
+        logger.warning(
+            "Failed to remove the task creation checkpoint for escrow '%s': %s", escrow_address, e
+        )
+
+
+def discard_task_creation_progress(escrow_address: str, chain_id: int) -> bool:
+    """
+    Removes the CVAT objects left by the unfinished task creation attempts for the escrow.
+    The files uploaded to the oracle bucket are supposed to be removed with the escrow data.
+
+    Returns True if there was an unfinished task creation.
+    """
+
+    logger = get_function_logger(module_logger)
+
+    storage_client = cloud_service.make_client(BucketAccessInfo.parse_obj(Config.storage_config))
+    checkpoint = _TaskCreationCheckpoint.load(
+        storage_client, escrow_address, chain_id, logger=logger
+    )
+    if not checkpoint:
+        return False
+
+    # The tasks and webhooks are removed together with the projects
+    for object_type, delete_object in [
+        ("project", cvat_api.delete_project),
+        ("cloudstorage", cvat_api.delete_cloudstorage),
+    ]:
+        for key, object_id in checkpoint.cvat_objects.items():
+            if key.split(":", maxsplit=1)[0] == object_type:
+                with suppress(NotFoundException):
+                    delete_object(object_id)
+
+    _TaskCreationCheckpoint.remove(storage_client, escrow_address, chain_id)
+    return True
@@ -1,9 +1,11 @@
 import io
+import multiprocessing
 import os
 import zipfile
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, TemporaryFile
 
 import datumaro as dm
 from datumaro.components.dataset import Dataset
@@ -18,6 +20,7 @@ from src.core.storage import compose_data_bucket_filename
 from src.core.types import TaskTypes
 from src.handlers.job_creation import DM_DATASET_FORMAT_MAPPING
 from src.models.cvat import Image, Job
+from src.services.cloud import StorageClient
 from src.services.cloud import make_client as make_cloud_client
 from src.services.cloud.utils import BucketAccessInfo
 from src.utils.zip_archive import extract_zip_archive, write_dir_to_zip_archive
@@ -68,6 +71,9 @@ def prepare_annotation_metafile(jobs: list[Job]) -> FileDescriptor:
 
 
 class _TaskProcessor:
+    _parallel_job_conversion: bool = True
+    "Allows converting job annotations in the processing pool"
+
     def __init__(
         self,
         escrow_address: str,
@@ -90,34 +96,114 @@ class _TaskProcessor:
         ]
         self.output_format = DM_DATASET_FORMAT_MAPPING[manifest.annotation.type]
 
+    def _download_task_meta_file(
+        self, storage_client: StorageClient, filename: str, *, legacy_filename: str | None = None
+    ) -> bytes:
+        key = compose_data_bucket_filename(self.escrow_address, self.chain_id, filename)
+
+        if legacy_filename and not storage_client.file_exists(key):
+            key = compose_data_bucket_filename(self.escrow_address, self.chain_id, legacy_filename)
+
+        return storage_client.download_file(key)
+
     def _is_merged_dataset(self, ann_descriptor: FileDescriptor) -> bool:
-        return ann_descriptor == self.merged_annotation_file
+        return ann_descriptor.filename == self.merged_annotation_file.filename
+
+    def __getstate__(self):
+        # The processor is sent to the processing pool for job annotation conversion,
+        # which only needs the common task parameters
+        return {
+            "escrow_address": self.escrow_address,
+            "chain_id": self.chain_id,
+            "manifest": self.manifest,
+            "input_format": self.input_format,
+            "output_format": self.output_format,
+            "merged_annotation_file": FileDescriptor(self.merged_annotation_file.filename, None),
+        }
 
     def process(self):
         with TemporaryDirectory() as tempdir:
+            job_conversions = []
+            merged_conversion = None
             for ann_descriptor in self.annotation_files:
                 if not zipfile.is_zipfile(ann_descriptor.file):
                     raise ValueError("Annotation files must be zip files")
                 ann_descriptor.file.seek(0)
 
-                extract_dir = os.path.join(
-                    tempdir,
-                    os.path.splitext(os.path.basename(ann_descriptor.filename))[0],
-                )
+                name = os.path.splitext(os.path.basename(ann_descriptor.filename))[0]
+                extract_dir = os.path.join(tempdir, name)
                 extract_zip_archive(ann_descriptor.file, extract_dir)
 
-                export_dir = os.path.join(
-                    tempdir,
-                    os.path.splitext(os.path.basename(ann_descriptor.filename))[0] + "_conv",
+                conversion = (
+                    FileDescriptor(ann_descriptor.filename, None),
+                    extract_dir,
+                    os.path.join(tempdir, name + "_conv"),
+                    os.path.join(tempdir, name + "_conv.zip"),
+                )
+                if self._is_merged_dataset(ann_descriptor):
+                    merged_conversion = conversion
+                else:
+                    job_conversions.append(conversion)
+
+            self._convert_job_annotation_archives(job_conversions)
+
+            # The merged dataset can depend on the whole task, so it's processed separately
+            if merged_conversion:
+                self._convert_annotation_archive(*merged_conversion)
+
+            for ann_descriptor in self.annotation_files:
+                name = os.path.splitext(os.path.basename(ann_descriptor.filename))[0]
+                ann_descriptor.file = self._open_dataset_archive(
+                    os.path.join(tempdir, name + "_conv.zip")
                 )
 
-                self._process_annotation_file(ann_descriptor, extract_dir, export_dir)
+    def _convert_job_annotation_archives(
+        self, conversions: Sequence[tuple[FileDescriptor, str, str, str]]
+    ) -> None:
+        max_workers = min(Config.features.max_annotation_processing_workers, len(conversions))
+
+        if not self._parallel_job_conversion or max_workers <= 1:
+            for conversion in conversions:
+                self._convert_annotation_archive(*conversion)
+            return
+
+        # Forking is unsafe in a multithreaded process
+        with ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            # The results are awaited in order, the first error is raised
+            for _ in pool.map(self._convert_annotation_archive, *zip(*conversions, strict=True)):
+                pass
+
+    def _convert_annotation_archive(
+        self, ann_descriptor: FileDescriptor, input_dir: str, output_dir: str, archive_path: str
+    ) -> None:
+        self._process_annotation_file(ann_descriptor, input_dir, output_dir)
+
+        with open(archive_path, "wb") as archive_file:
+            write_dir_to_zip_archive(output_dir, archive_file)
+
+    @staticmethod
+    def _open_dataset_archive(archive_path: str) -> io.RawIOBase:
+        archive_file = open(archive_path, "rb")  # noqa: SIM115
+
+        # The opened file remains readable and is removed on close, like a TemporaryFile
+        os.unlink(archive_path)  # noqa: PTH108
 
-                converted_dataset_archive = io.BytesIO()
-                write_dir_to_zip_archive(export_dir, converted_dataset_archive)
-                converted_dataset_archive.seek(0)
+        return archive_file
 
-                ann_descriptor.file = converted_dataset_archive
+    @staticmethod
+    def _make_dataset_archive(dataset_dir: str) -> io.RawIOBase:
+        # The archive is written to disk to keep the memory use independent of the file count
+        archive_file = TemporaryFile()
+        try:
+            write_dir_to_zip_archive(dataset_dir, archive_file)
+            archive_file.seek(0)
+        except BaseException:
+            archive_file.close()
+            raise
+
+        return archive_file
 
     def _process_annotation_file(
         self, ann_descriptor: FileDescriptor, input_dir: str, output_dir: str
@@ -206,18 +292,18 @@ class _BoxesFromPointsTaskProcessor(_TaskProcessor):
         storage_client = make_cloud_client(oracle_data_bucket)
 
         roi_filenames = serializer.parse_roi_filenames(
-            storage_client.download_file(
-                compose_data_bucket_filename(
-                    self.escrow_address, self.chain_id, layout.ROI_FILENAMES_FILENAME
-                ),
+            self._download_task_meta_file(
+                storage_client,
+                layout.ROI_FILENAMES_FILENAME,
+                legacy_filename=layout.LEGACY_ROI_FILENAMES_FILENAME,
             )
         )
 
         rois = serializer.parse_roi_info(
-            storage_client.download_file(
-                compose_data_bucket_filename(
-                    self.escrow_address, self.chain_id, layout.ROI_INFO_FILENAME
-                ),
+            self._download_task_meta_file(
+                storage_client,
+                layout.ROI_INFO_FILENAME,
+                legacy_filename=layout.LEGACY_ROI_INFO_FILENAME,
             )
         )
 
@@ -278,6 +364,9 @@ class _BoxesFromPointsTaskProcessor(_TaskProcessor):
 
 
 class _SkeletonsFromBoxesTaskProcessor(_TaskProcessor):
+    # The job annotations are accumulated in the merged dataset during conversion
+    _parallel_job_conversion = False
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
@@ -303,18 +392,18 @@ class _SkeletonsFromBoxesTaskProcessor(_TaskProcessor):
         storage_client = make_cloud_client(oracle_data_bucket)
 
         roi_filenames = serializer.parse_roi_filenames(
-            storage_client.download_file(
-                compose_data_bucket_filename(
-                    self.escrow_address, self.chain_id, layout.ROI_FILENAMES_FILENAME
-                ),
+            self._download_task_meta_file(
+                storage_client,
+                layout.ROI_FILENAMES_FILENAME,
+                legacy_filename=layout.LEGACY_ROI_FILENAMES_FILENAME,
             )
         )
 
         rois = serializer.parse_roi_info(
-            storage_client.download_file(
-                compose_data_bucket_filename(
-                    self.escrow_address, self.chain_id, layout.ROI_INFO_FILENAME
-                ),
+            self._download_task_meta_file(
+                storage_client,
+                layout.ROI_INFO_FILENAME,
+                legacy_filename=layout.LEGACY_ROI_INFO_FILENAME,
             )
         )
 
@@ -569,11 +658,7 @@ class _SkeletonsFromBoxesTaskProcessor(_TaskProcessor):
             merged_dataset = self._process_merged_dataset(self.merged_dataset)
             self._export_dataset(merged_dataset, export_dir)
 
-            converted_dataset_archive = io.BytesIO()
-            write_dir_to_zip_archive(export_dir, converted_dataset_archive)
-            converted_dataset_archive.seek(0)
-
-            self.merged_annotation_file.file = converted_dataset_archive
+            self.merged_annotation_file.file = self._make_dataset_archive(export_dir)
 
 
 def postprocess_annotations(
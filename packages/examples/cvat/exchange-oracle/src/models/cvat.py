@@ -1,7 +1,7 @@
 # pylint: disable=too-few-public-methods
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.sql import func
 
@@ -24,9 +24,7 @@ class Project(BaseUUID):
     cvat_cloudstorage_id = Column(Integer, index=True, nullable=False)
     status = Column(String, Enum(ProjectStatuses), nullable=False)
     job_type = Column(String, Enum(TaskTypes), nullable=False)
-    escrow_address = Column(
-        String(42), unique=False, nullable=False
-    )  # TODO: extract into a separate model
+    escrow_address = Column(String(42), unique=False, nullable=False)
     chain_id = Column(Integer, Enum(Networks), nullable=False)
     bucket_url = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -75,11 +73,63 @@ class Project(BaseUUID):
         foreign_keys=[escrow_address, chain_id],
         overlaps="escrow_creation",
     )
+    escrow: Mapped[Escrow] = relationship(
+        back_populates="projects",
+        viewonly=True,
+        # A custom join is used because the foreign keys do not actually reference any objects
+        primaryjoin=(
+            "and_(Project.escrow_address == Escrow.escrow_address, "
+            "Project.chain_id == Escrow.chain_id)"
+        ),
+        foreign_keys=[escrow_address, chain_id],
+    )
 
     def __repr__(self) -> str:
         return f"Project. id={self.id}"
 
 
+class Escrow(BaseUUID):
+    """
+    Escrow-level information aggregated from the escrow projects.
+    The rows are maintained by the services layer, see services.cvat.sync_escrows().
+    """
+
+    __tablename__ = "escrows"
+    __table_args__ = (
+        UniqueConstraint("escrow_address", "chain_id", name="uix_escrows_escrow_chain"),
+        # The job list sorting orders
+        Index("ix_escrows_created_at_id", "created_at", "id"),
+        Index("ix_escrows_updated_at_created_at_id", "updated_at", "created_at", "id"),
+        Index("ix_escrows_chain_id_created_at_id", "chain_id", "created_at", "id"),
+        Index("ix_escrows_job_type_created_at_id", "job_type", "created_at", "id"),
+    )
+
+    escrow_address = Column(String(42), index=True, nullable=False)
+    chain_id = Column(Integer, Enum(Networks), nullable=False)
+    job_type = Column(String, Enum(TaskTypes), nullable=False)
+    status = Column(String, Enum(ProjectStatuses), index=True, nullable=False)
+    total_projects = Column(Integer, nullable=False)
+    created_projects = Column(Integer, nullable=False)  # the projects not in the creation status
+
+    # The earliest project creation and the latest project update times
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+    projects: Mapped[list[Project]] = relationship(
+        back_populates="escrow",
+        viewonly=True,
+        # A custom join is used because the foreign keys do not actually reference any objects
+        primaryjoin=(
+            "and_(Project.escrow_address == Escrow.escrow_address, "
+            "Project.chain_id == Escrow.chain_id)"
+        ),
+        foreign_keys=[Project.escrow_address, Project.chain_id],
+    )
+
+    def __repr__(self) -> str:
+        return f"Escrow. id={self.id} escrow={self.escrow_address}"
+
+
 class Task(ChildOf[Project]):
     __tablename__ = "tasks"
     cvat_id = Column(Integer, unique=True, index=True, nullable=False)
@@ -224,6 +274,24 @@ class User(Base):  # user does not have a UUID primary key
 
 class Assignment(ChildOf[Job]):
     __tablename__ = "assignments"
+    __table_args__ = (
+        # The user assignment list sorting orders
+        Index("ix_assignments_user_created_at_id", "user_wallet_address", "created_at", "id"),
+        Index(
+            "ix_assignments_user_expires_at_created_at_id",
+            "user_wallet_address",
+            "expires_at",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_assignments_user_status_created_at_id",
+            "user_wallet_address",
+            "status",
+            "created_at",
+            "id",
+        ),
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
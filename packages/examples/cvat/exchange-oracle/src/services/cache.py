@@ -1,5 +1,14 @@
-from collections.abc import Callable
+import logging
+import math
+import os
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import partial
+from threading import Lock
 from typing import Any, ClassVar
 
 import aiocache.serializers
@@ -7,6 +16,9 @@ import cachelib.serializers
 from cachelib import BaseCache, RedisCache
 
 from src.core.config import Config
+from src.log import get_logger_name
+
+logger = logging.getLogger(get_logger_name(__name__))
 
 
 class _RedisSerializer(cachelib.serializers.RedisSerializer):
@@ -79,6 +91,68 @@ def get_cache(name: str = "default") -> BaseCache:
     return manager.get_cache(name)
 
 
+class _MemoryLRUCache:
+    """
+    A size-limited in-process cache. The least recently used items are removed first.
+    If the TTL is set, the items expire after this time, in seconds.
+    Can be used by several threads at the same time.
+    """
+
+    def __init__(self, max_size: int, *, ttl: float | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            item, expires_at = self._items.get(key, (None, None))
+            if item is None:
+                return None
+
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+
+            self._items.move_to_end(key)
+            return item
+
+    def set(self, key: Hashable, item: Any) -> None:
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            self._items[key] = (item, expires_at)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_parsed_manifests = _MemoryLRUCache(
+    max_size=Config.features.parsed_manifest_cache_size,
+    ttl=Config.features.parsed_manifest_cache_ttl,
+)
+
+
+def _reset_locks_after_fork() -> None:
+    # The lock could be held by another thread of the parent process
+    _parsed_manifests._lock = Lock()
+
+
+os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
 class Cache:
     def _get_cache(self) -> BaseCache:
         return get_cache()
@@ -87,21 +161,219 @@ class Cache:
     def _make_key(escrow_address: str, chain_id: int) -> str:
         return f"{escrow_address}@{chain_id}"
 
-    def _get_or_set(self, key: str, set_callback, *, ttl: int | None = None):
-        cache = self._get_cache()
-        item = cache.get(key)
+    # The cached items are stored with their refresh time. After the refresh time,
+    # the items are kept in the cache for the stale_ttl period and returned as is,
+    # while one of the clients obtains the new value. To avoid many clients missing
+    # the same key at once, a client can also refresh an item a bit earlier,
+    # with the probability growing as the refresh time comes closer (XFetch).
+    _ENTRY_MARKER = "__cache_entry__"
+    _LOCK_SUFFIX = ":lock"
+
+    lock_timeout = 60
+    "Max time for obtaining a new value, in seconds. Other clients wait for the value meanwhile"
+
+    lock_poll_interval = 0.1
+
+    early_refresh_factor = 1.0
+    "Larger values make early refreshes more likely, 0 disables them"
+
+    @classmethod
+    def _pack_entry(cls, item: Any, *, ttl: int | None, delta: float) -> dict:
+        return {
+            cls._ENTRY_MARKER: 1,
+            "value": item,
+            "refresh_at": time.time() + ttl if ttl else None,
+            "delta": delta,
+        }
+
+    @classmethod
+    def _unpack_entry(cls, entry: Any) -> tuple[Any, float | None, float]:
+        "Returns the item, its refresh time and the time it took to obtain the item"
+
+        if isinstance(entry, dict) and entry.get(cls._ENTRY_MARKER):
+            return entry["value"], entry["refresh_at"], entry["delta"]
+
+        # An item written without metadata
+        return entry, None, 0
+
+    def _needs_refresh(self, refresh_at: float | None, delta: float) -> bool:
+        if refresh_at is None:
+            return False
 
-        if not item:
-            item = set_callback()
-            success = cache.set(key, item, timeout=ttl)
+        now = time.time()
+        if refresh_at <= now:
+            return True
+
+        # -log(x) is positive for x in (0; 1]
+        return (
+            now - delta * self.early_refresh_factor * math.log(1 - random.random())  # noqa: S311
+            >= refresh_at
+        )
+
+    def _set_item(
+        self, key: str, set_callback: Callable[[], Any], *, ttl: int | None, stale_ttl: int
+    ) -> Any:
+        started_at = time.perf_counter()
+        item = set_callback()
+        delta = time.perf_counter() - started_at
+
+        # Empty items are not cached
+        if item:
+            cache = self._get_cache()
+            success = cache.set(
+                key,
+                self._pack_entry(item, ttl=ttl, delta=delta),
+                timeout=ttl + stale_ttl if ttl else ttl,
+            )
             if not success:
                 raise Exception(f"Failed to write key {key} to the cache")
 
         return item
 
+    def _resolve_entry(
+        self,
+        key: str,
+        entry: Any,
+        set_callback: Callable[[], Any],
+        *,
+        ttl: int | None = None,
+        stale_ttl: int = 0,
+    ) -> Any:
+        """
+        Returns the item from the cache entry.
+        If there is no item or it needs to be refreshed, obtains a new item.
+        The new item is obtained by only one client at a time.
+        If a refresh fails, but there is a cached item, the cached item is returned.
+        """
+
+        cache = self._get_cache()
+        item, refresh_at, delta = self._unpack_entry(entry)
+        if item and not self._needs_refresh(refresh_at, delta):
+            return item
+
+        lock_key = key + self._LOCK_SUFFIX
+        if cache.add(lock_key, 1, timeout=self.lock_timeout):
+            try:
+                return self._set_item(key, set_callback, ttl=ttl, stale_ttl=stale_ttl)
+            except Exception:
+                if not item:
+                    raise
+
+                # The cached item is still usable, the next clients will retry the refresh
+                logger.exception(f"Failed to refresh the cached item {key}, using the cached one")
+                return item
+            finally:
+                cache.delete(lock_key)
+
+        if item:
+            # Another client is refreshing the item, the stale item can be used meanwhile
+            return item
+
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.lock_poll_interval)
+
+            item, *_ = self._unpack_entry(cache.get(key))
+            if item:
+                return item
+
+            if not cache.has(lock_key):
+                # The other client failed to obtain the item
+                break
+
+        return self._set_item(key, set_callback, ttl=ttl, stale_ttl=stale_ttl)
+
+    def _get_or_set(
+        self, key: str, set_callback, *, ttl: int | None = None, stale_ttl: int = 0
+    ) -> Any:
+        cache = self._get_cache()
+        return self._resolve_entry(key, cache.get(key), set_callback, ttl=ttl, stale_ttl=stale_ttl)
+
+    def _get_or_set_many(
+        self,
+        keys: Sequence[str],
+        set_callback: Callable[[str], Any],
+        *,
+        ttl: int | None = None,
+        stale_ttl: int = 0,
+        max_workers: int = 1,
+    ) -> dict[str, Any]:
+        if not keys:
+            return {}
+
+        cache = self._get_cache()
+        entries = dict(zip(keys, cache.get_many(*keys), strict=True))
+
+        items = {}
+        keys_to_resolve = []
+        for key, entry in entries.items():
+            item, refresh_at, delta = self._unpack_entry(entry)
+            if item and not self._needs_refresh(refresh_at, delta):
+                items[key] = item
+            else:
+                keys_to_resolve.append(key)
+
+        if keys_to_resolve:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(keys_to_resolve))) as pool:
+                resolved_items = pool.map(
+                    lambda key: self._resolve_entry(
+                        key,
+                        entries[key],
+                        partial(set_callback, key),
+                        ttl=ttl,
+                        stale_ttl=stale_ttl,
+                    ),
+                    keys_to_resolve,
+                )
+                items.update(zip(keys_to_resolve, resolved_items, strict=True))
+
+        return items
+
     def get_or_set_manifest(
         self, escrow_address: str, chain_id: int, *, set_callback: Callable[[], dict], **kwargs
     ) -> dict:
         kwargs.setdefault("ttl", Config.features.manifest_cache_ttl)
+        kwargs.setdefault("stale_ttl", Config.features.manifest_cache_stale_ttl)
         key = self._make_key(escrow_address, chain_id)
         return self._get_or_set(key, set_callback=set_callback, **kwargs)
+
+    def get_or_set_manifests(
+        self,
+        escrows: Sequence[tuple[str, int]],
+        *,
+        set_callback: Callable[[str, int], dict | None],
+        **kwargs,
+    ) -> dict[tuple[str, int], dict | None]:
+        """
+        Returns the manifests for the (escrow_address, chain_id) pairs.
+        The cached manifests are read in one request, the missing ones
+        are obtained with the callback in parallel.
+        """
+        kwargs.setdefault("ttl", Config.features.manifest_cache_ttl)
+        kwargs.setdefault("stale_ttl", Config.features.manifest_cache_stale_ttl)
+        kwargs.setdefault("max_workers", Config.features.max_manifest_download_connections)
+        keys = {
+            self._make_key(escrow_address, chain_id): (escrow_address, chain_id)
+            for escrow_address, chain_id in escrows
+        }
+        items = self._get_or_set_many(
+            list(keys), set_callback=lambda key: set_callback(*keys[key]), **kwargs
+        )
+        return {keys[key]: item for key, item in items.items()}
+
+    # The parsed manifests are kept in the process memory in front of the shared cache,
+    # so that they don't have to be deserialized and validated on each request.
+    # The entries of other processes are not affected by the removal,
+    # they expire after the parsed manifest cache TTL.
+
+    def get_parsed_manifest(self, escrow_address: str, chain_id: int) -> Any | None:
+        return _parsed_manifests.get((escrow_address, chain_id))
+
+    def set_parsed_manifest(self, escrow_address: str, chain_id: int, manifest: Any) -> None:
+        _parsed_manifests.set((escrow_address, chain_id), manifest)
+
+    def remove_parsed_manifest(self, escrow_address: str, chain_id: int) -> None:
+        _parsed_manifests.delete((escrow_address, chain_id))
+
+    def clear_parsed_manifests(self) -> None:
+        _parsed_manifests.clear()
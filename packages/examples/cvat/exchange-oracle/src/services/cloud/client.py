@@ -1,6 +1,149 @@
+import io
+import shutil
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager
+from threading import Condition
+from time import sleep
+from typing import IO
 from urllib.parse import unquote
 
+DEFAULT_MAX_UPLOAD_CONCURRENCY = 5
+DEFAULT_MAX_UPLOAD_IN_FLIGHT_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_UPLOAD_RETRIES = 3
+DEFAULT_UPLOAD_RETRY_DELAY = 0.5  # seconds
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+
+class _ByteBudget:
+    """
+    Limits the total size of the data being processed at once.
+    A single item bigger than the budget is allowed, when there are no other items.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._in_flight = 0
+        self._condition = Condition()
+
+    def acquire(self, size: int) -> None:
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not self._in_flight or self._in_flight + size <= self.limit
+            )
+            self._in_flight += size
+
+    def release(self, size: int) -> None:
+        with self._condition:
+            self._in_flight -= size
+            self._condition.notify_all()
+
+
+class BufferWriter(io.RawIOBase):
+    """
+    A write-only file object, which collects the written data in a single buffer.
+    If the final size is known, the buffer is allocated once.
+    """
+
+    def __init__(self, size: int | None = None) -> None:
+        super().__init__()
+        self._buffer = bytearray(size or 0)
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def write(self, data: bytes | memoryview) -> int:
+        size = len(data)
+        end = self._pos + size
+        if end <= len(self._buffer):
+            self._buffer[self._pos : end] = data
+        else:
+            del self._buffer[self._pos :]
+            self._buffer.extend(data)
+
+        self._pos = end
+        return size
+
+    def getbuffer(self) -> memoryview:
+        "Returns the written data without copying. The writer must not be used after this call"
+        del self._buffer[self._pos :]
+        return memoryview(self._buffer)
+
+
+class FileUploadWriter(io.RawIOBase):
+    """
+    A write-only file object, which uploads the written data into a bucket file.
+    When used as a context manager, the file is created on exit, or the upload is cancelled
+    if there was an error.
+    """
+
+    def writable(self) -> bool:
+        return True
+
+    @abstractmethod
+    def commit(self) -> None:
+        "Finishes the upload and creates the file"
+
+    @abstractmethod
+    def abort(self) -> None:
+        "Cancels the upload"
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            try:
+                self.commit()
+            except BaseException:
+                self.abort()
+                raise
+        else:
+            self.abort()
+
+
+class _BufferedUploadWriter(FileUploadWriter):
+    "Collects the written data in memory and creates the file with a single request"
+
+    def __init__(self, create_file: Callable[[bytes], None]) -> None:
+        super().__init__()
+        self._create_file = create_file
+        self._writer = BufferWriter()
+
+    def tell(self) -> int:
+        return self._writer.tell()
+
+    def write(self, data: bytes | memoryview) -> int:
+        return self._writer.write(data)
+
+    def commit(self) -> None:
+        self._create_file(bytes(self._writer.getbuffer()))
+        self.close()
+
+    def abort(self) -> None:
+        self.close()
+
+
+def read_into_buffer(
+    stream: io.RawIOBase,
+    *,
+    size: int | None = None,
+    chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+) -> memoryview:
+    """
+    Reads the stream till the end into a single buffer, chunk by chunk.
+    The expected size, if known, allows to avoid buffer reallocations.
+    """
+
+    writer = BufferWriter(size)
+    while chunk := stream.read(chunk_size):
+        writer.write(chunk)
+
+    return writer.getbuffer()
+
 
 class StorageClient(metaclass=ABCMeta):
     def __init__(
@@ -12,6 +155,107 @@ class StorageClient(metaclass=ABCMeta):
     @abstractmethod
     def create_file(self, key: str, data: bytes = b"", *, bucket: str | None = None): ...
 
+    def open_file_writer(
+        self, key: str, *, bucket: str | None = None
+    ) -> AbstractContextManager[IO[bytes]]:
+        """
+        Opens a file for writing. The data is uploaded while it's being written, if the storage
+        supports this, so the file contents don't have to be kept in memory.
+        The file is created at the end of the "with" block.
+        """
+
+        return _BufferedUploadWriter(lambda data: self.create_file(key, data, bucket=bucket))
+
+    def create_file_from_stream(
+        self, key: str, stream: IO[bytes], *, bucket: str | None = None
+    ) -> None:
+        "Uploads the stream contents, starting from the current position, in parts"
+
+        with self.open_file_writer(key, bucket=bucket) as writer:
+            shutil.copyfileobj(stream, writer, DEFAULT_UPLOAD_PART_SIZE)
+
+    def _make_file_creator(self, *, bucket: str | None = None) -> Callable[[str, bytes], None]:
+        """
+        Returns a thread-safe callable for file uploading into the bucket.
+        Can be overridden to reuse per-bucket objects between uploads.
+        """
+
+        def _create_file(key: str, data: bytes) -> None:
+            self.create_file(key, data, bucket=bucket)
+
+        return _create_file
+
+    def create_files(
+        self,
+        items: Iterable[tuple[str, bytes | IO[bytes]]],
+        *,
+        bucket: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_UPLOAD_CONCURRENCY,
+        max_in_flight_bytes: int = DEFAULT_MAX_UPLOAD_IN_FLIGHT_BYTES,
+        max_retries: int = DEFAULT_MAX_UPLOAD_RETRIES,
+    ) -> None:
+        """
+        Uploads several files in parallel.
+
+        The items are consumed lazily, so that the total size of the files being uploaded
+        doesn't exceed max_in_flight_bytes. Failed uploads are retried up to max_retries times.
+        If any file cannot be uploaded, the first error is raised after the started
+        uploads are finished.
+
+        items - (key, data) pairs. The data can be a seekable file object, which is uploaded
+            in parts from its current position.
+        """
+
+        create_file = self._make_file_creator(bucket=bucket)
+        byte_budget = _ByteBudget(max_in_flight_bytes)
+
+        def _is_stream(data: bytes | IO[bytes]) -> bool:
+            return not isinstance(data, bytes | bytearray | memoryview)
+
+        def _get_upload_size(data: bytes | IO[bytes]) -> int:
+            # Streams are uploaded in parts
+            return DEFAULT_UPLOAD_PART_SIZE if _is_stream(data) else len(data)
+
+        def _upload(key: str, data: bytes | IO[bytes]) -> None:
+            try:
+                start_position = data.tell() if _is_stream(data) else None
+
+                attempt = 0
+                while True:
+                    try:
+                        if start_position is None:
+                            create_file(key, data)
+                        else:
+                            data.seek(start_position)
+                            self.create_file_from_stream(key, data, bucket=bucket)
+
+                        return
+                    except Exception:
+                        attempt += 1
+                        if max_retries < attempt:
+                            raise
+
+                        sleep(DEFAULT_UPLOAD_RETRY_DELAY * 2 ** (attempt - 1))
+            finally:
+                byte_budget.release(_get_upload_size(data))
+
+        tasks: list[Future] = []
+        with ThreadPoolExecutor(max_concurrency) as pool:
+            for key, data in items:
+                if any(task.done() and task.exception() for task in tasks):
+                    break
+
+                byte_budget.acquire(_get_upload_size(data))
+                tasks.append(pool.submit(_upload, key, data))
+
+                tasks = [task for task in tasks if not task.done() or task.exception()]
+
+            wait(tasks)
+
+        for task in tasks:
+            if error := task.exception():
+                raise error
+
     @abstractmethod
     def remove_file(self, key: str, *, bucket: str | None = None): ...
 
@@ -24,6 +268,25 @@ class StorageClient(metaclass=ABCMeta):
     @abstractmethod
     def download_file(self, key: str, *, bucket: str | None = None) -> bytes: ...
 
+    @abstractmethod
+    def download_file_buffer(self, key: str, *, bucket: str | None = None) -> memoryview:
+        """
+        Downloads the file into a single preallocated buffer, avoiding intermediate copies.
+        The result can be used directly in decoding, e.g. with np.frombuffer().
+        """
+
+    @abstractmethod
+    def download_file_buffer_if_changed(
+        self, key: str, *, etag: str | None, bucket: str | None = None
+    ) -> tuple[memoryview | None, str]:
+        """
+        Downloads the file like download_file_buffer(), unless its current entity tag
+        matches the specified one. The tag changes when the file contents change,
+        which allows to check a previously downloaded file version without downloading it again.
+
+        Returns the file data (None if the file is not changed) and the current file entity tag.
+        """
+
     @abstractmethod
     def list_files(
         self,
@@ -1,13 +1,56 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from io import BytesIO
+from typing import IO
 from urllib.parse import unquote
 
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
+from google.cloud.storage.fileio import BlobWriter
 
-from src.services.cloud.client import StorageClient
+from src.services.cloud.client import (
+    DEFAULT_UPLOAD_PART_SIZE,
+    BufferWriter,
+    FileUploadWriter,
+    StorageClient,
+)
 
 DEFAULT_GCS_HOST = "storage.googleapis.com"
 
 
+class _GcsResumableUploadWriter(FileUploadWriter):
+    """
+    Uploads the written data in chunks of the fixed size, using a resumable upload.
+    The file is created only when the last chunk is sent on commit.
+    """
+
+    def __init__(self, writer: BlobWriter) -> None:
+        super().__init__()
+        self._writer = writer
+
+    def tell(self) -> int:
+        return self._writer.tell()
+
+    def write(self, data: bytes | memoryview) -> int:
+        return self._writer.write(data)
+
+    def commit(self) -> None:
+        self._writer.close()
+        self.close()
+
+    def abort(self) -> None:
+        # BlobWriter.close() always finalizes the upload, creating a file with partial data.
+        # Instead, the upload session is cancelled, if it was started,
+        # and the writer buffer is closed to prevent finalization on garbage collection.
+        upload_and_transport = self._writer._upload_and_transport
+        if upload_and_transport:
+            upload, transport = upload_and_transport
+            transport.delete(upload.resumable_url)
+
+        self._writer._buffer.close()
+        self.close()
+
+
 class GcsClient(StorageClient):
     def __init__(
         self,
@@ -27,6 +70,28 @@ class GcsClient(StorageClient):
         bucket_client = self.client.get_bucket(bucket)
         bucket_client.blob(unquote(key)).upload_from_string(data)
 
+    def _make_file_creator(self, *, bucket: str | None = None) -> Callable[[str, bytes], None]:
+        bucket = unquote(bucket) if bucket else self._bucket
+
+        # Avoid extra bucket metadata requests for each file, unlike get_bucket()
+        bucket_client = self.client.bucket(bucket)
+
+        def _create_file(key: str, data: bytes) -> None:
+            bucket_client.blob(unquote(key)).upload_from_string(data)
+
+        return _create_file
+
+    def open_file_writer(
+        self, key: str, *, bucket: str | None = None
+    ) -> AbstractContextManager[IO[bytes]]:
+        bucket = unquote(bucket) if bucket else self._bucket
+
+        return _GcsResumableUploadWriter(
+            self.client.bucket(bucket)
+            .blob(unquote(key))
+            .open("wb", chunk_size=DEFAULT_UPLOAD_PART_SIZE, ignore_flush=True)
+        )
+
     def remove_file(self, key: str, *, bucket: str | None = None) -> None:
         bucket = unquote(bucket) if bucket else self._bucket
         bucket_client = self.client.get_bucket(bucket)
@@ -60,6 +125,27 @@ class GcsClient(StorageClient):
             self.client.download_blob_to_file(blob, data)
             return data.getvalue()
 
+    def download_file_buffer(self, key: str, *, bucket: str | None = None) -> memoryview:
+        return self.download_file_buffer_if_changed(key, etag=None, bucket=bucket)[0]
+
+    def download_file_buffer_if_changed(
+        self, key: str, *, etag: str | None, bucket: str | None = None
+    ) -> tuple[memoryview | None, str]:
+        bucket = unquote(bucket) if bucket else self._bucket
+
+        # The blob metadata request provides the file tag
+        # and the file size for buffer preallocation
+        blob = self.client.bucket(bucket).get_blob(unquote(key))
+        if blob is None:
+            raise NotFound(f"The file '{key}' does not exist in the bucket '{bucket}'")
+
+        if etag and blob.etag == etag:
+            return None, etag
+
+        writer = BufferWriter(blob.size)
+        self.client.download_blob_to_file(blob, writer)
+        return writer.getbuffer(), blob.etag
+
     def list_files(
         self, *, bucket: str | None = None, prefix: str | None = None, trim_prefix: bool = False
     ) -> list[str]:
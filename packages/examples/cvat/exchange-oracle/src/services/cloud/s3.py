@@ -1,5 +1,6 @@
+from contextlib import AbstractContextManager, closing
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 from urllib.parse import unquote
 
 import boto3
@@ -8,7 +9,12 @@ import boto3.session
 from botocore.exceptions import ClientError
 from botocore.handlers import disable_signing
 
-from src.services.cloud.client import StorageClient
+from src.services.cloud.client import (
+    DEFAULT_UPLOAD_PART_SIZE,
+    FileUploadWriter,
+    StorageClient,
+    read_into_buffer,
+)
 
 DEFAULT_S3_HOST = "s3.amazonaws.com"
 if TYPE_CHECKING:
@@ -16,6 +22,88 @@ if TYPE_CHECKING:
     from mypy_boto3_s3 import S3ServiceResource as S3ServiceResourceStub
 
 
+class _S3MultipartUploadWriter(FileUploadWriter):
+    """
+    Uploads the written data in parts of the fixed size, using a multipart upload.
+    Small files are uploaded with a single request.
+    """
+
+    def __init__(
+        self,
+        client: "S3ClientStub",
+        *,
+        bucket: str,
+        key: str,
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+
+        self._buffer = bytearray()
+        self._position = 0
+        self._upload_id: str | None = None
+        self._parts: list[dict] = []
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data: bytes | memoryview) -> int:
+        self._buffer.extend(data)
+        self._position += len(data)
+
+        while self._part_size <= len(self._buffer):
+            self._upload_part(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+
+        return len(data)
+
+    def _upload_part(self, data: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key
+            )["UploadId"]
+
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Body=data,
+            Bucket=self._bucket,
+            Key=self._key,
+            PartNumber=part_number,
+            UploadId=self._upload_id,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    def commit(self) -> None:
+        if self._upload_id is None:
+            self._client.put_object(Body=bytes(self._buffer), Bucket=self._bucket, Key=self._key)
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+
+        self._buffer.clear()
+        self.close()
+
+    def abort(self) -> None:
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+            self._upload_id = None
+
+        self._buffer.clear()
+        self.close()
+
+
 class S3Client(StorageClient):
     def __init__(
         self,
@@ -47,6 +135,12 @@ class S3Client(StorageClient):
         bucket = unquote(bucket) if bucket else self._bucket
         self.client.put_object(Body=data, Bucket=bucket, Key=unquote(key))
 
+    def open_file_writer(
+        self, key: str, *, bucket: str | None = None
+    ) -> AbstractContextManager[IO[bytes]]:
+        bucket = unquote(bucket) if bucket else self._bucket
+        return _S3MultipartUploadWriter(self.client, bucket=bucket, key=unquote(key))
+
     def remove_file(self, key: str, *, bucket: str | None = None):
         bucket = unquote(bucket) if bucket else self._bucket
         self.client.delete_object(Bucket=bucket, Key=unquote(key))
@@ -72,6 +166,31 @@ class S3Client(StorageClient):
             self.client.download_fileobj(Bucket=bucket, Key=unquote(key), Fileobj=data)
             return data.getvalue()
 
+    def download_file_buffer(self, key: str, *, bucket: str | None = None) -> memoryview:
+        bucket = unquote(bucket) if bucket else self._bucket
+        response = self.client.get_object(Bucket=bucket, Key=unquote(key))
+        with closing(response["Body"]) as body:
+            return read_into_buffer(body, size=response.get("ContentLength"))
+
+    def download_file_buffer_if_changed(
+        self, key: str, *, etag: str | None, bucket: str | None = None
+    ) -> tuple[memoryview | None, str]:
+        bucket = unquote(bucket) if bucket else self._bucket
+
+        # A conditional request, the tag is checked and the data is downloaded in one request
+        try:
+            response = self.client.get_object(
+                Bucket=bucket, Key=unquote(key), **({"IfNoneMatch": etag} if etag else {})
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "304":
+                return None, etag
+            else:
+                raise
+
+        with closing(response["Body"]) as body:
+            return read_into_buffer(body, size=response.get("ContentLength")), response["ETag"]
+
     def list_files(
         self, *, bucket: str | None = None, prefix: str | None = None, trim_prefix: bool = False
     ) -> list[str]:
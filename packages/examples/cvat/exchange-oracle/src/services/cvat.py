@@ -9,7 +9,19 @@ from datetime import datetime
 from itertools import islice
 from typing import Any, NamedTuple
 
-from sqlalchemy import delete, func, literal, select, update
+from sqlalchemy import (
+    ColumnElement,
+    case,
+    delete,
+    event,
+    func,
+    inspect,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
@@ -28,6 +40,7 @@ from src.db.utils import maybe_for_update as _maybe_for_update
 from src.models.cvat import (
     Assignment,
     DataUpload,
+    Escrow,
     EscrowCreation,
     EscrowValidation,
     Image,
@@ -191,11 +204,12 @@ def complete_projects_with_completed_tasks(session: Session) -> list[int]:
         update(Project)
         .where(Project.status == ProjectStatuses.annotation, ~incomplete_tasks_exist)
         .values(status=ProjectStatuses.completed)
-        .returning(Project.cvat_id)
+        .returning(Project.cvat_id, Project.escrow_address, Project.chain_id)
     )
 
-    result = session.execute(stmt)
-    return [row.cvat_id for row in result.all()]
+    rows = session.execute(stmt).all()
+    sync_escrows(session, [(row.escrow_address, row.chain_id) for row in rows])
+    return [row.cvat_id for row in rows]
 
 
 def create_escrow_validations(session: Session, *, limit: int = 100) -> list[tuple[str, str, int]]:
@@ -203,15 +217,9 @@ def create_escrow_validations(session: Session, *, limit: int = 100) -> list[tup
         # Some of the code is likely to be only Postgres-related, e.g. UPDATE ... RETURNING as CTE
         raise NotImplementedError(f"DB engine {db_engine.driver} not supported in this operation")
 
-    project_counts_per_escrow = (
-        select(
-            Project.escrow_address,
-            Project.chain_id,
-            func.count().label("total_projects"),
-        )
-        .where(Project.status != ProjectStatuses.creation)
-        .group_by(Project.escrow_address, Project.chain_id)
-    ).subquery()  # TODO: store counts in escrow creations or in a new "escrows" table
+    project_counts_per_escrow = select(
+        Escrow.escrow_address, Escrow.chain_id, Escrow.created_projects
+    ).subquery()
     # must not lock and doesn't need a lock (this information is static for created escrows)
 
     working_set = (
@@ -248,7 +256,7 @@ def create_escrow_validations(session: Session, *, limit: int = 100) -> list[tup
         # it's not possible to use FOR UPDATE with GROUP BY or HAVING, which we need later
     )
 
-    all_completed_condition = func.count() == project_counts_per_escrow.c["total_projects"]
+    all_completed_condition = func.count() == project_counts_per_escrow.c["created_projects"]
     completed_projects = (
         select(working_set.c["escrow_address"], working_set.c["chain_id"])
         .select_from(working_set)
@@ -262,7 +270,7 @@ def create_escrow_validations(session: Session, *, limit: int = 100) -> list[tup
         .group_by(
             working_set.c["escrow_address"],
             working_set.c["chain_id"],
-            project_counts_per_escrow.c["total_projects"],
+            project_counts_per_escrow.c["created_projects"],
         )
         .having(all_completed_condition)
     ).subquery()  # compute counts on the locked rows
@@ -326,7 +334,9 @@ def create_escrow_validations(session: Session, *, limit: int = 100) -> list[tup
         .returning(EscrowValidation.id, EscrowValidation.escrow_address, EscrowValidation.chain_id)
     )
 
-    return session.execute(insert_stmt).all()
+    escrow_validations = session.execute(insert_stmt).all()
+    sync_escrows(session, [(row.escrow_address, row.chain_id) for row in escrow_validations])
+    return escrow_validations
 
 
 def get_available_projects(session: Session, *, limit: int = 10) -> list[Project]:
@@ -370,8 +380,13 @@ def get_projects_by_assignee(
 
 
 def update_project_status(session: Session, project_id: str, status: ProjectStatuses) -> None:
-    upd = update(Project).where(Project.id == project_id).values(status=status.value)
-    session.execute(upd)
+    upd = (
+        update(Project)
+        .where(Project.id == project_id)
+        .values(status=status.value)
+        .returning(Project.escrow_address, Project.chain_id)
+    )
+    sync_escrows(session, session.execute(upd).all())
 
 
 def update_project_statuses_by_escrow_address(
@@ -393,6 +408,7 @@ def update_project_statuses_by_escrow_address(
         .returning(Project.cvat_id)
     )
     session.execute(statement).all()
+    sync_escrows(session, [(escrow_address, chain_id)])
 
 
 def delete_project(session: Session, project_id: str) -> None:
@@ -407,6 +423,7 @@ def delete_projects(session: Session, escrow_address: str, chain_id: int) -> Non
             Project.chain_id == chain_id,
         )
     )
+    sync_escrows(session, [(escrow_address, chain_id)])
 
 
 def is_project_completed(session: Session, project_id: str) -> bool:
@@ -416,6 +433,187 @@ def is_project_completed(session: Session, project_id: str) -> bool:
 
 
 # Escrow
+ESCROW_STATUS_PRIORITY = [
+    ProjectStatuses.canceled,
+    ProjectStatuses.annotation,
+    ProjectStatuses.validation,
+    ProjectStatuses.completed,
+    ProjectStatuses.creation,
+    ProjectStatuses.recorded,
+    ProjectStatuses.deleted,
+]
+"""
+The escrow status is the status of its projects. If the projects have different statuses,
+the first one from this list is used.
+"""
+
+
+def sync_escrows(session: Session, escrows: Iterable[tuple[str, int]]) -> None:
+    """
+    Updates the escrow rows from the current escrow projects.
+    The escrows without projects are removed.
+
+    The project changes made through the ORM are synchronized on flush,
+    the bulk project updates and deletions must be followed by this call.
+    """
+    escrows = list({tuple(escrow) for escrow in escrows})
+    if not escrows:
+        return
+
+    escrow_key = tuple_(Escrow.escrow_address, Escrow.chain_id)
+
+    # Serialize concurrent updates of the same escrows, so that each update
+    # computes the aggregates from the changes committed by the previous ones.
+    # The rows are locked in the same order by all the updates to avoid deadlocks
+    session.execute(
+        select(Escrow.id).where(escrow_key.in_(escrows)).order_by(Escrow.id).with_for_update()
+    ).all()
+
+    status_rank = case(
+        {status.value: rank for rank, status in enumerate(ESCROW_STATUS_PRIORITY)},
+        value=Project.status,
+    )
+    aggregated_projects = (
+        select(
+            Project.escrow_address,
+            Project.chain_id,
+            func.min(Project.job_type),
+            case(
+                {rank: status.value for rank, status in enumerate(ESCROW_STATUS_PRIORITY)},
+                value=func.min(status_rank),
+            ),
+            func.count(),
+            func.count().filter(Project.status != ProjectStatuses.creation),
+            func.min(Project.created_at),
+            func.max(Project.updated_at),
+        )
+        .where(tuple_(Project.escrow_address, Project.chain_id).in_(escrows))
+        .group_by(Project.escrow_address, Project.chain_id)
+    )
+
+    aggregated_columns = (
+        "escrow_address",
+        "chain_id",
+        "job_type",
+        "status",
+        "total_projects",
+        "created_projects",
+        "created_at",
+        "updated_at",
+    )
+    upsert_stmt = insert(Escrow).from_select(aggregated_columns, aggregated_projects)
+    upsert_stmt = upsert_stmt.on_conflict_do_update(
+        index_elements=("escrow_address", "chain_id"),
+        set_={column: upsert_stmt.excluded[column] for column in aggregated_columns[2:]},
+    )
+    session.execute(upsert_stmt)
+
+    session.execute(
+        delete(Escrow)
+        .where(escrow_key.in_(escrows), ~Escrow.projects.any())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _touch_escrows(
+    session: Session, escrow_condition: ColumnElement[bool], time: datetime | ColumnElement
+) -> None:
+    """
+    Updates the escrow update time after the project updates, which don't change
+    the other aggregated values. It's cheaper than the full escrow synchronization.
+    """
+
+    locked_escrows = select(Escrow.id).where(escrow_condition).order_by(Escrow.id).with_for_update()
+    session.execute(
+        update(Escrow)
+        .where(
+            Escrow.id.in_(locked_escrows.scalar_subquery()),
+            or_(Escrow.updated_at.is_(None), Escrow.updated_at < time),
+        )
+        .values(updated_at=time)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _touch_project_escrows(session: Session, project_ids: Iterable[str], time: datetime) -> None:
+    _touch_escrows(
+        session,
+        tuple_(Escrow.escrow_address, Escrow.chain_id).in_(
+            select(Project.escrow_address, Project.chain_id).where(Project.id.in_(project_ids))
+        ),
+        time,
+    )
+
+
+_ESCROW_AGGREGATED_PROJECT_ATTRIBUTES = (
+    "escrow_address",
+    "chain_id",
+    "job_type",
+    "status",
+    "created_at",
+    "updated_at",
+)
+"The project attributes, explicit changes of which require the escrow synchronization"
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_flushed_escrows(session: Session, *_) -> None:
+    synced_escrows = session.info.setdefault("synced_escrows", set())
+    touched_escrows = session.info.setdefault("touched_escrows", set())
+
+    for obj in itertools.chain(session.new, session.deleted):
+        if isinstance(obj, Project):
+            synced_escrows.add((obj.escrow_address, obj.chain_id))
+
+    for obj in session.dirty:
+        # Relationship changes don't update the project row
+        if not isinstance(obj, Project) or not session.is_modified(obj, include_collections=False):
+            continue
+
+        attrs = inspect(obj).attrs
+        if any(attrs[name].history.has_changes() for name in _ESCROW_AGGREGATED_PROJECT_ATTRIBUTES):
+            synced_escrows.add((obj.escrow_address, obj.chain_id))
+
+            # The project can be moved from another escrow
+            synced_escrows.add(
+                tuple(
+                    (attrs[name].history.deleted or [getattr(obj, name)])[0]
+                    for name in ("escrow_address", "chain_id")
+                )
+            )
+        else:
+            # Only the update time is changed in the row, see Project.updated_at
+            touched_escrows.add((obj.escrow_address, obj.chain_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_flushed_escrows(session: Session, *_) -> None:
+    synced_escrows = session.info.pop("synced_escrows", None)
+    if synced_escrows:
+        sync_escrows(session, synced_escrows)
+
+    touched_escrows = session.info.pop("touched_escrows", None)
+    if touched_escrows := (touched_escrows or set()) - (synced_escrows or set()):
+        # The project update time is set by the database as the transaction time
+        _touch_escrows(
+            session,
+            tuple_(Escrow.escrow_address, Escrow.chain_id).in_(list(touched_escrows)),
+            func.now(),
+        )
+
+
+def get_escrow_by_escrow_address(
+    session: Session,
+    escrow_address: str,
+    chain_id: int,
+) -> Escrow | None:
+    return (
+        session.query(Escrow)
+        .where(Escrow.escrow_address == escrow_address, Escrow.chain_id == chain_id)
+        .first()
+    )
+
+
 def create_escrow_creation(
     session: Session,
     escrow_address: str,
@@ -509,6 +707,17 @@ def lock_escrow_for_validation(session: Session) -> EscrowValidation | None:
     return session.execute(query).scalar()
 
 
+def get_escrow_validations_by_status(
+    session: Session, status: EscrowValidationStatuses
+) -> list[EscrowValidation]:
+    query = (
+        select(EscrowValidation)
+        .where(EscrowValidation.status == status)
+        .order_by(EscrowValidation.created_at.asc())
+    )
+    return session.execute(query).scalars().all()
+
+
 def update_escrow_validation(
     session: Session,
     escrow_address: str,
@@ -1052,6 +1261,9 @@ def touch(
 
     session.execute(update(cls).where(cls.id.in_(ids)).values({cls.updated_at: time}))
 
+    if cls is Project:
+        _touch_project_escrows(session, ids, time)
+
     if touch_parents:
         touch_parent_objects(session, cls, ids, time=time)
 
@@ -1082,6 +1294,9 @@ def touch_parent_objects(
         ids = session.execute(parent_update_stmt).scalars().all()
         cls = parent_cls
 
+        if cls is Project:
+            _touch_project_escrows(session, ids, time)
+
 
 def touch_final_assignments(
     session: Session,
@@ -4,7 +4,7 @@ from collections.abc import Sequence
 from enum import Enum
 
 from attrs import define
-from sqlalchemy import case, update
+from sqlalchemy import case, func, update
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import select
 
@@ -17,6 +17,12 @@ from src.models.webhook import Webhook
 from src.utils.enums import BetterEnumMeta
 from src.utils.time import utcnow
 
+WEBHOOK_NOTIFICATION_CHANNEL = "webhooks"
+"""
+The database notification channel for new webhooks.
+The notification payload is "<direction>:<webhook type>".
+"""
+
 
 class OracleWebhookDirectionTags(str, Enum, metaclass=BetterEnumMeta):
     incoming = "incoming"
@@ -84,6 +90,15 @@ class OracleWebhookQueue:
 
             session.add(webhook)
 
+            # The notification is delivered after the transaction is committed
+            session.execute(
+                select(
+                    func.pg_notify(
+                        WEBHOOK_NOTIFICATION_CHANNEL, f"{self.direction.value}:{type.value}"
+                    )
+                )
+            )
+
             return webhook_id
         return existing_webhook.id
 
@@ -151,6 +166,45 @@ class OracleWebhookQueue:
         )
         session.execute(upd)
 
+    def handle_webhook_results(
+        self,
+        session: Session,
+        *,
+        succeeded_ids: Sequence[str] = (),
+        failed_ids: Sequence[str] = (),
+    ) -> None:
+        """
+        Updates the webhooks after a sending attempt, as handle_webhook_success()
+        and handle_webhook_fail() do, in a single statement.
+        """
+        if not succeeded_ids and not failed_ids:
+            return
+
+        is_failed = Webhook.id.in_(failed_ids)
+        upd = (
+            update(Webhook)
+            .where(Webhook.id.in_([*succeeded_ids, *failed_ids]))
+            .values(
+                attempts=Webhook.attempts + 1,
+                status=case(
+                    (~is_failed, OracleWebhookStatuses.completed.value),
+                    (
+                        Webhook.attempts + 1 >= Config.webhook_max_retries,
+                        OracleWebhookStatuses.failed.value,
+                    ),
+                    else_=OracleWebhookStatuses.pending.value,
+                ),
+                wait_until=case(
+                    (
+                        is_failed,
+                        utcnow() + datetime.timedelta(seconds=Config.webhook_delay_if_failed),
+                    ),
+                    else_=Webhook.wait_until,
+                ),
+            )
+        )
+        session.execute(upd)
+
 
 inbox = OracleWebhookQueue(direction=OracleWebhookDirectionTags.incoming)
 outbox = OracleWebhookQueue(
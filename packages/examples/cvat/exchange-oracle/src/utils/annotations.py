@@ -2,6 +2,7 @@ import os
 from argparse import ArgumentParser
 from collections.abc import Iterable, Sequence
 from copy import deepcopy
+from dataclasses import dataclass
 from glob import glob
 from typing import TypeVar
 
@@ -347,6 +348,92 @@ def is_point_in_bbox(px: float, py: float, bbox: dm.Bbox) -> bool:
     return (bbox.x <= px <= bbox.x + bbox.w) and (bbox.y <= py <= bbox.y + bbox.h)
 
 
+def match_points_in_boxes(points: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """
+    Computes the point-in-bbox matrix. Box borders are included.
+
+    points - (N, 2) array of (x, y)
+    boxes - (M, 4) array of (x, y, w, h)
+
+    Returns: (N, M) boolean array
+    """
+
+    px = points[:, 0, np.newaxis]
+    py = points[:, 1, np.newaxis]
+    bx, by, bw, bh = (boxes[np.newaxis, :, i] for i in range(4))
+    return (bx <= px) & (px <= bx + bw) & (by <= py) & (py <= by + bh)
+
+
+def match_overlapping_boxes(a_boxes: np.ndarray, b_boxes: np.ndarray) -> np.ndarray:
+    """
+    Computes the box overlap matrix. Only the boxes with a positive intersection area
+    are considered overlapping, which is the same as IoU > 0.
+
+    a_boxes - (N, 4) array of (x, y, w, h)
+    b_boxes - (M, 4) array of (x, y, w, h)
+
+    Returns: (N, M) boolean array
+    """
+
+    ax, ay, aw, ah = (a_boxes[:, np.newaxis, i] for i in range(4))
+    bx, by, bw, bh = (b_boxes[np.newaxis, :, i] for i in range(4))
+    intersection_w = np.minimum(ax + aw, bx + bw) - np.maximum(ax, bx)
+    intersection_h = np.minimum(ay + ah, by + bh) - np.maximum(ay, by)
+    return (intersection_w > 0) & (intersection_h > 0)
+
+
+@dataclass(frozen=True)
+class UnambiguousMatches:
+    matches: np.ndarray
+    "(N, M) boolean matrix of all the matches"
+
+    row_match_counts: np.ndarray
+    "(N,) array of match counts for the rows"
+
+    col_match_counts: np.ndarray
+    "(M,) array of match counts for the columns"
+
+    ambiguous_rows: np.ndarray
+    """
+    (N,) boolean array of the rows with several matches, or matching an ambiguous column
+    """
+
+    ambiguous_cols: np.ndarray
+    """
+    (M,) boolean array of the columns with several matches, or matching an ambiguous row
+    """
+
+    pairs: np.ndarray
+    "(K, 2) array of (row, column) indices of the unambiguous matches, ordered by row"
+
+
+def find_unambiguous_matches(matches: np.ndarray) -> UnambiguousMatches:
+    """
+    Finds 1-to-1 matches in a boolean match matrix. A row or column with several matches
+    is considered ambiguous, and all the matched columns or rows are excluded too.
+    """
+
+    row_match_counts = np.count_nonzero(matches, axis=1)
+    col_match_counts = np.count_nonzero(matches, axis=0)
+
+    ambiguous_rows = row_match_counts > 1
+    ambiguous_cols = col_match_counts > 1
+    ambiguous_rows, ambiguous_cols = (
+        ambiguous_rows | matches[:, ambiguous_cols].any(axis=1),
+        ambiguous_cols | matches[ambiguous_rows].any(axis=0),
+    )
+
+    unambiguous_matches = matches & ~ambiguous_rows[:, np.newaxis] & ~ambiguous_cols
+    return UnambiguousMatches(
+        matches=matches,
+        row_match_counts=row_match_counts,
+        col_match_counts=col_match_counts,
+        ambiguous_rows=ambiguous_rows,
+        ambiguous_cols=ambiguous_cols,
+        pairs=np.argwhere(unambiguous_matches),
+    )
+
+
 class InstanceSegmentsToBbox(dm.ItemTransform):
     """
     Replaces instance segments (masks, polygons) with a single ("head") bbox.
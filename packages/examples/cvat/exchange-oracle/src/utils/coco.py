@@ -0,0 +1,222 @@
+"""
+In-memory reading and writing of simple COCO instances annotation files.
+
+Datumaro only works with files on disk, which requires temporary directories and extra copies
+of the data. Here, the annotation files are parsed and produced directly from and to bytes.
+Only the bbox annotations are supported. For other content, the functions return None,
+and the caller is supposed to use Datumaro instead.
+"""
+
+import os
+from collections.abc import Iterable
+
+import datumaro as dm
+from datumaro.util import dump_json, parse_json
+
+COCO_INSTANCES_FORMAT = "coco_instances"
+
+
+class _UnsupportedCocoData(Exception):
+    pass
+
+
+def _check_type(value, expected_type: type | tuple[type, ...]):
+    if not isinstance(value, expected_type) or isinstance(value, bool):
+        raise _UnsupportedCocoData(f"Unexpected value type {type(value)}")
+
+    return value
+
+
+def _parse_coco_instances(data: bytes) -> dm.Dataset:
+    json_data = _check_type(parse_json(data), dict)
+
+    label_categories = dm.LabelCategories()
+    label_map: dict[int, int] = {}  # category id -> label id
+    for label_id, category in enumerate(
+        sorted(_check_type(json_data["categories"], list), key=lambda c: c["id"])
+    ):
+        label_map[_check_type(category["id"], int)] = label_id
+        label_categories.add(
+            _check_type(category["name"], str), parent=category.get("supercategory")
+        )
+
+    items: dict[int, dm.DatasetItem] = {}
+    for image_info in _check_type(json_data["images"], list):
+        image_id = _check_type(image_info["id"], int)
+        if image_id in items:
+            raise _UnsupportedCocoData(f"Duplicate image id {image_id}")
+
+        image_size = None
+        if image_info.get("height") and image_info.get("width"):
+            image_size = (
+                _check_type(image_info["height"], int),
+                _check_type(image_info["width"], int),
+            )
+
+        file_name = _check_type(image_info["file_name"], str)
+        items[image_id] = dm.DatasetItem(
+            id=os.path.splitext(file_name)[0],
+            media=dm.Image(path=file_name, size=image_size),
+            annotations=[],
+            attributes={"id": image_id},
+        )
+
+    for ann in _check_type(json_data["annotations"], list):
+        item = items.get(_check_type(ann["image_id"], int))
+        if not item:
+            continue  # Datumaro skips such annotations with a warning
+
+        segmentation = ann.get("segmentation")
+        if (segmentation and segmentation != [[]]) or "keypoints" in ann:
+            raise _UnsupportedCocoData("Only bbox annotations are supported")
+
+        ann_id = _check_type(ann["id"], int)
+
+        attributes = dict(_check_type(ann.get("attributes", {}), dict))
+        if "score" in ann:
+            attributes["score"] = _check_type(ann["score"], int | float)
+        attributes["is_crowd"] = bool(_check_type(ann["iscrowd"], int))
+
+        category_id = _check_type(ann["category_id"], int)
+        label_id = label_map[category_id] if category_id else None
+
+        x, y, w, h = (_check_type(v, int | float) for v in _check_type(ann["bbox"], list))
+        item.annotations.append(
+            dm.Bbox(
+                x,
+                y,
+                w,
+                h,
+                label=label_id,
+                id=ann_id,
+                attributes=attributes,
+                group=ann_id,  # the same as in Datumaro
+            )
+        )
+
+    return dm.Dataset.from_iterable(
+        items.values(),
+        categories={dm.AnnotationType.label: label_categories},
+        media_type=dm.Image,
+    )
+
+
+def try_parse_coco_instances(data: bytes) -> dm.Dataset | None:
+    """
+    Parses a COCO instances annotation file with bbox annotations, as Datumaro would do
+    for a file outside of a COCO dataset directory.
+
+    Returns None if the file has other annotations or is not valid.
+    """
+
+    try:
+        return _parse_coco_instances(data)
+    except Exception:  # noqa: BLE001
+        # The problem, if any, will be reported by Datumaro
+        return None
+
+
+def _check_unique_ids(anns: Iterable[dm.Annotation]):
+    ids = set()
+    groups = set()
+    for ann in anns:
+        if not ann.id or ann.id in ids:
+            raise _UnsupportedCocoData("Annotations must have unique ids")
+        ids.add(ann.id)
+
+        if ann.group and ann.group in groups:
+            raise _UnsupportedCocoData("Grouped annotations are not supported")
+        groups.add(ann.group)
+
+
+def _dump_coco_instances(dataset: dm.Dataset) -> bytes:
+    label_categories: dm.LabelCategories = dataset.categories()[dm.AnnotationType.label]
+
+    images = []
+    annotations = []
+    image_ids = set()
+    for item in dataset:
+        image = item.media
+        if not isinstance(image, dm.Image) or not image.path or not image.has_size:
+            raise _UnsupportedCocoData("Items must have images with known size")
+
+        image_id = _check_type(item.attributes.get("id"), int)
+        if image_id in image_ids:
+            raise _UnsupportedCocoData(f"Duplicate image id {image_id}")
+        image_ids.add(image_id)
+
+        image_h, image_w = image.size
+        images.append(
+            {
+                "id": image_id,
+                "width": int(image_w),
+                "height": int(image_h),
+                "file_name": item.id + (os.path.splitext(image.path)[1] or ".jpg"),
+                "license": 0,
+                "flickr_url": "",
+                "coco_url": "",
+                "date_captured": 0,
+            }
+        )
+
+        if any(not isinstance(ann, dm.Bbox) for ann in item.annotations):
+            raise _UnsupportedCocoData("Only bbox annotations are supported")
+
+        _check_unique_ids(item.annotations)
+
+        for bbox in item.annotations:
+            x, y, w, h = (float(v) for v in bbox.get_bbox())
+            attributes = dict(bbox.attributes)
+            is_crowd = attributes.pop("is_crowd", False)
+            score = attributes.pop("score", None)
+
+            ann = {
+                "id": bbox.id,
+                "image_id": image_id,
+                "category_id": bbox.label + 1 if bbox.label is not None else 0,
+                "segmentation": [],
+                "area": w * h,
+                "bbox": [x, y, w, h],
+                "iscrowd": int(is_crowd),
+            }
+            if score is not None:
+                ann["score"] = float(score)
+            if attributes:
+                ann["attributes"] = attributes
+
+            annotations.append(ann)
+
+    return dump_json(
+        {
+            "licenses": [{"name": "", "id": 0, "url": ""}],
+            "info": {
+                "contributor": "",
+                "date_created": "",
+                "description": "",
+                "url": "",
+                "version": "",
+                "year": "",
+            },
+            "categories": [
+                {"id": label_id + 1, "name": label.name, "supercategory": label.parent or ""}
+                for label_id, label in enumerate(label_categories)
+            ],
+            "images": images,
+            "annotations": annotations,
+        }
+    )
+
+
+def try_dump_coco_instances(dataset: dm.Dataset) -> bytes | None:
+    """
+    Produces a COCO instances annotation file for a dataset with bbox annotations.
+    The file can be imported by Datumaro.
+
+    Returns None if the dataset has other annotations or can't be exported this way.
+    """
+
+    try:
+        return _dump_coco_instances(dataset)
+    except Exception:  # noqa: BLE001
+        # The problem, if any, will be reported by Datumaro
+        return None
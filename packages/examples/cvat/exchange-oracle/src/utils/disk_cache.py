@@ -0,0 +1,126 @@
+import hashlib
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+
+_TEMP_FILE_PREFIX = ".tmp"
+_TAG_SEPARATOR = b"\n"
+
+
+class DiskCache:
+    """
+    A size-limited on-disk cache for binary objects with LRU eviction.
+
+    The cache directory can be shared by several threads and processes. The entries
+    are written atomically, a missing or removed entry is reported as a cache miss.
+
+    An entry can have a tag, e.g. the version of the cached object. The tag is stored
+    in the same file as the data, so they are always consistent.
+    """
+
+    def __init__(self, directory: str | os.PathLike, *, max_size: int) -> None:
+        assert max_size > 0
+
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+        self._lock = Lock()
+        self._size: int | None = None
+        "The estimated total size of the entries, bytes. Refreshed on eviction"
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _get_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / digest
+
+    def get(self, key: str) -> memoryview | None:
+        if (entry := self.get_with_tag(key)) is None:
+            return None
+
+        return entry[0]
+
+    def get_with_tag(self, key: str) -> tuple[memoryview, str] | None:
+        path = self._get_path(key)
+
+        try:
+            with path.open("rb") as f:
+                buffer = bytearray(os.fstat(f.fileno()).st_size)
+                if f.readinto(buffer) != len(buffer):
+                    return None
+
+            # Update the access time for LRU eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        tag_end = buffer.find(_TAG_SEPARATOR)
+        if tag_end == -1:
+            return None
+
+        return memoryview(buffer)[tag_end + 1 :], buffer[:tag_end].decode()
+
+    def put(self, key: str, data: bytes | bytearray | memoryview, *, tag: str = "") -> None:
+        header = tag.encode()
+        assert _TAG_SEPARATOR not in header
+
+        header += _TAG_SEPARATOR
+        size = len(header) + memoryview(data).nbytes
+        if self.max_size < size:
+            return
+
+        path = self._get_path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        with NamedTemporaryFile(dir=path.parent, prefix=_TEMP_FILE_PREFIX, delete=False) as f:
+            try:
+                f.write(header)
+                f.write(data)
+                f.close()
+                Path(f.name).replace(path)
+            except BaseException:
+                Path(f.name).unlink(missing_ok=True)
+                raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._get_entries_size()
+            else:
+                self._size += size
+
+            if self.max_size < self._size:
+                self._evict()
+
+    def _list_entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob("*/*"):
+            if path.name.startswith(_TEMP_FILE_PREFIX):
+                continue
+
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        return entries
+
+    def _get_entries_size(self) -> int:
+        return sum(size for _, size, _ in self._list_entries())
+
+    def _evict(self) -> None:
+        # Free some extra space to avoid directory scans on each new entry
+        target_size = int(self.max_size * 0.9)
+
+        entries = sorted(self._list_entries(), key=lambda e: e[0])
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_size <= target_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+        self._size = total_size
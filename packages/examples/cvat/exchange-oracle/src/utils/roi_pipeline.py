@@ -0,0 +1,330 @@
+"""
+A streaming pipeline for RoI image extraction:
+source items -> download -> decode -> RoI extraction and encoding -> upload
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import chain
+from threading import Lock
+from time import perf_counter
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+D = TypeVar("D")
+
+_end = object()
+
+BinaryData = bytes | bytearray | memoryview
+
+ProcessedFiles = Sequence[tuple[str, bytes]]
+"A list of (filename, file data) pairs, produced for a single source item"
+
+
+@dataclass
+class RoiPipelineStats:
+    downloaded_items: int = 0
+    downloaded_bytes: int = 0
+    processed_items: int = 0
+    produced_files: int = 0
+    uploaded_files: int = 0
+    uploaded_bytes: int = 0
+
+    peak_buffered_bytes: int = 0
+    "The maximum total size of the downloaded items waiting for processing"
+
+    download_time: float = 0
+    "Total time spent in downloading, seconds. Summed over all the workers"
+
+    decoding_time: float = 0
+    "Total time spent in decoding, seconds. Summed over all the workers"
+
+    processing_time: float = 0
+    "Total time spent in RoI extraction and encoding, seconds. Summed over all the workers"
+
+    upload_time: float = 0
+    "Total time spent in uploading, seconds. Summed over all the workers"
+
+    total_time: float = 0
+    "Wall clock time of the pipeline run, seconds"
+
+    def _rate(self, value: float) -> float:
+        return value / self.total_time if self.total_time else 0
+
+    def __str__(self) -> str:
+        mb = 1024 * 1024
+        return (
+            f"images: {self.processed_items} ({self._rate(self.processed_items):.1f}/s), "
+            f"downloaded: {self.downloaded_bytes / mb:.1f} MB "
+            f"({self._rate(self.downloaded_bytes) / mb:.1f} MB/s), "
+            f"peak buffer: {self.peak_buffered_bytes / mb:.1f} MB, "
+            f"RoIs: {self.produced_files} ({self._rate(self.produced_files):.1f}/s), "
+            f"uploaded: {self.uploaded_bytes / mb:.1f} MB "
+            f"({self._rate(self.uploaded_bytes) / mb:.1f} MB/s), "
+            f"stage times: download {self.download_time:.1f}s, "
+            f"decoding {self.decoding_time:.1f}s, "
+            f"processing {self.processing_time:.1f}s, "
+            f"upload {self.upload_time:.1f}s, "
+            f"total {self.total_time:.1f}s"
+        )
+
+
+def _process_item(
+    process: Callable[[T, D], ProcessedFiles],
+    item: T,
+    data: D,
+    decode: Callable[[BinaryData], D] | None = None,
+) -> tuple[ProcessedFiles, float, float]:
+    decoding_time = 0
+    if decode is not None:
+        started_at = perf_counter()
+        data = decode(data)
+        decoding_time = perf_counter() - started_at
+
+    started_at = perf_counter()
+    results = process(item, data)
+    processing_time = perf_counter() - started_at
+
+    return results, decoding_time, processing_time
+
+
+def _get_data_size(data: BinaryData | D) -> int:
+    nbytes = getattr(data, "nbytes", None)  # memoryview, np.ndarray
+    return nbytes if nbytes is not None else len(data)
+
+
+def _make_picklable(data: BinaryData) -> bytes | bytearray:
+    if isinstance(data, memoryview):
+        # A memoryview can't be pickled, but the underlying buffer can be passed without a copy
+        if isinstance(data.obj, bytes | bytearray) and data.nbytes == len(data.obj):
+            return data.obj
+
+        return data.tobytes()
+
+    return data
+
+
+class RoiExtractionPipeline(Generic[T, D]):
+    """
+    Runs the RoI extraction stages concurrently, with bounded queues between stages.
+
+    Downloading and uploading are I/O-bound and run in thread pools. Decoding and RoI processing
+    are CPU-bound. If processing_workers is 0, decoding is done in the download threads and
+    RoI processing is done in the calling thread. Otherwise, both are done in a process pool,
+    so the decode and process callbacks and the items must be picklable.
+
+    The downloaded items can be limited either by count or by the total size in memory.
+    The size limit is preferable when the source files vary in size a lot. Note that in the
+    inline mode the decoded data is counted.
+    """
+
+    def __init__(
+        self,
+        *,
+        download_workers: int,
+        upload_workers: int,
+        processing_workers: int = 0,
+        download_queue_size: int | None = None,
+        download_buffer_size: int | None = None,
+        processing_queue_size: int | None = None,
+        upload_queue_size: int | None = None,
+    ) -> None:
+        assert download_workers > 0
+        assert upload_workers > 0
+        assert processing_workers >= 0
+
+        self.download_workers = download_workers
+        self.upload_workers = upload_workers
+        self.processing_workers = processing_workers
+
+        if not download_queue_size and not download_buffer_size:
+            download_queue_size = 4 * download_workers
+
+        self.download_queue_size = download_queue_size
+        "The maximum number of downloaded or downloading items waiting for processing"
+
+        self.download_buffer_size = download_buffer_size
+        """
+        The maximum total size of the downloaded items waiting for processing, in bytes.
+        If set, the downloads are started only while the buffered data fits into this limit.
+        At least one item is always allowed, so a single large item can exceed the limit.
+        """
+
+        self.processing_queue_size = processing_queue_size or 2 * processing_workers
+        "The maximum number of items being processed in the process pool"
+
+        self.upload_queue_size = upload_queue_size or 4 * upload_workers
+        "The maximum number of produced files waiting for uploading"
+
+    def _make_processing_pool(self) -> Executor:
+        # Forking is unsafe in a multithreaded process
+        return ProcessPoolExecutor(
+            self.processing_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def run(
+        self,
+        items: Iterable[T],
+        *,
+        download: Callable[[T], BinaryData],
+        decode: Callable[[BinaryData], D],
+        process: Callable[[T, D], ProcessedFiles],
+        upload: Callable[[str, bytes], None],
+    ) -> RoiPipelineStats:
+        "Process all the input items and upload the produced files"
+
+        use_processing_pool = self.processing_workers > 0
+
+        stats = RoiPipelineStats()
+        stats_lock = Lock()
+        buffered_bytes = 0
+
+        def _update_buffered_bytes(delta: int) -> None:
+            nonlocal buffered_bytes
+
+            with stats_lock:
+                buffered_bytes += delta
+                stats.peak_buffered_bytes = max(stats.peak_buffered_bytes, buffered_bytes)
+
+        def _download(item: T) -> BinaryData | D:
+            started_at = perf_counter()
+            data = download(item)
+            downloaded_at = perf_counter()
+
+            with stats_lock:
+                stats.downloaded_items += 1
+                stats.downloaded_bytes += _get_data_size(data)
+                stats.download_time += downloaded_at - started_at
+
+            if not use_processing_pool:
+                data = decode(data)
+
+                with stats_lock:
+                    stats.decoding_time += perf_counter() - downloaded_at
+
+            _update_buffered_bytes(_get_data_size(data))
+            return data
+
+        def _upload(filename: str, data: bytes) -> None:
+            started_at = perf_counter()
+            upload(filename, data)
+
+            with stats_lock:
+                stats.uploaded_files += 1
+                stats.uploaded_bytes += len(data)
+                stats.upload_time += perf_counter() - started_at
+
+        download_tasks: deque[tuple[T, Future[BinaryData | D]]] = deque()
+        processing_tasks: deque[tuple[Future[tuple[ProcessedFiles, float, float]], int]] = deque()
+        upload_tasks: deque[Future[None]] = deque()
+
+        def _put_results(result: tuple[ProcessedFiles, float, float]) -> None:
+            produced_files, decoding_time, processing_time = result
+
+            with stats_lock:
+                stats.processed_items += 1
+                stats.produced_files += len(produced_files)
+                stats.decoding_time += decoding_time
+                stats.processing_time += processing_time
+
+            for filename, data in produced_files:
+                upload_tasks.append(upload_pool.submit(_upload, filename, data))
+
+                while len(upload_tasks) > self.upload_queue_size:
+                    upload_tasks.popleft().result()
+
+        started_at = perf_counter()
+        with ExitStack() as es:
+            download_pool = es.enter_context(ThreadPoolExecutor(self.download_workers))
+            upload_pool = es.enter_context(ThreadPoolExecutor(self.upload_workers))
+
+            processing_pool = None
+            if use_processing_pool:
+                processing_pool = es.enter_context(self._make_processing_pool())
+
+            item_iter = iter(items)
+
+            def _can_start_download() -> bool:
+                if not download_tasks:
+                    return True
+
+                if self.download_queue_size and self.download_queue_size <= len(download_tasks):
+                    return False
+
+                if self.download_buffer_size:
+                    # The size of the pending downloads is not known yet,
+                    # so only keep the download workers busy
+                    pending_downloads = sum(not task.done() for _, task in download_tasks)
+                    if self.download_workers <= pending_downloads:
+                        return False
+
+                    with stats_lock:
+                        if self.download_buffer_size <= buffered_bytes:
+                            return False
+
+                return True
+
+            def _finish_processing(task: Future, data_size: int) -> None:
+                try:
+                    _put_results(task.result())
+                finally:
+                    _update_buffered_bytes(-data_size)
+
+            def _fill_download_queue() -> None:
+                while _can_start_download():
+                    item = next(item_iter, _end)
+                    if item is _end:
+                        break
+
+                    download_tasks.append((item, download_pool.submit(_download, item)))
+
+            try:
+                while True:
+                    _fill_download_queue()
+                    if not download_tasks:
+                        break
+
+                    item, download_task = download_tasks.popleft()
+                    data = download_task.result()
+                    data_size = _get_data_size(data)
+                    if processing_pool:
+                        processing_tasks.append(
+                            (
+                                processing_pool.submit(
+                                    _process_item, process, item, _make_picklable(data), decode
+                                ),
+                                data_size,
+                            )
+                        )
+
+                        while len(processing_tasks) > self.processing_queue_size:
+                            _finish_processing(*processing_tasks.popleft())
+                    else:
+                        try:
+                            _put_results(_process_item(process, item, data))
+                        finally:
+                            _update_buffered_bytes(-data_size)
+
+                while processing_tasks:
+                    _finish_processing(*processing_tasks.popleft())
+
+                while upload_tasks:
+                    upload_tasks.popleft().result()
+            except BaseException:
+                for task in chain(
+                    (task for _, task in download_tasks),
+                    (task for task, _ in processing_tasks),
+                    upload_tasks,
+                ):
+                    task.cancel()
+
+                raise
+
+        stats.total_time = perf_counter() - started_at
+        return stats
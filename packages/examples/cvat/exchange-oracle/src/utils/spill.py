@@ -0,0 +1,59 @@
+import io
+import os
+import shutil
+from contextlib import ExitStack
+from tempfile import TemporaryFile
+from threading import Lock
+from typing import IO
+
+
+class SpillStorage:
+    """
+    Keeps binary files in memory until their total size reaches the limit.
+    The next files are copied into temporary files on disk, which are removed on close.
+
+    Can be used from several threads.
+    """
+
+    def __init__(self, *, max_memory_size: int, directory: str | os.PathLike | None = None) -> None:
+        self.max_memory_size = max_memory_size
+        self.directory = directory
+
+        self._lock = Lock()
+        self._memory_size = 0
+        self._exit_stack = ExitStack()
+
+    def store(self, file: IO[bytes]) -> IO[bytes]:
+        """
+        Returns a file with the same contents, positioned at the beginning.
+        The input file is returned as is, if it fits into the memory limit.
+        """
+
+        file.seek(0, io.SEEK_END)
+        size = file.tell()
+        file.seek(0)
+
+        with self._lock:
+            if self._memory_size + size <= self.max_memory_size:
+                self._memory_size += size
+                return file
+
+            spilled_file = self._exit_stack.enter_context(TemporaryFile(dir=self.directory))
+
+        shutil.copyfileobj(file, spilled_file)
+        spilled_file.seek(0)
+        return spilled_file
+
+    @property
+    def memory_size(self) -> int:
+        return self._memory_size
+
+    def close(self) -> None:
+        with self._lock:
+            self._exit_stack.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,147 @@
+"""
+Concurrent delivery of outgoing webhooks.
+
+The webhooks are sent by a single process-wide HTTP client, so the connections
+to the other oracles are reused between the requests and the cron job runs.
+The receiver URLs require several chain requests to be resolved, so they are resolved
+once per escrow in a batch.
+"""
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+
+import httpx
+
+from src.core.config import Config
+from src.models.webhook import Webhook
+from src.utils.webhooks import prepare_outgoing_webhook_body, prepare_signed_message
+
+_client: httpx.Client | None = None
+_client_lock = Lock()
+
+
+def get_http_client() -> httpx.Client:
+    global _client  # noqa: PLW0603
+
+    client = _client
+    if client:
+        return client
+
+    with _client_lock:
+        if not _client:
+            max_connections = Config.webhook_delivery_concurrency
+            _client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=max_connections, max_keepalive_connections=max_connections
+                )
+            )
+
+        return _client
+
+
+def _reset_client_after_fork() -> None:
+    # The connections can't be shared with the parent process
+    global _client, _client_lock  # noqa: PLW0603
+    _client = None
+    _client_lock = Lock()
+
+
+os.register_at_fork(after_in_child=_reset_client_after_fork)
+
+
+@dataclass
+class WebhookDeliveryResult:
+    webhook: Webhook
+    error: Exception | None = None
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _WebhookRequest:
+    url: str
+    headers: dict[str, str]
+    body: dict
+
+
+def _prepare_request(url: str, webhook: Webhook, *, with_timestamp: bool) -> _WebhookRequest:
+    body = prepare_outgoing_webhook_body(
+        webhook.escrow_address,
+        webhook.chain_id,
+        webhook.event_type,
+        webhook.event_data,
+        timestamp=webhook.created_at if with_timestamp else None,
+    )
+    _, signature = prepare_signed_message(
+        webhook.escrow_address,
+        webhook.chain_id,
+        body=body,
+    )
+    return _WebhookRequest(url=url, headers={"human-signature": signature}, body=body)
+
+
+def _send_request(client: httpx.Client, request: _WebhookRequest) -> Exception | None:
+    try:
+        response = client.post(request.url, headers=request.headers, json=request.body)
+        response.raise_for_status()
+    except Exception as e:  # noqa: BLE001
+        return e
+
+    return None
+
+
+def deliver_webhooks(
+    webhooks: Sequence[Webhook],
+    url_getter: Callable[[int, str], str],
+    *,
+    with_timestamp: bool = True,
+    max_concurrency: int | None = None,
+) -> list[WebhookDeliveryResult]:
+    """
+    Sends the webhooks concurrently. The errors are not raised, but returned in the results.
+    The results are returned in the order of the webhooks.
+    """
+
+    if max_concurrency is None:
+        max_concurrency = Config.webhook_delivery_concurrency
+
+    urls: dict[tuple[int, str], str | Exception] = {}
+    results = [WebhookDeliveryResult(webhook) for webhook in webhooks]
+    requests: dict[int, _WebhookRequest] = {}
+
+    # The requests are prepared in the calling thread,
+    # the webhook objects are bound to the caller's DB session
+    for i, webhook in enumerate(webhooks):
+        url_key = (webhook.chain_id, webhook.escrow_address)
+        if url_key not in urls:
+            try:
+                urls[url_key] = url_getter(*url_key)
+            except Exception as e:  # noqa: BLE001
+                urls[url_key] = e
+
+        url = urls[url_key]
+        if isinstance(url, Exception):
+            results[i].error = url
+            continue
+
+        try:
+            requests[i] = _prepare_request(url, webhook, with_timestamp=with_timestamp)
+        except Exception as e:  # noqa: BLE001
+            results[i].error = e
+
+    if not requests:
+        return results
+
+    client = get_http_client()
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(requests))) as pool:
+        errors = pool.map(lambda request: _send_request(client, request), requests.values())
+
+        for i, error in zip(requests, errors, strict=True):
+            results[i].error = error
+
+    return results
@@ -172,10 +172,10 @@ def test_can_list_jobs_200_with_address_and_pagination(
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         # check default pagination parameters
         response = client.get(
@@ -203,6 +203,83 @@ def test_can_list_jobs_200_with_address_and_pagination(
                 )
 
 
+def _list_with_cursor(
+    client: TestClient, url: str, *, page_size: int, params: dict | None = None
+) -> list[dict]:
+    results = []
+    cursor = ""
+    while cursor is not None:
+        response = client.get(
+            url,
+            headers=get_auth_header(),
+            params={
+                **(params or {}),
+                "page_size": page_size,
+                "cursor": cursor,
+                "include_total": not cursor,
+            },
+        )
+        assert response.status_code == 200
+        page = response.json()
+
+        if not cursor:
+            assert page["total_results"] is not None
+        else:
+            assert page["total_results"] is None
+
+        assert len(page["results"]) <= page_size
+        results.extend(page["results"])
+        cursor = page["next_cursor"]
+
+    return results
+
+
+def test_can_list_jobs_200_with_cursor_pagination(client: TestClient, session: Session) -> None:
+    session.begin()
+    user = User(
+        wallet_address=user_address,
+        cvat_email=cvat_email,
+        cvat_id=1,
+    )
+    session.add(user)
+
+    jobs_count = 7
+    for i in range(jobs_count):
+        _, _, cvat_job = create_project_task_and_job(
+            session, f"0x86e83d346041E8806e352681f3F14549C0d2BC6{i}", i + 1
+        )
+        if i % 2:
+            cvat.touch(session, Job, [cvat_job.id])
+        session.commit()
+
+    with (
+        open("tests/utils/manifest.json") as data,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
+    ):
+        manifest = json.load(data)
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
+
+        for sort_field, sort in product(("created_at", "updated_at", "chain_id"), ("ASC", "DESC")):
+            params = {"sort_field": sort_field, "sort": sort}
+
+            response = client.get(
+                "/job", headers=get_auth_header(), params={**params, "page_size": jobs_count}
+            )
+            assert response.status_code == 200
+            expected_escrows = [j["escrow_address"] for j in response.json()["results"]]
+            assert len(expected_escrows) == jobs_count
+
+            for page_size in (1, 3, jobs_count):
+                results = _list_with_cursor(client, "/job", page_size=page_size, params=params)
+                assert [j["escrow_address"] for j in results] == expected_escrows
+
+
+def test_cannot_list_jobs_400_with_invalid_cursor(client: TestClient) -> None:
+    response = client.get("/job", headers=get_auth_header(), params={"cursor": "invalid"})
+    assert response.status_code == 400
+    assert response.json() == {"errors": [{"field": "cursor", "message": "Invalid cursor"}]}
+
+
 def test_can_list_jobs_200_without_escrows_in_hidden_states(
     client: TestClient, session: Session
 ) -> None:
@@ -233,10 +310,10 @@ def test_can_list_jobs_200_without_escrows_in_hidden_states(
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         response = client.get(
             "/job",
@@ -287,10 +364,10 @@ def test_can_list_jobs_200_with_only_one_entry_per_escrow_address_if_several_pro
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         response = client.get(
             "/job",
@@ -323,10 +400,10 @@ def test_can_list_jobs_200_with_fields(client: TestClient, session: Session) ->
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         required_fields = {
             "escrow_address",
@@ -402,10 +479,10 @@ def test_can_list_jobs_200_with_sorting(client: TestClient, session: Session) ->
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         for sort_field, case_converter in product(
             (
@@ -518,10 +595,10 @@ def test_can_list_jobs_200_with_filters(client: TestClient, session: Session):
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         for filter_key, filter_values in {
             "status": (
@@ -594,10 +671,10 @@ def test_can_list_jobs_200_check_values(client: TestClient, session: Session) ->
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         response = client.get(
             "/job",
@@ -649,10 +726,10 @@ def test_can_list_jobs_200_without_address(client: TestClient, session: Session)
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         response = client.get(
             "/job",
@@ -779,7 +856,7 @@ def test_can_create_assignment_200(client: TestClient, session: Session) -> None
     session.commit()
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
         patch("src.services.exchange.cvat_api") as cvat_api,
     ):
         manifest = json.load(data)
@@ -967,10 +1044,10 @@ def test_can_list_assignments_200(client: TestClient, session: Session) -> None:
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         for filter_key, filter_values in {
             "status": (
@@ -1044,10 +1121,10 @@ def test_can_list_assignments_200_with_sorting(client: TestClient, session: Sess
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
 
         for sort_field, case_converter in product(
             (
@@ -1081,6 +1158,71 @@ def test_can_list_assignments_200_with_sorting(client: TestClient, session: Sess
             assert result_acs == result_desc
 
 
+def test_can_list_assignments_200_with_cursor_pagination(
+    client: TestClient, session: Session
+) -> None:
+    session.begin()
+    user = User(
+        wallet_address=user_address,
+        cvat_email=cvat_email,
+        cvat_id=1,
+    )
+    session.add(user)
+
+    assignments_count = 5
+    for i in range(assignments_count):
+        _, _, cvat_job = create_project_task_and_job(
+            session, f"0x86e83d346041E8806e352681f3F14549C0d2BC6{i}", i + 1
+        )
+
+        assignment = Assignment(
+            id=str(uuid.uuid4()),
+            user_wallet_address=user_address,
+            cvat_job_id=cvat_job.cvat_id,
+            expires_at=utcnow() + timedelta(hours=i % 2 + 1),
+            status=AssignmentStatuses.created if i % 2 else AssignmentStatuses.completed,
+        )
+        session.add(assignment)
+        session.commit()
+
+    with (
+        open("tests/utils/manifest.json") as data,
+        patch("src.chain.escrow.get_escrow_manifests") as mock_get_manifests,
+    ):
+        manifest = json.load(data)
+        mock_get_manifests.side_effect = lambda escrows, **_: dict.fromkeys(escrows, manifest)
+
+        for sort_field, sort in product(("status", "expires_at"), ("ASC", "DESC")):
+            params = {"sort_field": sort_field, "sort": sort}
+
+            response = client.get(
+                "/assignment",
+                headers=get_auth_header(),
+                params={**params, "page_size": assignments_count},
+            )
+            assert response.status_code == 200
+            expected_assignments = [a["assignment_id"] for a in response.json()["results"]]
+            assert len(expected_assignments) == assignments_count
+
+            results = _list_with_cursor(client, "/assignment", page_size=2, params=params)
+            assert [a["assignment_id"] for a in results] == expected_assignments
+
+
+def test_cannot_list_assignments_400_with_cursor_and_project_sorting(client: TestClient) -> None:
+    for sort_field in ("chain_id", "job_type"):
+        response = client.get(
+            "/assignment",
+            headers=get_auth_header(),
+            params={"sort_field": sort_field, "cursor": ""},
+        )
+        assert response.status_code == 400
+        assert response.json() == {
+            "errors": [
+                {"field": "cursor", "message": "The cursor can't be used with the sorting field"}
+            ]
+        }
+
+
 def test_can_resign_assignment_200(client: TestClient, session: Session) -> None:
     session.begin()
     cvat_project, cvat_task, cvat_job = create_project_task_and_job(
@@ -1389,7 +1531,7 @@ def test_can_list_jobs_200_check_updated_at(client: TestClient, session: Session
 
     with (
         open("tests/utils/manifest.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
         patch("src.services.exchange.cvat_api"),
     ):
         manifest = json.load(data)
@@ -16,6 +16,7 @@ from alembic import command as alembic_command
 from alembic.config import Config
 from src import app
 from src.db import SessionLocal, engine
+from src.services.cache import Cache
 
 alembic_config = Config(Path(__file__).parent.parent / "alembic.ini")
 
@@ -84,6 +85,12 @@ def init_db(alembic) -> None:
         ) from e
 
 
+@pytest.fixture(autouse=True)
+def clear_parsed_manifests() -> None:
+    "The parsed manifests are kept in the process memory between the requests"
+    Cache().clear_parsed_manifests()
+
+
 @pytest.fixture(scope="module")
 def client() -> Generator:
     with TestClient(app) as c:
@@ -1,15 +1,21 @@
 import json
 import unittest
+import uuid
+from copy import copy
 from unittest.mock import patch
 
 import pytest
 from human_protocol_sdk.constants import ChainId, Status
 from human_protocol_sdk.encryption import EncryptionUtils
 from human_protocol_sdk.escrow import EscrowClientError, EscrowData
+from human_protocol_sdk.storage import StorageFileNotFoundError
 
 from src.chain.escrow import (
     get_available_webhook_types,
     get_escrow_manifest,
+    get_escrow_manifests,
+    get_escrow_task_manifest,
+    invalidate_escrow_manifest,
     validate_escrow,
 )
 from src.core.types import OracleWebhookTypes
@@ -122,6 +128,59 @@ class ServiceIntegrationTest(unittest.TestCase):
         with pytest.raises(EscrowClientError, match="Invalid escrow address: invalid_address"):
             get_escrow_manifest(chain_id, "invalid_address")
 
+    def test_get_escrow_manifests(self):
+        escrow_addresses = ["0x" + uuid.uuid4().hex[:40].ljust(40, "0") for _ in range(3)]
+        missing_escrow_address = escrow_addresses[2]
+
+        def _download_file(url: str) -> bytes:
+            if url == missing_escrow_address:
+                raise StorageFileNotFoundError("Not found")
+            return json.dumps({"title": url}).encode()
+
+        def _get_escrow(_chain_id: ChainId, escrow_address: str) -> EscrowData:
+            # The manifests are downloaded concurrently
+            escrow_data = copy(self.escrow_data)
+            escrow_data.manifest_url = escrow_address
+            return escrow_data
+
+        with (
+            patch("src.chain.escrow.EscrowUtils.get_escrow", side_effect=_get_escrow),
+            patch(
+                "src.chain.escrow.StorageUtils.download_file_from_url", side_effect=_download_file
+            ) as mock_download,
+        ):
+            escrows = [(chain_id, escrow_address) for escrow_address in escrow_addresses]
+
+            manifests = get_escrow_manifests(escrows, skip_missing=True)
+            assert manifests == {
+                (chain_id, escrow_address): {"title": escrow_address}
+                for escrow_address in escrow_addresses[:2]
+            }
+            assert mock_download.call_count == 3
+
+            # The found manifests are cached
+            mock_download.reset_mock()
+            assert get_escrow_manifests(escrows, skip_missing=True) == manifests
+            assert mock_download.call_count == 1
+
+            with pytest.raises(StorageFileNotFoundError, match="Not found"):
+                get_escrow_manifests(escrows)
+
+    def test_get_escrow_task_manifest(self):
+        with (
+            open("tests/utils/manifest.json") as data,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
+        ):
+            mock_get_manifest.return_value = json.load(data)
+
+            manifest = get_escrow_task_manifest(chain_id, escrow_address)
+            assert get_escrow_task_manifest(chain_id, escrow_address) is manifest
+            assert mock_get_manifest.call_count == 1
+
+            invalidate_escrow_manifest(chain_id, escrow_address)
+            assert get_escrow_task_manifest(chain_id, escrow_address) == manifest
+            assert mock_get_manifest.call_count == 2
+
     def test_get_available_webhook_types(self):
         with patch("src.chain.escrow.EscrowUtils.get_escrow") as mock_function:
             mock_function.return_value = self.escrow_data
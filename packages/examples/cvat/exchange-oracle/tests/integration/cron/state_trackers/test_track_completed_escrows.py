@@ -24,7 +24,7 @@ from src.core.types import (
     TaskTypes,
 )
 from src.crons import track_completed_escrows
-from src.crons.cvat.state_trackers import track_escrow_validations
+from src.crons.cvat.state_trackers import prefetch_job_annotations, track_escrow_validations
 from src.db import SessionLocal
 from src.handlers.completed_escrows import handle_escrow_export
 from src.models.cvat import (
@@ -40,7 +40,8 @@ from src.models.cvat import (
 from src.models.webhook import Webhook
 from src.services.cvat import create_escrow_validations
 
-from tests.utils.db_helper import create_project_task_and_job
+from tests.utils.db_helper import create_job, create_project_task_and_job
+from tests.utils.storage_helpers import make_storage_client_mock
 
 
 class _TestException(RuntimeError): ...
@@ -264,9 +265,10 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             patch("src.handlers.completed_escrows.validate_escrow"),
+            patch("src.handlers.completed_escrows.cvat_api") as mock_cvat_api,
             patch("src.handlers.completed_escrows.cloud_service") as mock_cloud_service,
         ):
-            mock_storage_client = Mock()
+            mock_storage_client = make_storage_client_mock()
             mock_storage_client.create_file = Mock()
             mock_storage_client.list_files = Mock(return_value=[])
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
@@ -281,6 +283,10 @@ class ServiceIntegrationTest(unittest.TestCase):
         assert webhook is not None
         assert webhook.event_type == ExchangeOracleEventTypes.job_finished
 
+        # the job annotations are prefetched separately, see prefetch_job_annotations
+        mock_cvat_api.request_job_annotations.assert_not_called()
+        assert mock_storage_client.create_file.call_count == 1  # meta
+
         db_project = self.session.query(Project).filter_by(id=project_id).first()
         assert db_project.status == ProjectStatuses.validation
 
@@ -377,6 +383,7 @@ class ServiceIntegrationTest(unittest.TestCase):
             patch("src.handlers.completed_escrows.cloud_service") as mock_cloud_service,
             patch("src.services.cloud.make_client"),
         ):
+            mock_cloud_service.make_client.return_value = make_storage_client_mock()
             mock_cloud_service.make_client.return_value.create_file.side_effect = _TestException()
 
             track_escrow_validations()
@@ -469,7 +476,7 @@ class ServiceIntegrationTest(unittest.TestCase):
             patch("src.handlers.completed_escrows.validate_escrow"),
             patch("src.handlers.completed_escrows.cloud_service") as mock_cloud_service,
         ):
-            mock_storage_client = Mock()
+            mock_storage_client = make_storage_client_mock()
             mock_storage_client.create_file = Mock()
             mock_storage_client.list_files = Mock(return_value=[])
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
@@ -490,6 +497,105 @@ class ServiceIntegrationTest(unittest.TestCase):
         for db_project in project1, project2, project3:
             assert db_project.status == ProjectStatuses.validation
 
+    def _create_escrow_in_validation(
+        self, escrow_address: str, *, job_count: int
+    ) -> list[tuple[Job, Assignment]]:
+        project, task, job = create_project_task_and_job(self.session, escrow_address, 1)
+        project.status = ProjectStatuses.validation
+        jobs = [job] + [
+            create_job(
+                self.session,
+                cvat_id=i + 1,
+                cvat_task_id=task.cvat_id,
+                cvat_project_id=project.cvat_id,
+            )
+            for i in range(1, job_count)
+        ]
+
+        user = User(
+            wallet_address="0x86e83d346041E8806e352681f3F14549C0d2BC67",
+            cvat_email="test@hmt.ai",
+            cvat_id=1,
+        )
+        self.session.add(user)
+
+        job_assignments = []
+        for job in jobs:
+            job.status = JobStatuses.completed
+            assignment = Assignment(
+                id=str(uuid.uuid4()),
+                user_wallet_address=user.wallet_address,
+                cvat_job_id=job.cvat_id,
+                expires_at=datetime.now() + timedelta(days=1),
+                completed_at=datetime.now(),
+                status=AssignmentStatuses.completed,
+            )
+            self.session.add(assignment)
+            job_assignments.append((job, assignment))
+
+        self.session.add(
+            EscrowValidation(
+                id=str(uuid.uuid4()),
+                escrow_address=escrow_address,
+                chain_id=project.chain_id,
+                status=EscrowValidationStatuses.in_progress,
+            )
+        )
+
+        self.session.commit()
+
+        return job_assignments
+
+    def _prefetch_job_annotations(self, *, cached_filenames: list[str]) -> tuple[Mock, Mock, bool]:
+        with (
+            open("tests/utils/manifest.json") as data,
+            patch("src.handlers.completed_escrows.get_escrow_manifest") as mock_get_manifest,
+            patch("src.handlers.completed_escrows.cvat_api") as mock_cvat_api,
+            patch("src.handlers.completed_escrows.cloud_service") as mock_cloud_service,
+        ):
+            mock_get_manifest.return_value = json.load(data)
+            mock_cvat_api.get_job_annotations.side_effect = lambda **_: io.BytesIO(b"annotations")
+
+            mock_storage_client = make_storage_client_mock()
+            mock_storage_client.create_file = Mock()
+            mock_storage_client.list_files = Mock(return_value=cached_filenames)
+            mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
+
+            has_more_jobs = prefetch_job_annotations()
+
+        return mock_cvat_api, mock_storage_client, has_more_jobs
+
+    def test_can_prefetch_job_annotations_of_escrow_in_validation(self):
+        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        (job1, assignment1), (job2, _) = self._create_escrow_in_validation(
+            escrow_address, job_count=2
+        )
+
+        mock_cvat_api, mock_storage_client, has_more_jobs = self._prefetch_job_annotations(
+            cached_filenames=[f"job_{job1.cvat_id}-assignment_{assignment1.id}.zip"]
+        )
+
+        # only the job missing in the cache is exported and cached
+        mock_cvat_api.request_job_annotations.assert_called_once()
+        assert mock_cvat_api.request_job_annotations.call_args.args[0] == job2.cvat_id
+        assert mock_storage_client.create_file.call_count == 1
+        assert not has_more_jobs
+
+    def test_can_limit_prefetched_job_annotations_per_run(self):
+        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        self._create_escrow_in_validation(escrow_address, job_count=3)
+
+        with patch(
+            "src.handlers.completed_escrows.CronConfig.prefetch_job_annotations_max_jobs", 2
+        ):
+            mock_cvat_api, mock_storage_client, has_more_jobs = self._prefetch_job_annotations(
+                cached_filenames=[]
+            )
+
+        assert mock_cvat_api.request_job_annotations.call_count == 2
+        assert mock_storage_client.create_file.call_count == 2
+        assert has_more_jobs
+
     def test_can_export_escrow(self):
         escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
         chain_id = Networks.localhost
@@ -600,7 +706,7 @@ class ServiceIntegrationTest(unittest.TestCase):
             mock_cvat_api.get_job_annotations.return_value = dummy_zip_file
             mock_cvat_api.get_project_annotations.return_value = dummy_zip_file
 
-            mock_storage_client = Mock()
+            mock_storage_client = make_storage_client_mock()
             mock_storage_client.create_file = Mock()
             mock_storage_client.list_files = Mock(return_value=[])
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
@@ -624,6 +730,153 @@ class ServiceIntegrationTest(unittest.TestCase):
             mock_cvat_api.get_job_annotations.call_count
             or mock_cvat_api.get_project_annotations.call_count
         )
+        # meta + merged + per job anns + cached job anns
+        assert mock_storage_client.create_file.call_count == 4
+
+    def test_can_export_escrow_with_cached_job_annotations(self):
+        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        chain_id = Networks.localhost
+
+        cvat_project_id = 1
+        project_id = str(uuid.uuid4())
+        cvat_project = Project(
+            id=project_id,
+            cvat_id=cvat_project_id,
+            cvat_cloudstorage_id=1,
+            status=ProjectStatuses.validation,
+            job_type=TaskTypes.image_label_binary,
+            escrow_address=escrow_address,
+            chain_id=chain_id,
+            bucket_url="https://test.storage.googleapis.com/",
+        )
+        self.session.add(cvat_project)
+
+        project_images = ["sample1.jpg", "sample2.png"]
+        for image_filename in project_images:
+            self.session.add(
+                Image(
+                    id=str(uuid.uuid4()), cvat_project_id=cvat_project_id, filename=image_filename
+                )
+            )
+
+        cvat_task_id = 1
+        cvat_task = Task(
+            id=str(uuid.uuid4()),
+            cvat_id=cvat_task_id,
+            cvat_project_id=cvat_project_id,
+            status=TaskStatuses.completed,
+        )
+        self.session.add(cvat_task)
+
+        cvat_job = Job(
+            id=str(uuid.uuid4()),
+            cvat_id=1,
+            cvat_project_id=cvat_project_id,
+            cvat_task_id=cvat_task_id,
+            status=JobStatuses.completed,
+            start_frame=0,
+            stop_frame=1,
+        )
+        self.session.add(cvat_job)
+        wallet_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        user = User(
+            wallet_address=wallet_address,
+            cvat_email="test@hmt.ai",
+            cvat_id=1,
+        )
+        self.session.add(user)
+
+        wallet_address_2 = "0x86e83d346041E8806e352681f3F14549C0d2BC68"
+        user = User(
+            wallet_address=wallet_address_2,
+            cvat_email="test2@hmt.ai",
+            cvat_id=2,
+        )
+        self.session.add(user)
+        assignment = Assignment(
+            id=str(uuid.uuid4()),
+            user_wallet_address=wallet_address,
+            cvat_job_id=cvat_job.cvat_id,
+            expires_at=datetime.now() + timedelta(days=1),
+        )
+        self.session.add(assignment)
+
+        creation_id = str(uuid.uuid4())
+        creation = EscrowCreation(
+            id=creation_id,
+            escrow_address=escrow_address,
+            chain_id=chain_id,
+            created_at=datetime.now(),
+            finished_at=datetime.now(),
+            total_jobs=1,
+        )
+        self.session.add(creation)
+
+        self.session.commit()
+
+        with (
+            open("tests/utils/manifest.json") as data,
+            patch("src.handlers.completed_escrows.get_escrow_manifest") as mock_get_manifest,
+            patch("src.handlers.completed_escrows.validate_escrow"),
+            patch("src.handlers.completed_escrows.cvat_api") as mock_cvat_api,
+            patch("src.handlers.completed_escrows.cloud_service") as mock_cloud_service,
+        ):
+            manifest = json.load(data)
+            mock_get_manifest.return_value = manifest
+
+            dummy_zip_file = io.BytesIO()
+            with zipfile.ZipFile(dummy_zip_file, "w") as archive, TemporaryDirectory() as tempdir:
+                mock_dataset = dm.Dataset(
+                    media_type=dm.Image,
+                    categories={
+                        dm.AnnotationType.label: dm.LabelCategories.from_iterable(["cat", "dog"])
+                    },
+                )
+                for image_filename in project_images:
+                    mock_dataset.put(dm.DatasetItem(id=os.path.splitext(image_filename)[0]))
+                mock_dataset.export(tempdir, format="coco_instances")
+
+                for filename in list(glob(os.path.join(tempdir, "**/*"), recursive=True)):
+                    archive.write(filename, os.path.relpath(filename, tempdir))
+            dummy_zip_file.seek(0)
+
+            mock_cvat_api.get_job_annotations.return_value = dummy_zip_file
+            mock_cvat_api.get_project_annotations.return_value = dummy_zip_file
+
+            def _list_files(*, prefix, trim_prefix):
+                assert trim_prefix
+
+                if "/job_annotations/" in prefix:
+                    return [f"job_{cvat_job.cvat_id}-assignment_{assignment.id}.zip"]
+
+                return []
+
+            mock_storage_client = make_storage_client_mock()
+            mock_storage_client.create_file = Mock()
+            mock_storage_client.list_files = Mock(side_effect=_list_files)
+            mock_storage_client.download_file = Mock(return_value=dummy_zip_file.getvalue())
+            mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
+
+            handle_escrow_export(
+                logger=Mock(),
+                session=self.session,
+                escrow_address=escrow_address,
+                chain_id=chain_id,
+            )
+
+        webhook = (
+            self.session.query(Webhook)
+            .filter_by(escrow_address=escrow_address, chain_id=chain_id)
+            .first()
+        )
+        assert webhook is not None
+        assert webhook.event_type == ExchangeOracleEventTypes.escrow_recorded
+
+        # only the project annotations are exported, the job annotations are not changed
+        mock_cvat_api.request_job_annotations.assert_not_called()
+        mock_cvat_api.get_job_annotations.assert_not_called()
+        assert mock_cvat_api.get_project_annotations.call_count == 1
+        mock_storage_client.download_file.assert_called_once()
         assert mock_storage_client.create_file.call_count == 3  # meta + merged + per job anns
 
     def test_can_export_escrow_error_getting_annotations(self):
@@ -712,7 +965,7 @@ class ServiceIntegrationTest(unittest.TestCase):
             mock_get_manifest.return_value = manifest
 
             mock_create_file = Mock()
-            mock_storage_client = Mock()
+            mock_storage_client = make_storage_client_mock()
             mock_storage_client.create_file = mock_create_file
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
 
@@ -850,6 +1103,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
             mock_cvat_api.get_job_annotations.return_value = dummy_zip_file
             mock_cvat_api.get_project_annotations.return_value = dummy_zip_file
+            mock_cloud_service.make_client.return_value = make_storage_client_mock()
             mock_cloud_service.make_client.return_value.create_file.side_effect = _TestException()
 
             with pytest.raises(_TestException):
@@ -1002,7 +1256,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
             mock_postprocess_annotations.side_effect = _fake_postprocess_annotations
 
-            mock_storage_client = Mock()
+            mock_storage_client = make_storage_client_mock()
             mock_storage_client.create_file = Mock()
             mock_storage_client.list_files = Mock(return_value=[])
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
@@ -1024,4 +1278,4 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         assert mock_cvat_api.get_job_annotations.call_count >= 3
         assert mock_cvat_api.get_project_annotations.call_count == 0
-        assert mock_storage_client.create_file.call_count == 5  # meta + jobs + merged
+        assert mock_storage_client.create_file.call_count == 8  # meta + jobs + merged + cache
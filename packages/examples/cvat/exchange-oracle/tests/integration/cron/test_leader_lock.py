@@ -0,0 +1,57 @@
+import unittest
+
+from sqlalchemy import func, select
+
+from src.crons._leader_lock import LeaderLock
+from src.db import engine
+
+
+class LeaderLockTest(unittest.TestCase):
+    def setUp(self):
+        self.leader = LeaderLock("test-lock")
+        self.follower = LeaderLock("test-lock")
+
+    def tearDown(self):
+        self.leader.release()
+        self.follower.release()
+
+    def test_can_acquire_lock_in_one_instance_only(self):
+        assert self.leader.try_acquire()
+        assert not self.follower.try_acquire()
+
+        assert self.leader.is_acquired
+        assert self.leader.check()
+        assert not self.follower.is_acquired
+
+    def test_can_acquire_different_locks(self):
+        assert self.leader.try_acquire()
+
+        other_lock = LeaderLock("other-test-lock")
+        try:
+            assert other_lock.try_acquire()
+        finally:
+            other_lock.release()
+
+    def test_can_acquire_lock_after_release(self):
+        assert self.leader.try_acquire()
+        assert not self.follower.try_acquire()
+
+        self.leader.release()
+
+        assert not self.leader.is_acquired
+        assert self.follower.try_acquire()
+        assert not self.leader.try_acquire()
+
+    def test_can_acquire_lock_after_connection_loss(self):
+        assert self.leader.try_acquire()
+        assert not self.follower.try_acquire()
+
+        leader_pid = self.leader._connection.execute(select(func.pg_backend_pid())).scalar()
+        self.leader._connection.commit()
+
+        with engine.connect() as connection:
+            connection.execute(select(func.pg_terminate_backend(leader_pid)))
+
+        assert not self.leader.check()
+        assert not self.leader.is_acquired
+        assert self.follower.try_acquire()
@@ -4,9 +4,14 @@ import uuid
 from unittest.mock import MagicMock, Mock, call, patch
 
 from human_protocol_sdk.constants import ChainId, Status
-from sqlalchemy.sql import select
+from sqlalchemy.sql import select, update
 
-from src.core.storage import compose_data_bucket_prefix, compose_results_bucket_prefix
+from src.core.config import Config
+from src.core.storage import (
+    compose_data_bucket_filename,
+    compose_data_bucket_prefix,
+    compose_results_bucket_prefix,
+)
 from src.core.types import (
     ExchangeOracleEventTypes,
     JobLauncherEventTypes,
@@ -23,10 +28,12 @@ from src.crons.webhooks.job_launcher import (
 )
 from src.cvat.api_calls import RequestStatus
 from src.db import SessionLocal
-from src.models.cvat import EscrowCreation, Image, Project
+from src.handlers.job_creation import TASK_CREATION_CHECKPOINT_FILENAME
+from src.models.cvat import EscrowCreation, Image, Project, Task
 from src.models.webhook import Webhook
 from src.services.cloud import StorageClient
 from src.services.webhook import OracleWebhookDirectionTags
+from src.utils.time import utcnow
 
 from tests.utils.constants import DEFAULT_MANIFEST_URL, JOB_LAUNCHER_ADDRESS
 from tests.utils.dataset_helpers import build_gt_dataset
@@ -114,6 +121,75 @@ class ServiceIntegrationTest(unittest.TestCase):
         assert db_escrow_creation_tracker.projects == [db_project]
         assert db_escrow_creation_tracker.total_jobs == 1
 
+    def test_process_incoming_job_launcher_webhooks_escrow_created_type_concurrent_task_setup(
+        self,
+    ):
+        webhook_id = str(uuid.uuid4())
+        webhook = Webhook(
+            id=webhook_id,
+            signature="signature",
+            escrow_address=escrow_address,
+            chain_id=chain_id,
+            type=OracleWebhookTypes.job_launcher.value,
+            status=OracleWebhookStatuses.pending.value,
+            event_type=JobLauncherEventTypes.escrow_created.value,
+            direction=OracleWebhookDirectionTags.incoming,
+        )
+
+        self.session.add(webhook)
+        self.session.commit()
+        with (
+            patch("src.chain.escrow.get_escrow") as mock_escrow,
+            open("tests/utils/manifest.json") as data,
+            patch("src.handlers.job_creation.get_escrow_manifest") as mock_get_manifest,
+            patch("src.handlers.job_creation.cvat_api") as mock_cvat_api,
+            patch("src.handlers.job_creation.cloud_service.make_client") as mock_make_cloud_client,
+            patch.object(Config.cvat_config, "max_concurrent_task_setups", 2),
+            patch.object(Config.cvat_config, "max_jobs_per_task", 1),
+        ):
+            manifest = json.load(data)
+            manifest["annotation"]["job_size"] = 1
+            mock_get_manifest.return_value = manifest
+            mock_escrow_data = Mock()
+            mock_escrow_data.status = Status.Pending.name
+            mock_escrow.return_value = mock_escrow_data
+            mock_cvat_object = Mock()
+            mock_cvat_object.id = 1
+            mock_cvat_api.create_project.return_value = mock_cvat_object
+            mock_cvat_api.create_cvat_webhook.return_value = mock_cvat_object
+            mock_cvat_api.create_cloudstorage.return_value = mock_cvat_object
+
+            mock_cvat_tasks = []
+            for task_id in [42, 43]:
+                mock_cvat_task = Mock()
+                mock_cvat_task.id = task_id
+                mock_cvat_task.status = TaskStatuses.annotation.value
+                mock_cvat_tasks.append(mock_cvat_task)
+            mock_cvat_api.create_task.side_effect = mock_cvat_tasks
+            mock_cvat_api.get_task_upload_status.return_value = (RequestStatus.FINISHED, "Finished")
+
+            gt_filenames = ["image1.jpg", "image2.png"]
+            gt_dataset = build_gt_dataset(gt_filenames).encode()
+
+            mock_cloud_client = Mock()
+            mock_cloud_client.download_file.return_value = gt_dataset
+            mock_cloud_client.list_files.return_value = gt_filenames + ["image3.jpg", "image4.png"]
+            mock_make_cloud_client.return_value = mock_cloud_client
+
+            process_incoming_job_launcher_webhooks()
+
+        updated_webhook = (
+            self.session.execute(select(Webhook).where(Webhook.id == webhook_id)).scalars().first()
+        )
+        assert updated_webhook.status == OracleWebhookStatuses.completed.value
+
+        # All the tasks receive the data and get the GT jobs configured
+        assert [c.args[0] for c in mock_cvat_api.put_task_data.mock_calls] == [42, 43]
+        assert sorted(c.args[0] for c in mock_cvat_api.get_gt_job.mock_calls) == [42, 43]
+
+        db_tasks = self.session.query(Task).order_by(Task.cvat_id).all()
+        assert [t.cvat_id for t in db_tasks] == [42, 43]
+
     def test_process_incoming_job_launcher_webhooks_escrow_created_type_invalid_escrow_status(
         self,
     ):
@@ -224,7 +300,7 @@ class ServiceIntegrationTest(unittest.TestCase):
         assert delete_project_mock.mock_calls == []
         assert delete_cloudstorage_mock.mock_calls == []
 
-    def test_process_incoming_job_launcher_webhooks_escrow_created_type_remove_when_error(
+    def test_process_incoming_job_launcher_webhooks_escrow_created_type_keep_progress_when_error(
         self,
     ):
         webhok_id = str(uuid.uuid4())
@@ -287,6 +363,200 @@ class ServiceIntegrationTest(unittest.TestCase):
         )
         assert db_project is None
 
+    def test_process_incoming_job_launcher_webhooks_escrow_created_type_resume_after_error(
+        self,
+    ):
+        webhok_id = str(uuid.uuid4())
+        webhook = Webhook(
+            id=webhok_id,
+            signature="signature",
+            escrow_address=escrow_address,
+            chain_id=chain_id,
+            type=OracleWebhookTypes.job_launcher.value,
+            status=OracleWebhookStatuses.pending.value,
+            event_type=JobLauncherEventTypes.escrow_created.value,
+            direction=OracleWebhookDirectionTags.incoming,
+        )
+
+        self.session.add(webhook)
+        self.session.commit()
+
+        gt_filenames = ["image1.jpg", "image2.png"]
+        gt_dataset = build_gt_dataset(gt_filenames).encode()
+        oracle_bucket_files = {}
+
+        mock_cloud_client = Mock()
+        mock_cloud_client.create_file.side_effect = oracle_bucket_files.__setitem__
+        mock_cloud_client.file_exists.side_effect = oracle_bucket_files.__contains__
+        mock_cloud_client.download_file.side_effect = lambda key: oracle_bucket_files.get(
+            key, gt_dataset
+        )
+        mock_cloud_client.remove_file.side_effect = oracle_bucket_files.pop
+        mock_cloud_client.list_files.return_value = gt_filenames + ["image3.jpg", "image4.png"]
+
+        with (
+            patch("src.chain.escrow.get_escrow") as mock_escrow,
+            open("tests/utils/manifest.json") as data,
+            patch("src.handlers.job_creation.get_escrow_manifest") as mock_get_manifest,
+            patch("src.handlers.job_creation.cvat_api") as mock_cvat_api,
+            patch(
+                "src.handlers.job_creation.cloud_service.make_client",
+                return_value=mock_cloud_client,
+            ),
+            patch(
+                "src.handlers.job_creation.db_service.add_project_images",
+                side_effect=[Exception("Error"), None],
+            ),
+        ):
+            mock_get_manifest.return_value = json.load(data)
+            mock_escrow_data = Mock()
+            mock_escrow_data.status = Status.Pending.name
+            mock_escrow.return_value = mock_escrow_data
+            mock_cvat_object = Mock()
+            mock_cvat_object.id = 1
+            mock_cvat_api.create_project.return_value = mock_cvat_object
+            mock_cvat_api.create_cloudstorage.return_value = mock_cvat_object
+            mock_cvat_api.create_cvat_webhook.return_value = mock_cvat_object
+
+            mock_cvat_task = Mock()
+            mock_cvat_task.id = 42
+            mock_cvat_task.status = TaskStatuses.annotation.value
+            mock_cvat_api.create_task.return_value = mock_cvat_task
+            mock_cvat_api.get_task_upload_status.return_value = (RequestStatus.FINISHED, "Finished")
+
+            process_incoming_job_launcher_webhooks()
+
+            self.session.execute(
+                update(Webhook).where(Webhook.id == webhok_id).values(wait_until=utcnow())
+            )
+            self.session.commit()
+
+            process_incoming_job_launcher_webhooks()
+
+        self.session.commit()
+
+        updated_webhook = self.session.query(Webhook).filter_by(id=webhok_id).first()
+        assert updated_webhook.status == OracleWebhookStatuses.completed.value
+        assert updated_webhook.attempts == 2
+
+        # The CVAT objects from the failed attempt are reused
+        assert mock_cvat_api.create_cloudstorage.call_count == 1
+        assert mock_cvat_api.create_project.call_count == 1
+        assert mock_cvat_api.create_cvat_webhook.call_count == 1
+        assert mock_cvat_api.delete_project.mock_calls == []
+        assert mock_cloud_client.remove_files.mock_calls == []
+
+        db_project = (
+            self.session.query(Project)
+            .filter_by(escrow_address=escrow_address, chain_id=chain_id)
+            .first()
+        )
+        assert db_project.cvat_id == 1
+
+        # The checkpoint is removed after the task creation is finished
+        assert not oracle_bucket_files
+
+    def test_process_incoming_job_launcher_webhooks_escrow_canceled_type_after_creation_error(
+        self,
+    ):
+        creation_webhook_id = str(uuid.uuid4())
+        creation_webhook = Webhook(
+            id=creation_webhook_id,
+            signature="signature",
+            escrow_address=escrow_address,
+            chain_id=chain_id,
+            type=OracleWebhookTypes.job_launcher.value,
+            status=OracleWebhookStatuses.pending.value,
+            event_type=JobLauncherEventTypes.escrow_created.value,
+            direction=OracleWebhookDirectionTags.incoming,
+        )
+
+        self.session.add(creation_webhook)
+        self.session.commit()
+
+        gt_filenames = ["image1.jpg", "image2.png"]
+        gt_dataset = build_gt_dataset(gt_filenames).encode()
+        oracle_bucket_files = {}
+        checkpoint_filename = compose_data_bucket_filename(
+            escrow_address, chain_id, TASK_CREATION_CHECKPOINT_FILENAME
+        )
+
+        mock_cloud_client = Mock()
+        mock_cloud_client.create_file.side_effect = oracle_bucket_files.__setitem__
+        mock_cloud_client.file_exists.side_effect = oracle_bucket_files.__contains__
+        mock_cloud_client.download_file.side_effect = lambda key: oracle_bucket_files.get(
+            key, gt_dataset
+        )
+        mock_cloud_client.remove_file.side_effect = oracle_bucket_files.pop
+        mock_cloud_client.list_files.return_value = gt_filenames + ["image3.jpg", "image4.png"]
+
+        with (
+            patch("src.chain.escrow.get_escrow") as mock_escrow,
+            open("tests/utils/manifest.json") as data,
+            patch("src.handlers.job_creation.get_escrow_manifest") as mock_get_manifest,
+            patch("src.handlers.job_creation.cvat_api") as mock_cvat_api,
+            patch("src.handlers.escrow_cleanup.cvat_api", mock_cvat_api),
+            patch("src.services.cloud.make_client", return_value=mock_cloud_client),
+            patch(
+                "src.handlers.job_creation.db_service.add_project_images",
+                side_effect=Exception("Error"),
+            ),
+        ):
+            mock_get_manifest.return_value = json.load(data)
+            mock_escrow_data = Mock()
+            mock_escrow_data.status = Status.Pending.name
+            mock_escrow_data.balance = 1
+            mock_escrow.return_value = mock_escrow_data
+            mock_cvat_object = Mock()
+            mock_cvat_object.id = 1
+            mock_cvat_api.create_project.return_value = mock_cvat_object
+            mock_cvat_api.create_cloudstorage.return_value = mock_cvat_object
+            mock_cvat_api.create_cvat_webhook.return_value = mock_cvat_object
+
+            process_incoming_job_launcher_webhooks()
+
+            # The failed attempt keeps the CVAT objects for the next attempt
+            assert mock_cvat_api.delete_project.mock_calls == []
+            assert checkpoint_filename in oracle_bucket_files
+
+            cancellation_webhook_id = str(uuid.uuid4())
+            cancellation_webhook = Webhook(
+                id=cancellation_webhook_id,
+                signature="signature",
+                escrow_address=escrow_address,
+                chain_id=chain_id,
+                type=OracleWebhookTypes.job_launcher.value,
+                status=OracleWebhookStatuses.pending.value,
+                event_type=JobLauncherEventTypes.escrow_canceled.value,
+                direction=OracleWebhookDirectionTags.incoming,
+            )
+            self.session.add(cancellation_webhook)
+            self.session.commit()
+
+            process_incoming_job_launcher_webhooks()
+
+        self.session.commit()
+
+        updated_creation_webhook = (
+            self.session.query(Webhook).filter_by(id=creation_webhook_id).first()
+        )
+        assert updated_creation_webhook.status == OracleWebhookStatuses.pending.value
+        assert updated_creation_webhook.attempts == 1
+
+        updated_cancellation_webhook = (
+            self.session.query(Webhook).filter_by(id=cancellation_webhook_id).first()
+        )
+        assert updated_cancellation_webhook.status == OracleWebhookStatuses.completed.value
+
+        # The CVAT objects and the data of the failed attempt are removed
+        assert mock_cvat_api.delete_project.mock_calls == [call(1)]
+        assert mock_cvat_api.delete_cloudstorage.mock_calls == [call(1)]
+        assert checkpoint_filename not in oracle_bucket_files
+        assert mock_cloud_client.remove_files.mock_calls == [
+            call(prefix=compose_data_bucket_prefix(escrow_address, chain_id)),
+            call(prefix=compose_results_bucket_prefix(escrow_address, chain_id)),
+        ]
+
     def test_process_incoming_job_launcher_webhooks_escrow_canceled_type(self):
         project_id = str(uuid.uuid4())
         cvat_project = Project(
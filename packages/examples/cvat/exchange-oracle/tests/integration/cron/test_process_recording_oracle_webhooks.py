@@ -462,6 +462,65 @@ class ServiceIntegrationTest(unittest.TestCase):
         assert updated_webhook.attempts == 1
         mock_httpx_post.assert_called_once()
 
+    def test_process_outgoing_recording_oracle_webhooks_in_batch(self):
+        chain_id = Networks.localhost.value
+        failing_escrow_address = "0x" + "1" * 40
+
+        webhook_ids = {}
+        for i, webhook_escrow_address in enumerate(
+            [escrow_address, escrow_address, failing_escrow_address]
+        ):
+            webhook_id = str(uuid.uuid4())
+            self.session.add(
+                Webhook(
+                    id=webhook_id,
+                    signature=f"signature{i}",
+                    escrow_address=webhook_escrow_address,
+                    chain_id=chain_id,
+                    type=OracleWebhookTypes.recording_oracle.value,
+                    status=OracleWebhookStatuses.pending.value,
+                    event_type=ExchangeOracleEventTypes.job_finished.value,
+                    direction=OracleWebhookDirectionTags.outgoing,
+                )
+            )
+            webhook_ids[webhook_id] = webhook_escrow_address
+        self.session.commit()
+
+        def _post(url, *, headers, json):
+            response = MagicMock()
+            if json["escrow_address"] == failing_escrow_address:
+                response.raise_for_status.side_effect = Exception("Request failed")
+            return response
+
+        with (
+            patch("src.chain.kvstore.get_escrow") as mock_escrow,
+            patch("src.chain.kvstore.OperatorUtils.get_operator") as mock_operator,
+            patch("httpx.Client.post", side_effect=_post) as mock_httpx_post,
+        ):
+            mock_escrow_data = Mock()
+            mock_escrow_data.recording_oracle = RECORDING_ORACLE_ADDRESS
+            mock_escrow.return_value = mock_escrow_data
+            mock_operator.return_value = MagicMock(webhook_url=DEFAULT_MANIFEST_URL)
+
+            process_outgoing_recording_oracle_webhooks()
+
+        # The receiver URL is resolved once per escrow
+        assert mock_escrow.call_count == 2
+        assert mock_httpx_post.call_count == 3
+
+        for webhook_id, webhook_escrow_address in webhook_ids.items():
+            updated_webhook = (
+                self.session.execute(select(Webhook).where(Webhook.id == webhook_id))
+                .scalars()
+                .first()
+            )
+
+            assert updated_webhook.attempts == 1
+            if webhook_escrow_address == failing_escrow_address:
+                assert updated_webhook.status == OracleWebhookStatuses.pending.value
+            else:
+                assert updated_webhook.status == OracleWebhookStatuses.completed.value
+
     def test_process_outgoing_recording_oracle_webhooks_invalid_type(self):
         chain_id = Networks.localhost.value
 
@@ -0,0 +1,172 @@
+import time
+import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.services.cache import Cache, _MemoryLRUCache, get_cache
+
+chain_id = 1
+
+
+class ManifestCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = Cache()
+        self.escrow_address = "0x" + uuid.uuid4().hex[:40].ljust(40, "0")
+        self.key = Cache._make_key(self.escrow_address, chain_id)
+
+    def tearDown(self):
+        get_cache().delete(self.key)
+        get_cache().delete(self.key + Cache._LOCK_SUFFIX)
+
+    def _make_callback(self, calls: list, *, delay: float = 0):
+        def _callback():
+            calls.append(1)
+            time.sleep(delay)
+            return {"version": len(calls)}
+
+        return _callback
+
+    def test_can_get_manifest_once_for_concurrent_misses(self):
+        calls = []
+        callback = self._make_callback(calls, delay=0.5)
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(
+                pool.map(
+                    lambda _: self.cache.get_or_set_manifest(
+                        self.escrow_address, chain_id, set_callback=callback
+                    ),
+                    range(5),
+                )
+            )
+
+        assert len(calls) == 1
+        assert results == [{"version": 1}] * 5
+
+    def test_can_use_stale_manifest_while_it_is_being_refreshed(self):
+        calls = []
+        callback = self._make_callback(calls)
+
+        self.cache.get_or_set_manifest(self.escrow_address, chain_id, set_callback=callback, ttl=1)
+        time.sleep(1.1)
+
+        # Another client is refreshing the manifest
+        get_cache().add(self.key + Cache._LOCK_SUFFIX, 1, timeout=10)
+        manifest = self.cache.get_or_set_manifest(
+            self.escrow_address, chain_id, set_callback=callback, ttl=1
+        )
+        assert manifest == {"version": 1}
+        assert len(calls) == 1
+
+        get_cache().delete(self.key + Cache._LOCK_SUFFIX)
+        manifest = self.cache.get_or_set_manifest(
+            self.escrow_address, chain_id, set_callback=callback, ttl=1
+        )
+        assert manifest == {"version": 2}
+        assert len(calls) == 2
+
+    def test_can_refresh_manifest_before_expiration(self):
+        calls = []
+        callback = self._make_callback(calls, delay=0.2)
+
+        self.cache.get_or_set_manifest(self.escrow_address, chain_id, set_callback=callback, ttl=2)
+
+        # The manifest has 2 seconds left, it took 0.2 seconds to obtain it,
+        # with -log(1 - x) = 20.7 it's refreshed
+        with patch("src.services.cache.random.random", return_value=1 - 1e-9):
+            manifest = self.cache.get_or_set_manifest(
+                self.escrow_address, chain_id, set_callback=callback, ttl=2
+            )
+
+        assert manifest == {"version": 2}
+        assert len(calls) == 2
+
+    def _make_failing_callback(self, calls: list):
+        def _callback():
+            calls.append(1)
+            raise OSError("Failed to get the manifest")
+
+        return _callback
+
+    def test_can_use_cached_manifest_if_early_refresh_fails(self):
+        self.cache.get_or_set_manifest(
+            self.escrow_address, chain_id, set_callback=self._make_callback([], delay=0.2), ttl=2
+        )
+
+        calls = []
+        with patch("src.services.cache.random.random", return_value=1 - 1e-9):
+            manifest = self.cache.get_or_set_manifest(
+                self.escrow_address,
+                chain_id,
+                set_callback=self._make_failing_callback(calls),
+                ttl=2,
+            )
+
+        assert manifest == {"version": 1}
+        assert len(calls) == 1
+        assert not get_cache().has(self.key + Cache._LOCK_SUFFIX)
+
+    def test_can_use_stale_manifest_if_refresh_fails(self):
+        self.cache.get_or_set_manifest(
+            self.escrow_address, chain_id, set_callback=self._make_callback([]), ttl=1, stale_ttl=10
+        )
+        time.sleep(1.1)
+
+        calls = []
+        manifest = self.cache.get_or_set_manifest(
+            self.escrow_address,
+            chain_id,
+            set_callback=self._make_failing_callback(calls),
+            ttl=1,
+            stale_ttl=10,
+        )
+
+        assert manifest == {"version": 1}
+        assert len(calls) == 1
+        assert not get_cache().has(self.key + Cache._LOCK_SUFFIX)
+
+    def test_can_raise_error_if_there_is_no_cached_manifest(self):
+        with pytest.raises(OSError, match="Failed to get the manifest"):
+            self.cache.get_or_set_manifest(
+                self.escrow_address, chain_id, set_callback=self._make_failing_callback([])
+            )
+
+        assert not get_cache().has(self.key + Cache._LOCK_SUFFIX)
+
+    def test_can_read_manifest_without_metadata(self):
+        get_cache().set(self.key, {"version": 0})
+
+        manifest = self.cache.get_or_set_manifest(
+            self.escrow_address, chain_id, set_callback=self._make_callback([])
+        )
+
+        assert manifest == {"version": 0}
+
+
+class MemoryLRUCacheTest(unittest.TestCase):
+    def test_can_remove_least_recently_used_items(self):
+        cache = _MemoryLRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_can_expire_items(self):
+        cache = _MemoryLRUCache(max_size=2, ttl=10)
+
+        with patch("src.services.cache.time.monotonic", return_value=100):
+            cache.set("a", 1)
+
+        with patch("src.services.cache.time.monotonic", return_value=109):
+            assert cache.get("a") == 1
+
+        with patch("src.services.cache.time.monotonic", return_value=110):
+            assert cache.get("a") is None
@@ -471,6 +471,65 @@ class ServiceIntegrationTest(unittest.TestCase):
         prev_updated_at = cvat_project.updated_at
         assert isinstance(prev_updated_at, datetime)
 
+    def test_can_sync_escrows(self):
+        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+        chain_id = Networks.localhost.value
+
+        cvat_project_1 = create_project(self.session, escrow_address, 1)
+        cvat_project_2 = create_project(
+            self.session, escrow_address, 2, status=ProjectStatuses.completed
+        )
+        self.session.commit()
+
+        escrow = cvat_service.get_escrow_by_escrow_address(self.session, escrow_address, chain_id)
+        assert escrow is not None
+        assert escrow.status == ProjectStatuses.annotation
+        assert escrow.job_type == cvat_project_1.job_type
+        assert escrow.total_projects == 2
+        assert escrow.created_projects == 2
+        assert escrow.created_at == min(cvat_project_1.created_at, cvat_project_2.created_at)
+        assert escrow.updated_at is None
+
+        cvat_service.update_project_status(
+            self.session, cvat_project_1.id, ProjectStatuses.completed
+        )
+        self.session.expire_all()
+
+        escrow = cvat_service.get_escrow_by_escrow_address(self.session, escrow_address, chain_id)
+        assert escrow.status == ProjectStatuses.completed
+        assert escrow.updated_at == cvat_project_1.updated_at
+
+        cvat_service.delete_project(self.session, cvat_project_2.id)
+        self.session.flush()
+        self.session.expire_all()
+
+        escrow = cvat_service.get_escrow_by_escrow_address(self.session, escrow_address, chain_id)
+        assert escrow.total_projects == 1
+
+        create_project(self.session, escrow_address, 3, status=ProjectStatuses.creation)
+        self.session.flush()
+        self.session.expire_all()
+
+        escrow = cvat_service.get_escrow_by_escrow_address(self.session, escrow_address, chain_id)
+        assert escrow.total_projects == 2
+        assert escrow.created_projects == 1
+
+        # The update time is the transaction time
+        self.session.commit()
+        prev_updated_at = escrow.updated_at
+        cvat_project_1.cvat_webhook_id = 1
+        self.session.flush()
+        self.session.expire_all()
+
+        escrow = cvat_service.get_escrow_by_escrow_address(self.session, escrow_address, chain_id)
+        assert escrow.status == ProjectStatuses.completed
+        assert escrow.updated_at == cvat_project_1.updated_at
+        assert escrow.updated_at > prev_updated_at
+
+        cvat_service.delete_projects(self.session, escrow_address, chain_id)
+
+        assert not cvat_service.get_escrow_by_escrow_address(self.session, escrow_address, chain_id)
+
     def test_delete_project(self):
         cvat_id_1 = 456
 
@@ -39,7 +39,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             open("tests/utils/manifest.json") as data,
-            patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
         ):
             manifest = json.load(data)
             mock_get_manifest.return_value = manifest
@@ -69,7 +69,7 @@ class ServiceIntegrationTest(unittest.TestCase):
         cvat_project = create_project(self.session, escrow_address, cvat_id)
         self.session.commit()
 
-        with patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest:
+        with patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest:
             mock_get_manifest.return_value = None
             with pytest.raises(ValidationError):
                 serialize_job(cvat_project)
@@ -89,7 +89,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             open("tests/utils/manifest.json") as data,
-            patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
             patch("src.services.exchange.cvat_api"),
         ):
             manifest = json.load(data)
@@ -137,7 +137,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             open("tests/utils/manifest.json") as data,
-            patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
             patch("src.services.exchange.cvat_api"),
         ):
             manifest = json.load(data)
@@ -201,7 +201,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             open("tests/utils/manifest.json") as data,
-            patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
             patch("src.services.exchange.cvat_api"),
         ):
             manifest = json.load(data)
@@ -248,7 +248,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             open("tests/utils/manifest.json") as data,
-            patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
             patch("src.services.exchange.cvat_api"),
         ):
             manifest = json.load(data)
@@ -292,7 +292,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             open("tests/utils/manifest.json") as data,
-            patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
             patch("src.services.exchange.cvat_api"),
         ):
             manifest = json.load(data)
@@ -332,7 +332,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             open("tests/utils/manifest.json") as data,
-            patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
             patch("src.services.exchange.cvat_api"),
         ):
             manifest = json.load(data)
@@ -378,7 +378,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         with (
             open("tests/utils/manifest.json") as data,
-            patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.chain.escrow.get_escrow_manifest") as mock_get_manifest,
             patch("src.services.exchange.cvat_api"),
         ):
             manifest = json.load(data)
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+from datumaro.util.annotation_util import bbox_iou
+
+from src.utils.annotations import (
+    find_unambiguous_matches,
+    match_overlapping_boxes,
+    match_points_in_boxes,
+)
+
+
+class AnnotationMatchingTest(unittest.TestCase):
+    def test_can_match_points_in_boxes(self):
+        points = np.array([[0, 0], [5, 5], [10, 10], [20, 20]])
+        boxes = np.array([[0, 0, 10, 10], [5, 5, 1, 1]])
+
+        matches = match_points_in_boxes(points, boxes)
+
+        assert matches.tolist() == [
+            [True, False],
+            [True, True],
+            [True, False],
+            [False, False],
+        ]
+
+    def test_can_match_overlapping_boxes_as_iou(self):
+        rng = np.random.default_rng(42)
+        a_boxes = rng.integers(0, 20, size=(30, 4))
+        b_boxes = rng.integers(0, 20, size=(40, 4))
+
+        matches = match_overlapping_boxes(a_boxes, b_boxes)
+
+        expected = [[bbox_iou(a, b) > 0 for b in b_boxes] for a in a_boxes]
+        assert matches.tolist() == expected
+
+    def test_can_match_empty_inputs(self):
+        matches = match_points_in_boxes(np.zeros((0, 2)), np.zeros((3, 4)))
+        result = find_unambiguous_matches(matches)
+
+        assert matches.shape == (0, 3)
+        assert result.col_match_counts.tolist() == [0, 0, 0]
+        assert len(result.pairs) == 0
+
+    def test_can_find_unambiguous_matches(self):
+        matches = np.array(
+            [
+                [True, False, False, False],  # unique match
+                [False, True, True, False],  # ambiguous row
+                [False, False, True, False],  # matches a column of an ambiguous row
+                [False, False, False, True],  # column matches several rows
+                [False, False, False, True],
+                [False, False, False, False],  # no matches
+            ]
+        )
+
+        result = find_unambiguous_matches(matches)
+
+        assert result.row_match_counts.tolist() == [1, 2, 1, 1, 1, 0]
+        assert result.col_match_counts.tolist() == [1, 1, 2, 2]
+        assert result.ambiguous_rows.tolist() == [False, True, True, True, True, False]
+        assert result.ambiguous_cols.tolist() == [False, True, True, True]
+        assert result.pairs.tolist() == [[0, 0]]
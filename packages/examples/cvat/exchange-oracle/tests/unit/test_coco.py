@@ -0,0 +1,114 @@
+import unittest
+
+import datumaro as dm
+from datumaro.util import dump_json, parse_json
+
+from src.utils.coco import try_dump_coco_instances, try_parse_coco_instances
+
+
+class CocoInstancesTest(unittest.TestCase):
+    def setUp(self):
+        self.coco_data = {
+            "categories": [
+                {"id": 2, "name": "dog", "supercategory": ""},
+                {"id": 1, "name": "cat", "supercategory": ""},
+            ],
+            "images": [
+                {"id": 5, "file_name": "dir/a.jpg", "width": 20, "height": 10},
+                {"id": 6, "file_name": "b.png", "width": 40, "height": 30},
+            ],
+            "annotations": [
+                {
+                    "id": 1,
+                    "image_id": 5,
+                    "category_id": 2,
+                    "bbox": [1, 2, 3, 4],
+                    "segmentation": [],
+                    "iscrowd": 0,
+                    "attributes": {"occluded": True},
+                },
+                {
+                    "id": 2,
+                    "image_id": 5,
+                    "category_id": 1,
+                    "bbox": [1.5, 2, 3, 4],
+                    "segmentation": [[]],
+                    "iscrowd": 1,
+                    "score": 0.5,
+                },
+            ],
+        }
+
+    def test_can_parse_bbox_annotations(self):
+        dataset = try_parse_coco_instances(dump_json(self.coco_data))
+
+        assert dataset is not None
+        assert [label.name for label in dataset.categories()[dm.AnnotationType.label]] == [
+            "cat",
+            "dog",
+        ]
+        assert len(dataset) == 2
+
+        item = dataset.get("dir/a")
+        assert item.media.path == "dir/a.jpg"
+        assert item.media.size == (10, 20)
+        assert item.attributes == {"id": 5}
+        assert item.annotations == [
+            dm.Bbox(
+                1, 2, 3, 4, label=1, id=1, group=1, attributes={"occluded": True, "is_crowd": False}
+            ),
+            dm.Bbox(
+                1.5, 2, 3, 4, label=0, id=2, group=2, attributes={"score": 0.5, "is_crowd": True}
+            ),
+        ]
+        assert dataset.get("b").annotations == []
+
+    def test_can_export_and_parse_bbox_annotations(self):
+        dataset = try_parse_coco_instances(dump_json(self.coco_data))
+
+        data = try_dump_coco_instances(dataset)
+
+        assert data is not None
+        parsed_data = parse_json(data)
+        assert [c["name"] for c in parsed_data["categories"]] == ["cat", "dog"]
+        assert [i["file_name"] for i in parsed_data["images"]] == ["dir/a.jpg", "b.png"]
+
+        parsed_dataset = try_parse_coco_instances(data)
+        assert parsed_dataset is not None
+        for item in dataset:
+            parsed_item = parsed_dataset.get(item.id, item.subset)
+            assert parsed_item.annotations == item.annotations
+            assert parsed_item.media.path == item.media.path
+            assert parsed_item.attributes == item.attributes
+
+    def test_can_skip_unsupported_annotations_on_parsing(self):
+        self.coco_data["annotations"][0]["segmentation"] = [[0, 0, 1, 0, 1, 1]]
+
+        assert try_parse_coco_instances(dump_json(self.coco_data)) is None
+
+    def test_can_skip_invalid_data_on_parsing(self):
+        del self.coco_data["annotations"][0]["iscrowd"]
+
+        assert try_parse_coco_instances(dump_json(self.coco_data)) is None
+        assert try_parse_coco_instances(b"not a json") is None
+
+    def test_can_skip_unsupported_annotations_on_export(self):
+        dataset = try_parse_coco_instances(dump_json(self.coco_data))
+        item = dataset.get("b")
+        dataset.put(item.wrap(annotations=[dm.Polygon([0, 0, 1, 0, 1, 1], label=0, id=10)]))
+
+        assert try_dump_coco_instances(dataset) is None
+
+    def test_can_skip_grouped_annotations_on_export(self):
+        dataset = try_parse_coco_instances(dump_json(self.coco_data))
+        item = dataset.get("b")
+        dataset.put(
+            item.wrap(
+                annotations=[
+                    dm.Bbox(0, 0, 1, 1, label=0, id=10, group=1),
+                    dm.Bbox(0, 0, 2, 2, label=0, id=11, group=1),
+                ]
+            )
+        )
+
+        assert try_dump_coco_instances(dataset) is None
@@ -0,0 +1,71 @@
+import unittest
+from threading import Event
+from time import sleep
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from src.crons._webhook_notifications import CronJobWaker
+
+
+class CronJobWakerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = BackgroundScheduler()
+        self.waker = CronJobWaker(self.scheduler)
+
+    def tearDown(self):
+        self.scheduler.shutdown()
+
+    def _add_job(self, fn):
+        self.scheduler.add_job(fn, "interval", seconds=3600, id="job")
+        self.scheduler.start()
+
+    def test_can_run_job_ahead_of_schedule(self):
+        finished = Event()
+        self._add_job(finished.set)
+
+        self.waker.wake("job")
+
+        assert finished.wait(timeout=5)
+
+    def test_can_run_job_again_if_woken_while_running(self):
+        calls = []
+        started = Event()
+        finished = Event()
+        release = Event()
+
+        def _job():
+            calls.append(1)
+            if len(calls) == 1:
+                started.set()
+                release.wait(timeout=5)
+            else:
+                finished.set()
+
+        self._add_job(_job)
+
+        self.waker.wake("job")
+        assert started.wait(timeout=5)
+
+        self.waker.wake("job")
+        release.set()
+
+        assert finished.wait(timeout=5)
+        assert len(calls) == 2
+
+    def test_can_run_job_until_it_has_no_more_work(self):
+        results = [True, True, False]
+        finished = Event()
+
+        def _job():
+            result = results.pop(0)
+            if not results:
+                finished.set()
+            return result
+
+        self._add_job(_job)
+
+        self.waker.wake("job")
+
+        assert finished.wait(timeout=5)
+        sleep(0.1)
+        assert not results
@@ -0,0 +1,33 @@
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from src.core.config import Config
+from src.crons import create_scheduler
+
+
+class CreateSchedulerTest(unittest.TestCase):
+    def test_can_run_configured_jobs_in_process_pool(self):
+        process_pool_jobs = ["track_escrow_validations", "process_incoming_job_launcher_webhooks"]
+
+        with patch.object(Config.cron_config, "process_pool_jobs", process_pool_jobs):
+            scheduler = create_scheduler()
+
+        jobs = scheduler.get_jobs()
+        assert {job.id for job in jobs if job.executor == "processpool"} == set(process_pool_jobs)
+        assert all(job.executor == "default" for job in jobs if job.id not in process_pool_jobs)
+
+    def test_can_run_all_jobs_in_thread_pool_by_default(self):
+        with patch.object(Config.cron_config, "process_pool_jobs", []):
+            scheduler = create_scheduler()
+
+        assert scheduler.get_jobs()
+        assert all(job.executor == "default" for job in scheduler.get_jobs())
+
+    def test_cant_use_unknown_jobs_in_process_pool(self):
+        with (
+            patch.object(Config.cron_config, "process_pool_jobs", ["unknown_job"]),
+            pytest.raises(ValueError, match="unknown_job"),
+        ):
+            create_scheduler()
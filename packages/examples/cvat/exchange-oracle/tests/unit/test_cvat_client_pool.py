@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+
+from src.crons.cvat.api_client_stats import log_cvat_api_client_stats
+from src.cvat.client_pool import ApiClientPool
+
+
+class ApiClientPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = ApiClientPool()
+
+    def tearDown(self):
+        self.pool.reset()
+
+    def test_can_reuse_api_client(self):
+        api_client = self.pool.get_api_client()
+
+        with self.pool.get_api_client() as other_api_client:
+            assert other_api_client is api_client
+
+        assert self.pool.get_api_client() is api_client
+
+    def test_can_share_api_client_with_sdk_client(self):
+        api_client = self.pool.get_api_client()
+
+        with self.pool.get_sdk_client() as sdk_client:
+            assert sdk_client.api_client is api_client
+
+        assert self.pool.get_sdk_client() is sdk_client
+
+    def test_can_create_new_clients_after_reset(self):
+        api_client = self.pool.get_api_client()
+
+        self.pool.reset()
+
+        assert self.pool.get_api_client() is not api_client
+
+    def test_can_get_connection_reuse_stats(self):
+        assert self.pool.get_stats().requests == 0
+
+        pool_manager = self.pool.get_api_client().rest_client.pool_manager
+        connection_pool = pool_manager.connection_from_url("http://localhost:8080")
+        connection_pool.num_requests = 5
+        connection_pool.num_connections = 2
+
+        stats = self.pool.get_stats()
+        assert stats.requests == 5
+        assert stats.connections == 2
+        assert stats.reused_connections == 3
+
+    def test_can_log_connection_reuse_stats(self):
+        connection_pool = self.pool.get_api_client().rest_client.pool_manager.connection_from_url(
+            "http://localhost:8080"
+        )
+        connection_pool.num_requests = 5
+        connection_pool.num_connections = 2
+
+        with (
+            patch("src.cvat.client_pool.get_pool", return_value=self.pool),
+            self.assertLogs("app", level="INFO") as logs,
+        ):
+            log_cvat_api_client_stats()
+
+        assert "requests=5 connections=2 reused_connections=3" in logs.output[0]
@@ -0,0 +1,81 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.cvat.request_waiter import RequestWaiter
+
+
+def _make_request(request_id: str, status: str):
+    return SimpleNamespace(id=request_id, status=SimpleNamespace(value=status))
+
+
+class RequestWaiterTest(unittest.TestCase):
+    def setUp(self):
+        self.waiter = RequestWaiter(min_interval=0.01, max_interval=0.05, batch_threshold=3)
+
+    def test_can_wait_for_check_result(self):
+        check = Mock(side_effect=[None, None, "done"])
+
+        result = self.waiter.wait_for(check).result(timeout=5)
+
+        assert result == "done"
+        assert check.call_count == 3
+
+    def test_can_report_check_error(self):
+        check = Mock(side_effect=[None, ValueError("failed")])
+
+        future = self.waiter.wait_for(check)
+
+        with pytest.raises(ValueError, match="failed"):
+            future.result(timeout=5)
+
+    def test_can_report_timeout(self):
+        future = self.waiter.wait_for(Mock(return_value=None), timeout=0.1)
+
+        with pytest.raises(TimeoutError):
+            future.result(timeout=5)
+
+    def test_can_wait_for_several_checks(self):
+        checks = [Mock(side_effect=[None] * i + [i]) for i in range(5)]
+
+        futures = [self.waiter.wait_for(check) for check in checks]
+
+        assert [f.result(timeout=5) for f in futures] == list(range(5))
+
+    def test_can_check_requests_in_batches(self):
+        request_ids = [f"rq{i}" for i in range(5)]
+        running_requests = {rq_id: 2 for rq_id in request_ids}  # list calls left
+
+        def _list_requests(_endpoint, *, status):
+            if status != "started":
+                return []
+
+            for rq_id in list(running_requests):
+                running_requests[rq_id] -= 1
+                if not running_requests[rq_id]:
+                    del running_requests[rq_id]
+
+            return [_make_request(rq_id, status) for rq_id in running_requests]
+
+        api_client = Mock()
+        api_client.requests_api.retrieve.side_effect = lambda rq_id: (
+            _make_request(rq_id, "finished"),
+            None,
+        )
+
+        with (
+            patch("src.cvat.request_waiter.client_pool") as mock_client_pool,
+            patch(
+                "src.cvat.request_waiter.get_paginated_collection", side_effect=_list_requests
+            ) as mock_list_requests,
+        ):
+            mock_client_pool.get_pool.return_value.get_api_client.return_value = api_client
+
+            futures = [self.waiter.wait_for_request(rq_id) for rq_id in request_ids]
+            results = [f.result(timeout=5) for f in futures]
+
+        assert [r.id for r in results] == request_ids
+        assert mock_list_requests.call_count >= 2
+        assert api_client.requests_api.retrieve.call_count == len(request_ids)
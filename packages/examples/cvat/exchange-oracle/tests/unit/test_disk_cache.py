@@ -0,0 +1,59 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from src.utils.disk_cache import DiskCache
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._test_dir = TemporaryDirectory()
+        self.addCleanup(self._test_dir.cleanup)
+        self.cache_dir = self._test_dir.name
+
+    def test_can_put_and_get_data(self):
+        cache = DiskCache(self.cache_dir, max_size=100)
+
+        cache.put("bucket/a.jpg", b"abc")
+
+        assert bytes(cache.get("bucket/a.jpg")) == b"abc"
+        assert cache.get("bucket/b.jpg") is None
+
+    def test_can_put_and_get_data_with_tag(self):
+        cache = DiskCache(self.cache_dir, max_size=100)
+
+        cache.put("key", b"ab\ncd", tag='"etag1"')
+        cache.put("untagged", b"ab\ncd")
+
+        data, tag = cache.get_with_tag("key")
+        assert bytes(data) == b"ab\ncd"
+        assert tag == '"etag1"'
+        assert bytes(cache.get("key")) == b"ab\ncd"
+        assert cache.get_with_tag("untagged")[1] == ""
+
+    def test_can_share_data_between_instances(self):
+        DiskCache(self.cache_dir, max_size=100).put("key", memoryview(b"abc"))
+
+        assert bytes(DiskCache(self.cache_dir, max_size=100).get("key")) == b"abc"
+
+    def test_can_evict_least_recently_used_entries(self):
+        cache = DiskCache(self.cache_dir, max_size=33)  # 3 entries with the tag separators
+
+        for i in range(3):
+            cache.put(f"key{i}", bytes([i]) * 10)
+            os.utime(cache._get_path(f"key{i}"), (i, i))
+
+        cache.get("key0")  # now the most recently used
+        cache.put("key3", bytes([3]) * 10)
+
+        assert cache.get("key1") is None
+        assert cache.get("key2") is None
+        assert bytes(cache.get("key0")) == bytes([0]) * 10
+        assert bytes(cache.get("key3")) == bytes([3]) * 10
+
+    def test_can_skip_too_big_data(self):
+        cache = DiskCache(self.cache_dir, max_size=5)
+
+        cache.put("key", b"0123456789")
+
+        assert cache.get("key") is None
@@ -0,0 +1,103 @@
+import io
+import json
+import unittest
+import zipfile
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import datumaro as dm
+import pytest
+
+from src.core.config import Config
+from src.core.manifest import parse_manifest
+from src.core.types import Networks
+from src.handlers.job_export import FileDescriptor, _BoxesTaskProcessor
+from src.utils.zip_archive import write_dir_to_zip_archive
+
+
+def _make_job_archive(job_id: int) -> io.BytesIO:
+    dataset = dm.Dataset.from_iterable(
+        [
+            dm.DatasetItem(
+                id=f"image_{job_id}_{i}",
+                media=dm.Image(path=f"image_{job_id}_{i}.jpg", size=(10, 10)),
+                annotations=[dm.Bbox(i, job_id, 2, 3, label=i % 2, id=i + 1, group=i + 1)],
+            )
+            for i in range(3)
+        ],
+        media_type=dm.Image,
+        categories={dm.AnnotationType.label: dm.LabelCategories.from_iterable(["cat", "dog"])},
+    )
+
+    archive = io.BytesIO()
+    with TemporaryDirectory() as tempdir:
+        dataset.export(tempdir, format="coco_instances")
+        write_dir_to_zip_archive(tempdir, archive)
+
+    archive.seek(0)
+    return archive
+
+
+def _make_broken_job_archive() -> io.BytesIO:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("annotations/instances_default.json", "{")
+
+    archive.seek(0)
+    return archive
+
+
+class TaskProcessorJobConversionTest(unittest.TestCase):
+    def setUp(self):
+        with open("tests/utils/manifest.json") as data:
+            self.manifest = parse_manifest(json.load(data))
+
+    def _process(
+        self, job_archives: list[io.BytesIO], *, max_workers: int
+    ) -> list[dict[str, object]]:
+        annotations = [
+            FileDescriptor(f"job_{i}.zip", archive) for i, archive in enumerate(job_archives)
+        ]
+
+        processor = _BoxesTaskProcessor(
+            escrow_address="0x86e83d346041E8806e352681f3F14549C0d2BC67",
+            chain_id=Networks.localhost.value,
+            annotations=annotations,
+            merged_annotation=FileDescriptor("resulting_annotations.zip", None),
+            manifest=self.manifest,
+            project_images=[],
+        )
+
+        with patch.object(Config.features, "max_annotation_processing_workers", max_workers):
+            processor.process()
+
+        results = []
+        for ann_descriptor in annotations:
+            with zipfile.ZipFile(ann_descriptor.file) as archive:
+                results.append(
+                    {name: json.loads(archive.read(name)) for name in sorted(archive.namelist())}
+                )
+            ann_descriptor.file.close()
+
+        return results
+
+    def test_can_convert_job_annotations_in_process_pool(self):
+        job_count = 3
+
+        expected_results = self._process(
+            [_make_job_archive(i) for i in range(job_count)], max_workers=1
+        )
+        results = self._process([_make_job_archive(i) for i in range(job_count)], max_workers=2)
+
+        assert len(results) == job_count
+        assert results == expected_results
+
+    def test_can_raise_job_annotation_conversion_errors_from_process_pool(self):
+        def _make_job_archives():
+            return [_make_job_archive(0), _make_broken_job_archive(), _make_job_archive(2)]
+
+        with pytest.raises(Exception) as expected_error:  # noqa: PT011
+            self._process(_make_job_archives(), max_workers=1)
+
+        with pytest.raises(type(expected_error.value)):
+            self._process(_make_job_archives(), max_workers=2)
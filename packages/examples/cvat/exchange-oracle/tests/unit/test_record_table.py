@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from src.core.tasks import boxes_from_points, skeletons_from_boxes
+
+
+class RecordTableTest(unittest.TestCase):
+    def test_can_create_records_lazily(self):
+        table = boxes_from_points.RoiInfoTable.from_columns(
+            point_id=[10, 11],
+            original_image_key=[1, 2],
+            point_x=[5, 6],
+            point_y=[7, 8],
+            roi_x=np.array([0, 1]),
+            roi_y=np.array([2, 3]),
+            roi_w=[20, 21],
+            roi_h=[30, 31],
+        )
+
+        assert len(table) == 2
+        assert table[1] == boxes_from_points.RoiInfo(
+            point_id=11,
+            original_image_key=2,
+            point_x=6,
+            point_y=8,
+            roi_x=1,
+            roi_y=3,
+            roi_w=21,
+            roi_h=31,
+        )
+        assert type(table[1].roi_x) is int
+        assert [roi.point_id for roi in table] == [10, 11]
+        assert table.column("roi_w").tolist() == [20, 21]
+
+    def test_can_convert_records(self):
+        rois = [
+            skeletons_from_boxes.RoiInfo(
+                original_image_key=i,
+                bbox_id=i + 10,
+                bbox_label=0,
+                bbox_x=0.5,
+                bbox_y=1.5,
+                roi_x=-2,
+                roi_y=-3,
+                roi_w=10,
+                roi_h=20,
+            )
+            for i in range(3)
+        ]
+
+        table = skeletons_from_boxes.RoiInfoTable.from_records(rois)
+
+        assert list(table) == rois
+        assert list(table[1:]) == rois[1:]
+        assert type(table[1].bbox_x) is float
+        assert type(table[1].bbox_id) is int
+        assert [roi.asdict() for roi in table] == [roi.asdict() for roi in rois]
+
+    def test_can_create_empty_table(self):
+        table = skeletons_from_boxes.RoiInfoTable.from_records([])
+
+        assert len(table) == 0
+        assert list(table) == []
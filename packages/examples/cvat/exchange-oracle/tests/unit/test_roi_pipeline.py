@@ -0,0 +1,88 @@
+import unittest
+from threading import Lock
+
+import pytest
+
+from src.utils.roi_pipeline import RoiExtractionPipeline
+
+
+def _decode(data: bytes | bytearray | memoryview) -> str:
+    return bytes(data).decode()
+
+
+def _process(item: int, data: str) -> list[tuple[str, bytes]]:
+    return [(f"{item}_{i}", (data * (i + 1)).encode()) for i in range(3)]
+
+
+class RoiExtractionPipelineTest(unittest.TestCase):
+    def _run_pipeline(self, *, processing_workers: int, **kwargs):
+        uploaded = {}
+        upload_lock = Lock()
+
+        def upload(filename: str, data: bytes):
+            with upload_lock:
+                uploaded[filename] = data
+
+        pipeline = RoiExtractionPipeline(
+            download_workers=3, upload_workers=2, processing_workers=processing_workers, **kwargs
+        )
+        stats = pipeline.run(
+            range(20),
+            download=lambda item: memoryview(bytearray(str(item).encode())),
+            decode=_decode,
+            process=_process,
+            upload=upload,
+        )
+
+        return uploaded, stats
+
+    def test_can_process_items_in_calling_thread(self):
+        uploaded, stats = self._run_pipeline(processing_workers=0)
+
+        assert len(uploaded) == 60
+        assert uploaded["7_2"] == b"777"
+        assert stats.downloaded_items == 20
+        assert stats.processed_items == 20
+        assert stats.produced_files == 60
+        assert stats.uploaded_files == 60
+        assert stats.uploaded_bytes == sum(len(v) for v in uploaded.values())
+
+    def test_can_process_items_in_process_pool(self):
+        uploaded, stats = self._run_pipeline(processing_workers=2)
+
+        assert len(uploaded) == 60
+        assert uploaded["7_2"] == b"777"
+        assert stats.processed_items == 20
+        assert stats.uploaded_files == 60
+
+    def test_can_limit_download_buffer_size(self):
+        for processing_workers in [0, 2]:
+            with self.subTest(processing_workers=processing_workers):
+                uploaded, stats = self._run_pipeline(
+                    processing_workers=processing_workers, download_buffer_size=4
+                )
+
+                assert len(uploaded) == 60
+                assert stats.processed_items == 20
+
+                # The buffer is checked before the downloads start,
+                # so it can be exceeded by the pending downloads
+                assert stats.peak_buffered_bytes <= 4 + 3 * 2
+
+    def test_can_stop_on_error(self):
+        def download(item: int) -> bytes:
+            if item == 5:
+                raise ValueError("download failed")
+
+            return b"1"
+
+        pipeline = RoiExtractionPipeline(download_workers=2, upload_workers=2)
+
+        with pytest.raises(ValueError, match="download failed"):
+            pipeline.run(
+                range(100),
+                download=download,
+                decode=_decode,
+                process=_process,
+                upload=lambda *_: None,
+            )
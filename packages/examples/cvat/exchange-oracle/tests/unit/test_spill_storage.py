@@ -0,0 +1,30 @@
+import io
+import unittest
+
+from src.utils.spill import SpillStorage
+
+
+class SpillStorageTest(unittest.TestCase):
+    def test_can_keep_files_in_memory_within_limit(self):
+        file = io.BytesIO(b"abcd")
+        file.seek(2)
+
+        with SpillStorage(max_memory_size=10) as storage:
+            stored_file = storage.store(file)
+
+            assert stored_file is file
+            assert stored_file.read() == b"abcd"
+            assert storage.memory_size == 4
+
+    def test_can_spill_files_to_disk_over_limit(self):
+        files = [io.BytesIO(bytes([i]) * 4) for i in range(3)]
+
+        with SpillStorage(max_memory_size=10) as storage:
+            stored_files = [storage.store(file) for file in files]
+
+            assert stored_files[:2] == files[:2]
+            assert stored_files[2] is not files[2]
+            assert stored_files[2].read() == b"\x02" * 4
+            assert storage.memory_size == 8
+
+        assert stored_files[2].closed
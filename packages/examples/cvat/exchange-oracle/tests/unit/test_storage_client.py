@@ -0,0 +1,301 @@
+import unittest
+from io import BytesIO
+from threading import Lock
+from time import sleep
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.stub import Stubber
+from google.cloud.storage.fileio import BlobWriter
+
+from src.services.cloud.client import StorageClient, read_into_buffer
+from src.services.cloud.gcs import GcsClient, _GcsResumableUploadWriter
+from src.services.cloud.s3 import S3Client, _S3MultipartUploadWriter
+
+
+class _InMemoryStorageClient(StorageClient):
+    def __init__(self, *, failures: dict[str, int] | None = None) -> None:
+        super().__init__("bucket")
+        self.files: dict[str, bytes] = {}
+        self.failures = failures or {}
+        self.in_flight_bytes = 0
+        self.max_in_flight_bytes = 0
+        self._lock = Lock()
+
+    def create_file(self, key: str, data: bytes = b"", *, bucket: str | None = None):
+        assert bucket is None
+
+        with self._lock:
+            if self.failures.get(key):
+                self.failures[key] -= 1
+                raise OSError(f"Failed to upload {key}")
+
+            self.in_flight_bytes += len(data)
+            self.max_in_flight_bytes = max(self.max_in_flight_bytes, self.in_flight_bytes)
+
+        sleep(0.001)
+
+        with self._lock:
+            self.files[key] = data
+            self.in_flight_bytes -= len(data)
+
+    def remove_file(self, key, *, bucket=None): ...
+    def remove_files(self, prefix, *, bucket=None): ...
+    def file_exists(self, key, *, bucket=None): ...
+    def download_file(self, key, *, bucket=None): ...
+    def download_file_buffer(self, key, *, bucket=None): ...
+    def download_file_buffer_if_changed(self, key, *, etag, bucket=None): ...
+    def list_files(self, *, bucket=None, prefix=None, trim_prefix=False): ...
+
+
+class StorageClientTest(unittest.TestCase):
+    def test_can_create_files(self):
+        client = _InMemoryStorageClient()
+        items = [(f"file_{i}", bytes([i]) * 10) for i in range(50)]
+
+        client.create_files(iter(items), max_concurrency=4, max_in_flight_bytes=30)
+
+        assert client.files == dict(items)
+        assert client.max_in_flight_bytes <= 30
+
+    def test_can_retry_failed_uploads(self):
+        client = _InMemoryStorageClient(failures={"file_1": 2})
+
+        with patch("src.services.cloud.client.sleep"):
+            client.create_files([("file_0", b"0"), ("file_1", b"1")], max_retries=2)
+
+        assert client.files == {"file_0": b"0", "file_1": b"1"}
+
+    def test_can_raise_error_after_retries(self):
+        client = _InMemoryStorageClient(failures={"file_1": 3})
+
+        with (
+            patch("src.services.cloud.client.sleep"),
+            pytest.raises(OSError, match="file_1"),
+        ):
+            client.create_files([("file_0", b"0"), ("file_1", b"1")], max_retries=2)
+
+    def test_can_create_files_from_streams(self):
+        client = _InMemoryStorageClient(failures={"file_1": 1})
+        stream = BytesIO(b"xxabcd")
+        stream.seek(2)
+
+        with patch("src.services.cloud.client.sleep"):
+            client.create_files([("file_0", b"0"), ("file_1", stream)])
+
+        assert client.files == {"file_0": b"0", "file_1": b"abcd"}
+
+    def test_can_write_file(self):
+        client = _InMemoryStorageClient()
+
+        with client.open_file_writer("file") as writer:
+            writer.write(b"ab")
+            writer.write(b"cd")
+
+        assert client.files == {"file": b"abcd"}
+
+    def test_can_cancel_file_writing_on_error(self):
+        client = _InMemoryStorageClient()
+
+        def _write():
+            with client.open_file_writer("file") as writer:
+                writer.write(b"ab")
+                raise ValueError("write error")
+
+        with pytest.raises(ValueError, match="write error"):
+            _write()
+
+        assert client.files == {}
+
+
+class S3MultipartUploadWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Mock()
+        self.client.create_multipart_upload.return_value = {"UploadId": "upload"}
+        self.client.upload_part.side_effect = lambda **kwargs: {"ETag": str(kwargs["PartNumber"])}
+
+    def _make_writer(self):
+        return _S3MultipartUploadWriter(self.client, bucket="bucket", key="file", part_size=4)
+
+    def test_can_upload_small_file_in_single_request(self):
+        with self._make_writer() as writer:
+            writer.write(b"abc")
+
+        self.client.put_object.assert_called_once_with(Body=b"abc", Bucket="bucket", Key="file")
+        self.client.create_multipart_upload.assert_not_called()
+
+    def test_can_upload_file_in_parts(self):
+        with self._make_writer() as writer:
+            writer.write(b"abcdef")
+            writer.write(b"ghi")
+
+        assert [c.kwargs["Body"] for c in self.client.upload_part.call_args_list] == [
+            b"abcd",
+            b"efgh",
+            b"i",
+        ]
+        self.client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="file",
+            UploadId="upload",
+            MultipartUpload={
+                "Parts": [{"ETag": str(i), "PartNumber": i} for i in range(1, 4)],
+            },
+        )
+        self.client.put_object.assert_not_called()
+
+    def test_can_abort_upload_on_error(self):
+        def _write():
+            with self._make_writer() as writer:
+                writer.write(b"abcdef")
+                raise ValueError("write error")
+
+        with pytest.raises(ValueError, match="write error"):
+            _write()
+
+        self.client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="file", UploadId="upload"
+        )
+        self.client.complete_multipart_upload.assert_not_called()
+
+
+class GcsResumableUploadWriterTest(unittest.TestCase):
+    CHUNK_SIZE = 256 * 1024  # the minimal allowed chunk size
+
+    def setUp(self):
+        self.upload = Mock(resumable_url="https://storage.googleapis.com/upload/session")
+        self.transport = Mock()
+
+        self.blob = Mock()
+        self.blob._initiate_resumable_upload.return_value = (self.upload, self.transport)
+
+    def _make_writer(self):
+        return _GcsResumableUploadWriter(
+            BlobWriter(self.blob, chunk_size=self.CHUNK_SIZE, ignore_flush=True)
+        )
+
+    def test_can_upload_file_in_chunks(self):
+        with self._make_writer() as writer:
+            writer.write(b"a" * (self.CHUNK_SIZE + 1))
+
+        # a full chunk and the final chunk
+        assert self.upload.transmit_next_chunk.call_count == 2
+        self.transport.delete.assert_not_called()
+
+    def test_can_cancel_upload_on_error(self):
+        def _write():
+            with self._make_writer() as writer:
+                writer.write(b"a" * (self.CHUNK_SIZE + 1))
+                raise ValueError("write error")
+
+        with pytest.raises(ValueError, match="write error"):
+            _write()
+
+        # the final chunk is not sent, so the file is not created
+        assert self.upload.transmit_next_chunk.call_count == 1
+        self.transport.delete.assert_called_once_with(self.upload.resumable_url)
+
+    def test_can_cancel_upload_on_error_before_first_chunk(self):
+        def _write():
+            with self._make_writer() as writer:
+                writer.write(b"abc")
+                raise ValueError("write error")
+
+        with pytest.raises(ValueError, match="write error"):
+            _write()
+
+        self.blob._initiate_resumable_upload.assert_not_called()
+        self.upload.transmit_next_chunk.assert_not_called()
+
+
+class S3ConditionalDownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.client = S3Client(bucket="bucket")
+        self.stubber = Stubber(self.client.client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+
+    def test_can_download_file_without_etag(self):
+        self.stubber.add_response(
+            "get_object",
+            {"Body": BytesIO(b"abc"), "ContentLength": 3, "ETag": '"v1"'},
+            expected_params={"Bucket": "bucket", "Key": "file"},
+        )
+
+        data, etag = self.client.download_file_buffer_if_changed("file", etag=None)
+
+        assert data == b"abc"
+        assert etag == '"v1"'
+        self.stubber.assert_no_pending_responses()
+
+    def test_can_download_changed_file(self):
+        self.stubber.add_response(
+            "get_object",
+            {"Body": BytesIO(b"abc"), "ContentLength": 3, "ETag": '"v2"'},
+            expected_params={"Bucket": "bucket", "Key": "file", "IfNoneMatch": '"v1"'},
+        )
+
+        data, etag = self.client.download_file_buffer_if_changed("file", etag='"v1"')
+
+        assert data == b"abc"
+        assert etag == '"v2"'
+
+    def test_can_skip_downloading_unchanged_file(self):
+        self.stubber.add_client_error(
+            "get_object",
+            service_error_code="304",
+            http_status_code=304,
+            expected_params={"Bucket": "bucket", "Key": "file", "IfNoneMatch": '"v1"'},
+        )
+
+        data, etag = self.client.download_file_buffer_if_changed("file", etag='"v1"')
+
+        assert data is None
+        assert etag == '"v1"'
+        self.stubber.assert_no_pending_responses()
+
+
+class GcsConditionalDownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.client = GcsClient(bucket="bucket")
+        self.client.client = Mock()
+
+        self.blob = Mock(etag="v1", size=3)
+        self.client.client.bucket.return_value.get_blob.return_value = self.blob
+        self.client.client.download_blob_to_file.side_effect = lambda _, writer: writer.write(
+            b"abc"
+        )
+
+    def test_can_download_changed_file(self):
+        data, etag = self.client.download_file_buffer_if_changed("file", etag="v0")
+
+        assert data == b"abc"
+        assert etag == "v1"
+
+    def test_can_skip_downloading_unchanged_file(self):
+        data, etag = self.client.download_file_buffer_if_changed("file", etag="v1")
+
+        assert data is None
+        assert etag == "v1"
+        self.client.client.download_blob_to_file.assert_not_called()
+
+
+class ReadIntoBufferTest(unittest.TestCase):
+    def test_can_read_stream_with_known_size(self):
+        data = bytes(range(256)) * 10
+
+        buffer = read_into_buffer(BytesIO(data), size=len(data), chunk_size=100)
+
+        assert isinstance(buffer, memoryview)
+        assert buffer == data
+
+    def test_can_read_stream_with_unknown_size(self):
+        data = bytes(range(256)) * 10
+
+        assert read_into_buffer(BytesIO(data), chunk_size=100) == data
+
+    def test_can_read_stream_with_wrong_size(self):
+        data = bytes(range(256)) * 10
+
+        assert read_into_buffer(BytesIO(data), size=len(data) + 10, chunk_size=100) == data
+        assert read_into_buffer(BytesIO(data), size=len(data) - 10, chunk_size=100) == data
@@ -0,0 +1,24 @@
+from functools import partial
+from unittest.mock import MagicMock, Mock
+
+from src.services.cloud.client import StorageClient
+
+
+def make_storage_client_mock() -> MagicMock:
+    """
+    Returns a storage client mock, in which the bulk and streaming uploads use
+    the common StorageClient implementation. This way, all the uploads go through create_file().
+    """
+
+    client = MagicMock()
+    for method_name in (
+        "create_files",
+        "create_file_from_stream",
+        "open_file_writer",
+        "_make_file_creator",
+    ):
+        setattr(
+            client, method_name, Mock(wraps=partial(getattr(StorageClient, method_name), client))
+        )
+
+    return client
@@ -98,6 +98,9 @@ class CronConfig:
         getenv("PROCESS_REPUTATION_ORACLE_WEBHOOKS_CHUNK_SIZE", 5)
     )
 
+    log_cvat_api_client_stats_int = int(getenv("LOG_CVAT_API_CLIENT_STATS_INT", 300))
+    "The interval for logging the CVAT API connection reuse counters, in seconds"
+
 
 class IStorageConfig:
     provider: ClassVar[str]
@@ -235,6 +238,9 @@ class CvatConfig:
     quality_retrieval_timeout = int(getenv("CVAT_QUALITY_RETRIEVAL_TIMEOUT", 60 * 60))
     quality_check_interval = int(getenv("CVAT_QUALITY_CHECK_INTERVAL", 5))
 
+    api_pool_size = int(getenv("CVAT_API_POOL_SIZE", 10))
+    "Max idle connections to the CVAT server kept open for reuse by the process"
+
 
 class Config:
     port = int(getenv("PORT", 8000))
@@ -242,6 +248,8 @@ class Config:
     workers_amount = int(getenv("WORKERS_AMOUNT", 1))
     webhook_max_retries = int(getenv("WEBHOOK_MAX_RETRIES", 5))
     webhook_delay_if_failed = int(getenv("WEBHOOK_DELAY_IF_FAILED", 60))
+    webhook_delivery_concurrency = int(getenv("WEBHOOK_DELIVERY_CONCURRENCY", 10))
+    "The maximum number of outgoing webhooks sent at the same time"
     loglevel = parse_log_level(getenv("LOGLEVEL", "info"))
 
     polygon_mainnet = PolygonMainnetConfig
@@ -5,8 +5,17 @@ from tempfile import TemporaryDirectory
 
 import attrs
 import datumaro as dm
+import numpy as np
 from attrs import frozen
-from datumaro.util import dump_json, parse_json
+from datumaro.util import parse_json
+
+from src.utils.coco import try_dump_coco_instances, try_parse_coco_instances
+from src.utils.record_table import (
+    RecordTable,
+    dump_mapping,
+    is_columns_data,
+    load_mapping,
+)
 
 BboxPointMapping = dict[int, int]
 
@@ -28,39 +37,61 @@ class RoiInfo:
 
 RoiInfos = Sequence[RoiInfo]
 
+
+class RoiInfoTable(RecordTable[RoiInfo]):
+    "A columnar RoiInfo storage for big escrows"
+
+    record_type = RoiInfo
+    dtype = np.dtype([(field.name, np.int64) for field in attrs.fields(RoiInfo)])
+
+
 RoiFilenames = dict[int, str]
 
 
 class TaskMetaLayout:
     GT_FILENAME = "gt.json"
     POINTS_FILENAME = "points.json"
-    BBOX_POINT_MAPPING_FILENAME = "bbox_point_mapping.json"
-    ROI_INFO_FILENAME = "rois.json"
+    BBOX_POINT_MAPPING_FILENAME = "bbox_point_mapping.npz"
+    ROI_INFO_FILENAME = "rois.npz"
 
-    ROI_FILENAMES_FILENAME = "roi_filenames.json"
+    ROI_FILENAMES_FILENAME = "roi_filenames.npz"
     # this is separated from the general roi info to make name mangling more "optional"
 
+    # The previous JSON versions of the files above, for the escrows created before
+    LEGACY_BBOX_POINT_MAPPING_FILENAME = "bbox_point_mapping.json"
+    LEGACY_ROI_INFO_FILENAME = "rois.json"
+    LEGACY_ROI_FILENAMES_FILENAME = "roi_filenames.json"
+
 
 class TaskMetaSerializer:
     GT_DATASET_FORMAT = "coco_instances"
     POINTS_DATASET_FORMAT = "coco_person_keypoints"
 
     def serialize_gt_annotations(self, gt_dataset: dm.Dataset) -> bytes:
+        if (data := try_dump_coco_instances(gt_dataset)) is not None:
+            return data
+
         with TemporaryDirectory() as temp_dir:
             gt_dataset_dir = os.path.join(temp_dir, "gt_dataset")
             gt_dataset.export(gt_dataset_dir, self.GT_DATASET_FORMAT)
             return (Path(gt_dataset_dir) / "annotations" / "instances_default.json").read_bytes()
 
     def serialize_bbox_point_mapping(self, bbox_point_mapping: BboxPointMapping) -> bytes:
-        return dump_json({str(k): str(v) for k, v in bbox_point_mapping.items()})
+        return dump_mapping(bbox_point_mapping, key_dtype="int64", value_dtype="int64")
 
     def serialize_roi_info(self, rois_info: RoiInfos) -> bytes:
-        return dump_json([roi_info.asdict() for roi_info in rois_info])
+        if not isinstance(rois_info, RoiInfoTable):
+            rois_info = RoiInfoTable.from_records(rois_info)
+
+        return rois_info.dump()
 
     def serialize_roi_filenames(self, roi_filenames: RoiFilenames) -> bytes:
-        return dump_json({str(k): v for k, v in roi_filenames.items()})
+        return dump_mapping(roi_filenames, key_dtype="int64", value_dtype="str")
 
     def parse_gt_annotations(self, gt_dataset_data: bytes) -> dm.Dataset:
+        if (dataset := try_parse_coco_instances(gt_dataset_data)) is not None:
+            return dataset
+
         with TemporaryDirectory() as temp_dir:
             annotations_filename = os.path.join(temp_dir, "annotations.json")
             with open(annotations_filename, "wb") as f:
@@ -82,11 +113,21 @@ class TaskMetaSerializer:
             dataset.init_cache()
             return dataset
 
+    # The parse functions below also support the legacy JSON formats
     def parse_bbox_point_mapping(self, bbox_point_mapping_data: bytes) -> BboxPointMapping:
+        if is_columns_data(bbox_point_mapping_data):
+            return load_mapping(bbox_point_mapping_data)
+
         return {int(k): int(v) for k, v in parse_json(bbox_point_mapping_data).items()}
 
     def parse_roi_info(self, rois_info_data: bytes) -> RoiInfos:
+        if is_columns_data(rois_info_data):
+            return RoiInfoTable.load(rois_info_data)
+
         return [RoiInfo(**roi_info) for roi_info in parse_json(rois_info_data)]
 
     def parse_roi_filenames(self, roi_filenames_data: bytes) -> RoiFilenames:
+        if is_columns_data(roi_filenames_data):
+            return load_mapping(roi_filenames_data)
+
         return {int(k): v for k, v in parse_json(roi_filenames_data).items()}
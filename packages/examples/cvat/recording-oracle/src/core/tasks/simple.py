@@ -4,6 +4,8 @@ from tempfile import TemporaryDirectory
 
 import datumaro as dm
 
+from src.utils.coco import try_dump_coco_instances, try_parse_coco_instances
+
 # These details are relevant for image_boxes and image_polygons tasks
 
 
@@ -15,12 +17,18 @@ class TaskMetaSerializer:
     GT_DATASET_FORMAT = "coco_instances"
 
     def serialize_gt_annotations(self, gt_dataset: dm.Dataset) -> bytes:
+        if (data := try_dump_coco_instances(gt_dataset)) is not None:
+            return data
+
         with TemporaryDirectory() as temp_dir:
             gt_dataset_dir = os.path.join(temp_dir, "gt_dataset")
             gt_dataset.export(gt_dataset_dir, self.GT_DATASET_FORMAT)
             return (Path(gt_dataset_dir) / "annotations" / "instances_default.json").read_bytes()
 
     def parse_gt_annotations(self, gt_dataset_data: bytes) -> dm.Dataset:
+        if (dataset := try_parse_coco_instances(gt_dataset_data)) is not None:
+            return dataset
+
         with TemporaryDirectory() as temp_dir:
             annotations_filename = os.path.join(temp_dir, "annotations.json")
             with open(annotations_filename, "wb") as f:
@@ -2,6 +2,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from fastapi import FastAPI
 
 from src.core.config import Config
+from src.crons.cvat_api_client_stats import log_cvat_api_client_stats
 from src.crons.process_exchange_oracle_webhooks import (
     process_incoming_exchange_oracle_webhook_escrow_recorded,
     process_incoming_exchange_oracle_webhooks,
@@ -34,4 +35,9 @@ def setup_cron_jobs(app: FastAPI):
             "interval",
             seconds=Config.cron_config.process_reputation_oracle_webhooks_int,
         )
+        scheduler.add_job(
+            log_cvat_api_client_stats,
+            "interval",
+            seconds=Config.cron_config.log_cvat_api_client_stats_int,
+        )
         scheduler.start()
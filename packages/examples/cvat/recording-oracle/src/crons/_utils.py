@@ -4,7 +4,6 @@ from collections.abc import Callable
 from contextlib import contextmanager, nullcontext
 from functools import wraps
 
-import httpx
 from sqlalchemy.orm import Session
 
 import src.services.webhook as oracle_db_service
@@ -13,7 +12,7 @@ from src.core.types import OracleWebhookTypes
 from src.db import SessionLocal
 from src.db.utils import ForUpdateParams
 from src.models.webhook import Webhook
-from src.utils.webhooks import prepare_outgoing_webhook_body, prepare_signed_message
+from src.utils.webhook_delivery import deliver_webhooks
 
 
 def cron_job(logger_name: str) -> Callable[[Callable[..., None]], Callable[[], None]]:
@@ -68,6 +67,15 @@ def cron_job(logger_name: str) -> Callable[[Callable[..., None]], Callable[[], N
     return decorator
 
 
+def _log_webhook_attempt(logger: logging.Logger, webhook: Webhook) -> None:
+    logger.debug(
+        "Processing webhook "
+        f"{webhook.type}.{webhook.event_type}~{webhook.signature} "
+        f"in escrow_address={webhook.escrow_address} "
+        f"(attempt {webhook.attempts + 1})"
+    )
+
+
 @contextmanager
 def handle_webhook(
     logger: logging.Logger,
@@ -77,12 +85,7 @@ def handle_webhook(
     queue: webhook_service.OracleWebhookQueue,
 ):
     savepoint = session.begin_nested()
-    logger.debug(
-        "Processing webhook "
-        f"{webhook.type}.{webhook.event_type}~{webhook.signature} "
-        f"in escrow_address={webhook.escrow_address} "
-        f"(attempt {webhook.attempts + 1})"
-    )
+    _log_webhook_attempt(logger, webhook)
     try:
         yield
     except Exception as e:
@@ -95,25 +98,6 @@ def handle_webhook(
         logger.debug("Webhook handled successfully")
 
 
-def send_webhook(url: str, webhook: Webhook, *, with_timestamp: bool = True) -> None:
-    body = prepare_outgoing_webhook_body(
-        webhook.escrow_address,
-        webhook.chain_id,
-        webhook.event_type,
-        webhook.event_data,
-        timestamp=webhook.created_at if with_timestamp else None,
-    )
-    _, signature = prepare_signed_message(
-        webhook.escrow_address,
-        webhook.chain_id,
-        body=body,
-    )
-    headers = {"human-signature": signature}
-    with httpx.Client() as client:
-        response = client.post(url, headers=headers, json=body)
-        response.raise_for_status()
-
-
 def process_outgoing_webhooks(
     logger: logging.Logger,
     session: Session,
@@ -130,6 +114,21 @@ def process_outgoing_webhooks(
         for_update=ForUpdateParams(skip_locked=True),
     )
     for webhook in webhooks:
-        with handle_webhook(logger, session, webhook, queue=oracle_db_service.outbox):
-            webhook_url = url_getter(webhook.chain_id, webhook.escrow_address)
-            send_webhook(webhook_url, webhook, with_timestamp=with_timestamp)
+        _log_webhook_attempt(logger, webhook)
+
+    results = deliver_webhooks(webhooks, url_getter, with_timestamp=with_timestamp)
+
+    for result in results:
+        if result.is_successful:
+            logger.debug(f"Webhook {result.webhook.id} handled successfully")
+        else:
+            logger.error(
+                f"Webhook {result.webhook.id} sending failed: {result.error}",
+                exc_info=result.error,
+            )
+
+    oracle_db_service.outbox.handle_webhook_results(
+        session,
+        succeeded_ids=[result.webhook.id for result in results if result.is_successful],
+        failed_ids=[result.webhook.id for result in results if not result.is_successful],
+    )
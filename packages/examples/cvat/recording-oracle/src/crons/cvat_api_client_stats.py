@@ -0,0 +1,20 @@
+import logging
+
+from src.crons._utils import cron_job
+from src.cvat import client_pool
+from src.log import ROOT_LOGGER_NAME
+
+module_logger_name = f"{ROOT_LOGGER_NAME}.cron.cvat"
+
+
+@cron_job(module_logger_name)
+def log_cvat_api_client_stats(logger: logging.Logger) -> None:
+    "Logs the CVAT API connection reuse counters of the current process"
+
+    stats = client_pool.get_pool().get_stats()
+    logger.info(
+        "CVAT API client stats: "
+        f"requests={stats.requests} "
+        f"connections={stats.connections} "
+        f"reused_connections={stats.reused_connections}"
+    )
@@ -1,29 +1,18 @@
 import json
 import logging
-from datetime import timedelta
 from http import HTTPStatus
-from time import sleep
 from typing import cast
 
-from cvat_sdk.api_client import ApiClient, Configuration, exceptions, models
+from cvat_sdk.api_client import ApiClient, exceptions, models
 from cvat_sdk.core.helpers import get_paginated_collection
 
 from src.core.config import Config
+from src.cvat import client_pool, request_waiter
 from src.cvat.interface import QualityReportData
-from src.utils.time import utcnow
 
 
 def get_api_client() -> ApiClient:
-    configuration = Configuration(
-        host=Config.cvat_config.host_url,
-        username=Config.cvat_config.admin_login,
-        password=Config.cvat_config.admin_pass,
-    )
-
-    api_client = ApiClient(configuration=configuration)
-    api_client.set_default_header("X-organization", Config.cvat_config.org_slug)
-
-    return api_client
+    return client_pool.get_pool().get_api_client()
 
 
 def get_last_task_quality_report(task_id: int) -> models.QualityReport | None:
@@ -45,7 +34,6 @@ def compute_task_quality_report(
     check_interval: float = Config.cvat_config.quality_check_interval,
 ) -> models.QualityReport:
     logger = logging.getLogger("app")
-    start_time = utcnow()
 
     with get_api_client() as api_client:
         _, response = api_client.quality_api.create_report(
@@ -57,24 +45,31 @@ def compute_task_quality_report(
             f"when creating a task({task_id}) quality report"
         )
 
-        while utcnow() - start_time < timedelta(seconds=timeout):
+        def _check_report() -> models.QualityReport | None:
             _, response = api_client.quality_api.create_report(
                 rq_id=rq_id, _check_status=False, _parse_response=False
             )
             match response.status:
                 case HTTPStatus.CREATED:
-                    report = models.QualityReport._from_openapi_data(**json.loads(response.data))
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug(f"Created quality report: {report.id}")
-
-                    return report
+                    return models.QualityReport._from_openapi_data(**json.loads(response.data))
                 case HTTPStatus.ACCEPTED:
-                    sleep(check_interval)
-                    continue
+                    return None
                 case _:
                     raise Exception(f"Unexpected response status: {response.status}")
 
-        raise Exception(f"Task({task_id}) quality report has not been created in time")
+        try:
+            report = (
+                request_waiter.get_waiter()
+                .wait_for(_check_report, timeout=timeout, max_interval=check_interval)
+                .result()
+            )
+        except TimeoutError as ex:
+            raise Exception(f"Task({task_id}) quality report has not been created in time") from ex
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Created quality report: {report.id}")
+
+        return report
 
 
 def get_task(task_id: int) -> models.TaskRead:
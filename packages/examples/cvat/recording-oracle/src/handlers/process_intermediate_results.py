@@ -33,6 +33,7 @@ from src.services.cloud import make_client as make_cloud_client
 from src.services.cloud.utils import BucketAccessInfo
 from src.utils import grouped
 from src.utils.annotations import ProjectLabels
+from src.utils.coco import COCO_INSTANCES_FORMAT, try_parse_coco_instances
 from src.utils.formatting import value_and_percent
 from src.utils.zip_archive import extract_zip_archive, write_dir_to_zip_archive
 
@@ -274,15 +275,19 @@ class _TaskAnnotationMerger(_TaskHandler):
         self._input_gt_dataset: dm.Dataset | None = None
 
     def _parse_gt_dataset(self, gt_file_data: bytes) -> dm.Dataset:
+        gt_format = DM_GT_DATASET_FORMAT_MAPPING[self.manifest.annotation.type]
+
+        if gt_format == COCO_INSTANCES_FORMAT:
+            gt_dataset = try_parse_coco_instances(gt_file_data)
+            if gt_dataset is not None:
+                return gt_dataset
+
         with TemporaryDirectory() as gt_temp_dir:
             gt_filename = os.path.join(gt_temp_dir, "gt_annotations.json")
             with open(gt_filename, "wb") as f:
                 f.write(gt_file_data)
 
-            gt_dataset = dm.Dataset.import_from(
-                gt_filename,
-                format=DM_GT_DATASET_FORMAT_MAPPING[self.manifest.annotation.type],
-            )
+            gt_dataset = dm.Dataset.import_from(gt_filename, format=gt_format)
 
             gt_dataset.init_cache()
 
@@ -148,6 +148,45 @@ class OracleWebhookQueue:
         )
         session.execute(upd)
 
+    def handle_webhook_results(
+        self,
+        session: Session,
+        *,
+        succeeded_ids: Sequence[str] = (),
+        failed_ids: Sequence[str] = (),
+    ) -> None:
+        """
+        Updates the webhooks after a sending attempt, as handle_webhook_success()
+        and handle_webhook_fail() do, in a single statement.
+        """
+        if not succeeded_ids and not failed_ids:
+            return
+
+        is_failed = Webhook.id.in_(failed_ids)
+        upd = (
+            update(Webhook)
+            .where(Webhook.id.in_([*succeeded_ids, *failed_ids]))
+            .values(
+                attempts=Webhook.attempts + 1,
+                status=case(
+                    (~is_failed, OracleWebhookStatuses.completed.value),
+                    (
+                        Webhook.attempts + 1 >= Config.webhook_max_retries,
+                        OracleWebhookStatuses.failed.value,
+                    ),
+                    else_=OracleWebhookStatuses.pending.value,
+                ),
+                wait_until=case(
+                    (
+                        is_failed,
+                        utcnow() + datetime.timedelta(seconds=Config.webhook_delay_if_failed),
+                    ),
+                    else_=Webhook.wait_until,
+                ),
+            )
+        )
+        session.execute(upd)
+
 
 inbox = OracleWebhookQueue(direction=OracleWebhookDirectionTags.incoming)
 outbox = OracleWebhookQueue(
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar, overload
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+    from typing_extensions import Self
+
+R = TypeVar("R")
+
+COLUMNS_FORMAT_VERSION = 1
+_COLUMNS_FORMAT_VERSION_KEY = "__format_version__"
+_NPZ_SIGNATURE = b"PK\x03\x04"
+
+
+def is_columns_data(data: bytes) -> bool:
+    "Checks if the data is produced by dump_columns()"
+    return data.startswith(_NPZ_SIGNATURE)
+
+
+def dump_columns(columns: Mapping[str, ArrayLike]) -> bytes:
+    """
+    Serializes named 1d arrays into a compressed binary (.npz) file with a format version.
+    Only numeric and bytes arrays are supported, to allow loading without pickle.
+    """
+
+    assert _COLUMNS_FORMAT_VERSION_KEY not in columns
+
+    with io.BytesIO() as buffer:
+        np.savez_compressed(
+            buffer,
+            **{_COLUMNS_FORMAT_VERSION_KEY: np.array(COLUMNS_FORMAT_VERSION)},
+            **columns,
+        )
+        return buffer.getvalue()
+
+
+def load_columns(data: bytes) -> dict[str, np.ndarray]:
+    with np.load(io.BytesIO(data), allow_pickle=False) as npz_file:
+        columns = {name: npz_file[name] for name in npz_file.files}
+
+    version = int(columns.pop(_COLUMNS_FORMAT_VERSION_KEY, -1))
+    if version != COLUMNS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported columns format version {version}")
+
+    return columns
+
+
+def dump_mapping(mapping: Mapping, *, key_dtype: str, value_dtype: str) -> bytes:
+    "Serializes a flat dict with dump_columns(). str values are stored as utf-8 bytes"
+    return dump_columns(
+        {
+            "keys": _encode_column(mapping.keys(), key_dtype),
+            "values": _encode_column(mapping.values(), value_dtype),
+        }
+    )
+
+
+def load_mapping(data: bytes) -> dict:
+    columns = load_columns(data)
+    return dict(
+        zip(_decode_column(columns["keys"]), _decode_column(columns["values"]), strict=True)
+    )
+
+
+def _encode_column(values: Iterable, dtype: str) -> np.ndarray:
+    if dtype == "str":
+        return np.array([v.encode() for v in values], dtype=bytes)
+
+    return np.fromiter(values, dtype=dtype)
+
+
+def _decode_column(column: np.ndarray) -> list:
+    if column.dtype.kind == "S":
+        return [v.decode() for v in column.tolist()]
+
+    return column.tolist()
+
+
+class RecordTable(Sequence[R], Generic[R]):
+    """
+    A columnar storage for attrs records. The records are kept in a NumPy structured array,
+    the record objects are only created on access.
+
+    Subclasses must define the record type and the array dtype with the same field names.
+    """
+
+    record_type: ClassVar[type]
+    dtype: ClassVar[np.dtype]
+
+    def __init__(self, data: np.ndarray | None = None) -> None:
+        if data is None:
+            data = np.empty(0, dtype=self.dtype)
+
+        assert data.dtype == self.dtype
+        assert data.ndim == 1
+        self.data = data
+
+    @classmethod
+    def from_columns(cls, **columns: ArrayLike) -> Self:
+        assert set(columns) == set(cls.dtype.names), "All the columns must be specified"
+
+        size = len(next(iter(columns.values()), ()))
+        data = np.empty(size, dtype=cls.dtype)
+        for name, values in columns.items():
+            data[name] = values
+
+        return cls(data)
+
+    @classmethod
+    def from_records(cls, records: Iterable[R]) -> Self:
+        return cls(
+            np.array(
+                [tuple(getattr(record, name) for name in cls.dtype.names) for record in records],
+                dtype=cls.dtype,
+            ).reshape(-1)
+        )
+
+    def dump(self) -> bytes:
+        return dump_columns({name: self.data[name] for name in self.dtype.names})
+
+    @classmethod
+    def load(cls, data: bytes) -> Self:
+        return cls.from_columns(**load_columns(data))
+
+    def column(self, name: str) -> np.ndarray:
+        return self.data[name]
+
+    def _make_record(self, values: tuple) -> R:
+        return self.record_type(**dict(zip(self.dtype.names, values, strict=True)))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @overload
+    def __getitem__(self, index: int) -> R: ...
+    @overload
+    def __getitem__(self, index: slice | np.ndarray) -> Self: ...
+    def __getitem__(self, index):
+        if isinstance(index, slice | np.ndarray):
+            return type(self)(self.data[index])
+
+        return self._make_record(self.data[index].tolist())
+
+    def __iter__(self) -> Iterator[R]:
+        for values in self.data.tolist():
+            yield self._make_record(values)
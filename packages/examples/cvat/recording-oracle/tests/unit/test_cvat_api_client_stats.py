@@ -0,0 +1,28 @@
+import unittest
+from unittest.mock import patch
+
+from src.crons.cvat_api_client_stats import log_cvat_api_client_stats
+from src.cvat.client_pool import ApiClientPool
+
+
+class CvatApiClientStatsTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = ApiClientPool()
+
+    def tearDown(self):
+        self.pool.reset()
+
+    def test_can_log_connection_reuse_stats(self):
+        connection_pool = self.pool.get_api_client().rest_client.pool_manager.connection_from_url(
+            "http://localhost:8080"
+        )
+        connection_pool.num_requests = 5
+        connection_pool.num_connections = 2
+
+        with (
+            patch("src.cvat.client_pool.get_pool", return_value=self.pool),
+            self.assertLogs("app", level="INFO") as logs,
+        ):
+            log_cvat_api_client_stats()
+
+        assert "requests=5 connections=2 reused_connections=3" in logs.output[0]
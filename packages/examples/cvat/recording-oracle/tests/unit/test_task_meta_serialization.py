@@ -0,0 +1,94 @@
+import unittest
+
+from datumaro.util import dump_json
+
+from src.core.tasks import boxes_from_points, skeletons_from_boxes
+
+
+class BoxesFromPointsTaskMetaSerializerTest(unittest.TestCase):
+    def setUp(self):
+        self.serializer = boxes_from_points.TaskMetaSerializer()
+        self.rois = [
+            boxes_from_points.RoiInfo(
+                point_id=i,
+                original_image_key=i // 2,
+                point_x=5,
+                point_y=6,
+                roi_x=i,
+                roi_y=2 * i,
+                roi_w=100,
+                roi_h=200,
+            )
+            for i in range(5)
+        ]
+
+    def test_can_serialize_roi_info(self):
+        data = self.serializer.serialize_roi_info(self.rois)
+
+        assert list(self.serializer.parse_roi_info(data)) == self.rois
+
+    def test_can_parse_legacy_roi_info(self):
+        data = dump_json([roi.asdict() for roi in self.rois])
+
+        assert list(self.serializer.parse_roi_info(data)) == self.rois
+
+    def test_can_serialize_bbox_point_mapping(self):
+        mapping = {1: 10, 2: 20}
+
+        data = self.serializer.serialize_bbox_point_mapping(mapping)
+
+        assert self.serializer.parse_bbox_point_mapping(data) == mapping
+        assert self.serializer.parse_bbox_point_mapping(dump_json({"1": "10"})) == {1: 10}
+
+
+class SkeletonsFromBoxesTaskMetaSerializerTest(unittest.TestCase):
+    def setUp(self):
+        self.serializer = skeletons_from_boxes.TaskMetaSerializer()
+        self.rois = [
+            skeletons_from_boxes.RoiInfo(
+                original_image_key=1,
+                bbox_id=i,
+                bbox_label=2,
+                bbox_x=1.5,
+                bbox_y=2,
+                roi_x=-3,
+                roi_y=4,
+                roi_w=10,
+                roi_h=20,
+            )
+            for i in range(3)
+        ]
+
+    def test_can_serialize_roi_info(self):
+        data = self.serializer.serialize_roi_info(self.rois)
+
+        assert list(self.serializer.parse_roi_info(data)) == self.rois
+
+    def test_can_serialize_roi_info_table(self):
+        table = skeletons_from_boxes.RoiInfoTable.from_records(self.rois)
+
+        data = self.serializer.serialize_roi_info(table)
+
+        parsed_rois = list(self.serializer.parse_roi_info(data))
+        assert parsed_rois == self.rois
+        assert type(parsed_rois[0].bbox_x) is float
+        assert type(parsed_rois[0].bbox_id) is int
+
+    def test_can_parse_legacy_roi_info(self):
+        data = dump_json([roi.asdict() for roi in self.rois])
+
+        assert list(self.serializer.parse_roi_info(data)) == self.rois
+
+    def test_can_serialize_roi_filenames(self):
+        roi_filenames = {roi.bbox_id: f"{roi.bbox_id}-file.jpg" for roi in self.rois}
+
+        data = self.serializer.serialize_roi_filenames(roi_filenames)
+
+        assert self.serializer.parse_roi_filenames(data) == roi_filenames
+
+    def test_can_serialize_skeleton_bbox_mapping(self):
+        mapping = {1: 10, 2: 20}
+
+        data = self.serializer.serialize_skeleton_bbox_mapping(mapping)
+
+        assert self.serializer.parse_skeleton_bbox_mapping(data) == mapping